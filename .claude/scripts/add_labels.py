@@ -1,15 +1,65 @@
 #!/usr/bin/env python3
 """Add labels to existing GitHub issues based on title and content."""
 
-import subprocess
-import json
-
-
-def get_all_issues():
-    """Get all open issues."""
-    cmd = ["gh", "issue", "list", "--json", "number,title,body", "--limit", "1000"]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+import gh_api
+
+
+MAX_WORKERS = 10
+
+
+def _keyword_pattern(*words):
+    """Compile a pattern matching any of the (lowercase) keywords."""
+    return re.compile("|".join(re.escape(word) for word in words))
+
+
+PRIORITY_RE = re.compile(r"^\[(P[0-4])\]")
+PRIORITY_LABELS = {
+    "P0": "P0-critical",
+    "P1": "P1-high",
+    "P2": "P2-medium",
+    "P3": "P3-low",
+    "P4": "P4-reach",
+}
+
+# Keywords are matched as substrings of the lowercased title and body,
+# so "test" also catches "Testing"
+THEME_PATTERNS = {
+    "strategy": _keyword_pattern(
+        "strategy",
+        "momentum",
+        "trading",
+        "pairs",
+        "arbitrage",
+        "breakout",
+        "ensemble",
+    ),
+    "testing": _keyword_pattern("test", "validation", "stress"),
+    "risk-management": _keyword_pattern(
+        "risk", "stop-loss", "circuit breaker", "position sizing"
+    ),
+    "monitoring": _keyword_pattern("monitor", "dashboard", "alert", "logging"),
+    "infrastructure": _keyword_pattern(
+        "alpacatrader",
+        "livetrading",
+        "config",
+        "database",
+        "shutdown",
+        "infrastructure",
+    ),
+    "analytics": _keyword_pattern(
+        "analytics", "performance attribution", "trade analytics", "metrics"
+    ),
+    "code-quality": _keyword_pattern(
+        "type hints", "refactor", "code quality", "coverage"
+    ),
+    "documentation": _keyword_pattern("documentation", "docstring"),
+}
 
 
 def determine_labels(issue):
@@ -19,122 +69,80 @@ def determine_labels(issue):
     labels = []
 
     # Priority labels
-    if title.startswith("[P0]"):
-        labels.append("P0-critical")
-    elif title.startswith("[P1]"):
-        labels.append("P1-high")
-    elif title.startswith("[P2]"):
-        labels.append("P2-medium")
-    elif title.startswith("[P3]"):
-        labels.append("P3-low")
-    elif title.startswith("[P4]"):
-        labels.append("P4-reach")
+    priority_match = PRIORITY_RE.match(title)
+    if priority_match:
+        labels.append(PRIORITY_LABELS[priority_match.group(1)])
 
     # Theme labels based on keywords
-    title_lower = title.lower()
-    body_lower = body.lower()
-
-    if any(
-        word in title_lower
-        for word in [
-            "strategy",
-            "momentum",
-            "trading",
-            "pairs",
-            "arbitrage",
-            "breakout",
-            "ensemble",
-        ]
-    ):
-        labels.append("strategy")
-
-    if any(word in title_lower for word in ["test", "validation", "stress"]):
-        labels.append("testing")
-
-    if any(
-        word in title_lower
-        for word in ["risk", "stop-loss", "circuit breaker", "position sizing"]
-    ):
-        labels.append("risk-management")
-
-    if any(
-        word in title_lower for word in ["monitor", "dashboard", "alert", "logging"]
-    ):
-        labels.append("monitoring")
-
-    if any(
-        word in title_lower
-        for word in [
-            "alpacatrader",
-            "livetrading",
-            "config",
-            "database",
-            "shutdown",
-            "infrastructure",
-        ]
-    ):
-        labels.append("infrastructure")
-
-    if any(
-        word in title_lower
-        for word in [
-            "analytics",
-            "performance attribution",
-            "trade analytics",
-            "metrics",
-        ]
-    ):
-        labels.append("analytics")
-
-    if any(
-        word in title_lower
-        for word in ["type hints", "refactor", "code quality", "coverage"]
-    ):
-        labels.append("code-quality")
-
-    if any(word in title_lower for word in ["documentation", "docstring"]):
-        labels.append("documentation")
+    haystack = (title + " " + body).lower()
+    labels.extend(
+        name for name, pattern in THEME_PATTERNS.items() if pattern.search(haystack)
+    )
 
     return labels
 
 
+def get_missing_labels(issue, labels):
+    """Return the labels not already present on an issue, in order."""
+    existing = {label["name"] for label in issue.get("labels", [])}
+    return [label for label in labels if label not in existing]
+
+
 def add_labels_to_issue(issue_number, labels):
     """Add labels to a GitHub issue."""
     if not labels:
         return True
 
-    cmd = ["gh", "issue", "edit", str(issue_number), "--add-label", ",".join(labels)]
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        gh_api.add_labels(issue_number, labels)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error adding labels to issue #{issue_number}: {e.stderr}")
+    except requests.HTTPError as e:
+        print(f"Error adding labels to issue #{issue_number}: {e.response.text}")
         return False
 
 
 def main():
-    print("Fetching all issues...")
-    issues = get_all_issues()
-    print(f"Found {len(issues)} issues\n")
-
-    print("Adding labels to issues...")
+    parser = argparse.ArgumentParser(description="Add labels to existing GitHub issues")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch issues from GitHub instead of the short-lived local cache",
+    )
+    parser.add_argument(
+        "--repo",
+        default=gh_api.REPO,
+        help="GitHub repository as OWNER/NAME (default: $ALPACA_REPO or %(default)s)",
+    )
+    args = parser.parse_args()
+    gh_api.set_repo(args.repo)
+
+    print("Fetching issues and adding labels...")
     success_count = 0
+    issue_count = 0
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        # Label each page of issues while the next one is being fetched
+        for issue in gh_api.iter_issues(state="open", use_cache=not args.no_cache):
+            issue_count += 1
+            labels = get_missing_labels(issue, determine_labels(issue))
+            if labels:
+                future = executor.submit(add_labels_to_issue, issue["number"], labels)
+                futures[future] = (issue, labels)
+            else:
+                print(f"○ #{issue['number']}: {issue['title'][:50]}... → No new labels")
 
-    for issue in issues:
-        number = issue["number"]
-        title = issue["title"]
-        labels = determine_labels(issue)
-
-        if labels:
-            if add_labels_to_issue(number, labels):
+        for future in as_completed(futures):
+            issue, labels = futures[future]
+            number = issue["number"]
+            title = issue["title"]
+            if future.result():
                 print(f"✓ #{number}: {title[:50]}... → {', '.join(labels)}")
                 success_count += 1
             else:
                 print(f"✗ #{number}: {title[:50]}... → Failed")
-        else:
-            print(f"○ #{number}: {title[:50]}... → No labels")
 
-    print(f"\n✓ Added labels to {success_count}/{len(issues)} issues")
+    print(f"\n✓ Added labels to {success_count}/{issue_count} issues")
 
 
 if __name__ == "__main__":
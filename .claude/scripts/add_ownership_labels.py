@@ -1,113 +1,159 @@
 #!/usr/bin/env python3
 """Add ownership labels to GitHub issues based on TODO.md."""
 
-import re
-import subprocess
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; matching falls back to a linear scan
+    ahocorasick = None
+
+import gh_api
+import todo_walker
+from add_labels import add_labels_to_issue, determine_labels, get_missing_labels
+
+
+MAX_WORKERS = 10
+OWNERSHIP_BY_EMOJI = {
+    "🤖": "better-for-ai",
+    "👤": "better-for-human",
+    "🤝": "collaborative",
+}
 
 
 def parse_todo_with_ownership(filepath):
     """Parse TODO.md and extract task titles with ownership indicators."""
-    with open(filepath, "r") as f:
-        content = f.read()
-
     task_ownership = {}
-    lines = content.split("\n")
-
-    for line in lines:
-        # Match task items with emoji and title
-        task_match = re.match(r"^- \[ \] ([👤🤖🤝]) \*\*(.+?)\*\*", line)
-        if task_match:
-            emoji = task_match.group(1)
-            title = task_match.group(2)
-
-            # Map emoji to ownership label
-            if emoji == "🤖":
-                ownership = "better-for-ai"
-            elif emoji == "👤":
-                ownership = "better-for-human"
-            elif emoji == "🤝":
-                ownership = "collaborative"
-            else:
-                ownership = None
 
+    for _, task in todo_walker.walk(filepath):
+        # Only open tasks carry an ownership indicator worth labeling
+        if task and not task["checked"]:
+            ownership = OWNERSHIP_BY_EMOJI.get(task["emoji"])
             if ownership:
-                task_ownership[title] = ownership
+                task_ownership[task["title"]] = ownership
 
     return task_ownership
 
 
-def get_all_issues():
+def build_task_index(task_ownership):
+    """Key task ownership by normalized (lowercase, stripped) task title."""
+    return {
+        task_title.lower().strip(): ownership
+        for task_title, ownership in task_ownership.items()
+    }
+
+
+def build_task_automaton(task_index):
+    """Build an Aho-Corasick automaton over normalized task titles.
+
+    Returns None when pyahocorasick is not installed or there are no tasks.
+    """
+    if ahocorasick is None or not task_index:
+        return None
+    automaton = ahocorasick.Automaton()
+    for task_title, ownership in task_index.items():
+        automaton.add_word(task_title, ownership)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_ownership(title, task_index, automaton=None):
+    """Find the ownership label of the TODO task matching an issue title."""
+    normalized = title.lower().strip()
+
+    # Fast path: exact (normalized) title match
+    ownership = task_index.get(normalized)
+    if ownership:
+        return ownership
+
+    if automaton is not None:
+        # Any task title contained in the issue title, in one pass
+        for _, ownership in automaton.iter(normalized):
+            return ownership
+        # Issue title contained in a task title
+        for task_title, ownership in task_index.items():
+            if normalized in task_title:
+                return ownership
+        return None
+
+    # Fall back to substring matching in either direction
+    for task_title, ownership in task_index.items():
+        if task_title in normalized or normalized in task_title:
+            return ownership
+    return None
+
+
+def get_all_issues(use_cache=True):
     """Get all open issues."""
-    cmd = [
-        "gh",
-        "issue",
-        "list",
-        "--json",
-        "number,title",
-        "--limit",
-        "1000",
-        "--state",
-        "open",
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    import json
-
-    return json.loads(result.stdout)
-
-
-def add_label_to_issue(issue_number, label):
-    """Add a label to a GitHub issue."""
-    cmd = ["gh", "issue", "edit", str(issue_number), "--add-label", label]
-    try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error adding label to issue #{issue_number}: {e.stderr}")
-        return False
+    return gh_api.get_all_issues(state="open", use_cache=use_cache)
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Add ownership labels to GitHub issues"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch issues from GitHub instead of the short-lived local cache",
+    )
+    parser.add_argument(
+        "--repo",
+        default=gh_api.REPO,
+        help="GitHub repository as OWNER/NAME (default: $ALPACA_REPO or %(default)s)",
+    )
+    args = parser.parse_args()
+    gh_api.set_repo(args.repo)
+
     todo_file = "/Users/antonio/Documents/finmath/32500-comp-fin-py/group-assignments/Finm32500_AlpacaTradingProject/TODO.md"
 
     print("Parsing TODO.md for ownership information...")
     task_ownership = parse_todo_with_ownership(todo_file)
     print(f"Found {len(task_ownership)} tasks with ownership indicators\n")
+    task_index = build_task_index(task_ownership)
+    automaton = build_task_automaton(task_index)
 
     print("Fetching all GitHub issues...")
-    issues = get_all_issues()
+    issues = get_all_issues(use_cache=not args.no_cache)
     print(f"Found {len(issues)} issues\n")
 
     print("Adding ownership labels to issues...")
     success_count = 0
     matched_count = 0
 
-    for issue in issues:
-        number = issue["number"]
-        title = issue["title"]
-
-        # Try to match issue title with TODO task
-        matched = False
-        ownership_label = None
-
-        for task_title, ownership in task_ownership.items():
-            # Normalize for comparison (case-insensitive, ignore extra spaces)
-            if (
-                task_title.lower().strip() in title.lower().strip()
-                or title.lower().strip() in task_title.lower().strip()
-            ):
-                ownership_label = ownership
-                matched = True
-                break
-
-        if matched and ownership_label:
-            if add_label_to_issue(number, ownership_label):
-                print(f"✓ #{number}: {title[:50]}... → {ownership_label}")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for issue in issues:
+            number = issue["number"]
+            title = issue["title"]
+
+            # Try to match issue title with TODO task
+            ownership_label = find_ownership(title, task_index, automaton)
+
+            if not ownership_label:
+                print(f"○ #{number}: {title[:50]}... → No ownership match")
+                continue
+            matched_count += 1
+
+            # Send priority/theme labels along with ownership in one request
+            labels = get_missing_labels(
+                issue, determine_labels(issue) + [ownership_label]
+            )
+            if labels:
+                future = executor.submit(add_labels_to_issue, number, labels)
+                futures[future] = (issue, labels)
+            else:
+                print(f"○ #{number}: {title[:50]}... → Already labeled")
+
+        for future in as_completed(futures):
+            issue, labels = futures[future]
+            number = issue["number"]
+            if future.result():
+                print(f"✓ #{number}: {issue['title'][:50]}... → {', '.join(labels)}")
                 success_count += 1
-                matched_count += 1
             else:
-                print(f"✗ #{number}: Failed to add label")
-        else:
-            print(f"○ #{number}: {title[:50]}... → No ownership match")
+                print(f"✗ #{number}: Failed to add labels")
 
     print(f"\n✓ Added ownership labels to {success_count}/{len(issues)} issues")
     print(f"✓ Matched {matched_count} tasks from TODO.md")
@@ -0,0 +1,205 @@
+"""Minimal GitHub REST client shared by the issue-management scripts."""
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional; the stdlib parser accepts the same bytes
+    from json import loads as json_loads
+
+DEFAULT_REPO = "y3y-tech/Finm32500_AlpacaTradingProject"
+REPO = os.environ.get("ALPACA_REPO", DEFAULT_REPO)  # OWNER/NAME
+API_URL = f"https://api.github.com/repos/{REPO}"
+MAX_RETRIES = 5
+
+CACHE_DIR = Path.home() / ".cache" / "alpaca-gh"
+CACHE_TTL = 60  # seconds
+
+
+def set_repo(repo):
+    """Point the client at another repository, given as OWNER/NAME."""
+    global REPO, API_URL
+    REPO = repo
+    API_URL = f"https://api.github.com/repos/{REPO}"
+
+
+def get_token():
+    """Get a GitHub token from the environment or the gh CLI."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    cmd = ["gh", "auth", "token"]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+session.headers.update(
+    {
+        "Authorization": f"Bearer {get_token()}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+)
+
+
+# Last 200 response per GET (url, params), revalidated with If-None-Match
+_etag_cache = {}
+
+
+def request(method, url, **kwargs):
+    """Send a request, revalidating cached GETs against their ETag."""
+    if method != "GET":
+        return _send(method, url, **kwargs)
+
+    cache_key = (url, tuple(sorted((kwargs.get("params") or {}).items())))
+    cached = _etag_cache.get(cache_key)
+    if cached is not None:
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["If-None-Match"] = cached.headers["ETag"]
+        kwargs["headers"] = headers
+
+    response = _send(method, url, **kwargs)
+    if response.status_code == 304 and cached is not None:
+        return cached
+    if response.ok and "ETag" in response.headers:
+        _etag_cache[cache_key] = response
+    return response
+
+
+def _send(method, url, **kwargs):
+    """Send a request, backing off while GitHub reports a rate limit."""
+    for attempt in range(MAX_RETRIES):
+        response = session.request(method, url, **kwargs)
+        if response.status_code not in (403, 429) or attempt == MAX_RETRIES - 1:
+            return response
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(response.headers.get("X-RateLimit-Reset", time.time()))
+            delay = max(reset - time.time(), 1)
+        elif "Retry-After" in response.headers:
+            delay = int(response.headers["Retry-After"])
+        elif response.status_code == 403:
+            return response  # Permission error, not a rate limit
+        else:
+            delay = 2**attempt
+        time.sleep(delay)
+    return response
+
+
+def _cache_path(state):
+    return CACHE_DIR / f"{REPO.replace('/', '-')}-issues-{state}.json"
+
+
+# Bumped by clear_cache() so in-flight listings know they went stale
+_cache_generation = 0
+
+
+def clear_cache():
+    """Drop cached issue listings, e.g. after modifying issues."""
+    global _cache_generation
+    _cache_generation += 1
+    for path in CACHE_DIR.glob(f"{REPO.replace('/', '-')}-issues-*.json"):
+        path.unlink(missing_ok=True)
+
+
+def _read_cache(state):
+    """Return the cached issue listing if younger than CACHE_TTL, else None."""
+    path = _cache_path(state)
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL:
+            with open(path, "rb") as f:
+                return json_loads(f.read())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache: fetch fresh
+    return None
+
+
+def _write_cache(state, issues):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, delete=False) as f:
+        json.dump(issues, f)
+    os.replace(f.name, _cache_path(state))
+
+
+def _iter_issue_pages(state):
+    """Yield issues (pull requests excluded) page by page as they arrive."""
+    url = f"{API_URL}/issues"
+    params = {"state": state, "per_page": 100}
+
+    while url:
+        response = request("GET", url, params=params)
+        response.raise_for_status()
+        for issue in json_loads(response.content):
+            if "pull_request" in issue:
+                continue
+            # Match the upper-case state returned by `gh issue list --json`
+            issue["state"] = issue["state"].upper()
+            yield issue
+        url = response.links.get("next", {}).get("url")
+        params = None  # The next link already carries the query string
+
+
+def iter_issues(state="all", use_cache=True):
+    """Iterate over all issues, streaming pages unless a fresh cache exists.
+
+    A fully consumed fetch is written to the disk cache (CACHE_TTL seconds),
+    unless issues were modified through this module while it was streaming.
+    """
+    if use_cache:
+        cached = _read_cache(state)
+        if cached is not None:
+            yield from cached
+            return
+
+    generation = _cache_generation
+    issues = []
+    for issue in _iter_issue_pages(state):
+        issues.append(issue)
+        yield issue
+    if generation == _cache_generation:
+        _write_cache(state, issues)
+
+
+def get_all_issues(state="all", use_cache=True):
+    """Get all issues (pull requests excluded), following pagination."""
+    return list(iter_issues(state, use_cache=use_cache))
+
+
+def add_labels(issue_number, labels):
+    """Add labels to a GitHub issue in a single request."""
+    response = request(
+        "POST", f"{API_URL}/issues/{issue_number}/labels", json={"labels": list(labels)}
+    )
+    response.raise_for_status()
+    clear_cache()
+    return json_loads(response.content)
+
+
+def update_issue_title(issue_number, new_title):
+    """Update the title of a GitHub issue."""
+    response = request(
+        "PATCH", f"{API_URL}/issues/{issue_number}", json={"title": new_title}
+    )
+    response.raise_for_status()
+    clear_cache()
+    return json_loads(response.content)
+
+
+def create_issue(title, body, labels=None):
+    """Create a GitHub issue and return its JSON representation."""
+    payload = {"title": title, "body": body}
+    if labels:
+        payload["labels"] = list(labels)
+    response = request("POST", f"{API_URL}/issues", json=payload)
+    response.raise_for_status()
+    clear_cache()
+    return json_loads(response.content)
@@ -1,82 +1,74 @@
 #!/usr/bin/env python3
 """Display statistics about GitHub issues."""
 
-import subprocess
-import json
-from collections import defaultdict
+import argparse
+from collections import Counter, defaultdict
+
+import gh_api
+
+PRIORITY_LABELS = frozenset(
+    ["P0-critical", "P1-high", "P2-medium", "P3-low", "P4-reach"]
+)
+# Checked in order: an issue counts towards the first ownership label it has
+OWNERSHIP_LABELS = ("better-for-ai", "better-for-human", "collaborative")
+THEME_LABELS = frozenset(
+    [
+        "strategy",
+        "testing",
+        "risk-management",
+        "monitoring",
+        "infrastructure",
+        "analytics",
+        "code-quality",
+        "documentation",
+    ]
+)
 
 
-def get_all_issues(state="all"):
+def get_all_issues(state="all", use_cache=True):
     """Get all issues."""
-    cmd = [
-        "gh",
-        "issue",
-        "list",
-        "--json",
-        "number,title,state,labels",
-        "--limit",
-        "1000",
-        "--state",
-        state,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+    return gh_api.get_all_issues(state=state, use_cache=use_cache)
 
 
 def categorize_issues(issues):
     """Categorize issues by priority, ownership, and theme."""
+    # Priority and theme totals are plain label counts
+    label_counts = Counter(
+        label["name"] for issue in issues for label in issue["labels"]
+    )
+
     stats = {
         "total": len(issues),
         "open": 0,
         "closed": 0,
-        "priority": defaultdict(int),
+        "priority": {p: label_counts[p] for p in PRIORITY_LABELS},
         "ownership": defaultdict(int),
-        "theme": defaultdict(int),
+        "theme": {t: label_counts[t] for t in THEME_LABELS},
     }
 
     priority_open = defaultdict(list)
     ai_ready = []
 
     for issue in issues:
-        state = issue["state"]
-        labels = [l["name"] for l in issue["labels"]]
+        is_open = issue["state"] == "OPEN"
+        label_set = {l["name"] for l in issue["labels"]}
 
-        if state == "OPEN":
+        if is_open:
             stats["open"] += 1
         else:
             stats["closed"] += 1
 
-        # Count by priority
-        for label in labels:
-            if label.startswith("P"):
-                stats["priority"][label] += 1
-                if state == "OPEN":
-                    priority_open[label].append(issue)
+        # Track open issues by priority
+        if is_open:
+            for priority in label_set & PRIORITY_LABELS:
+                priority_open[priority].append(issue)
 
         # Count by ownership
-        if "better-for-ai" in labels:
-            stats["ownership"]["better-for-ai"] += 1
-            if state == "OPEN":
+        ownership = next((o for o in OWNERSHIP_LABELS if o in label_set), None)
+        if ownership:
+            stats["ownership"][ownership] += 1
+            if is_open and ownership == "better-for-ai":
                 ai_ready.append(issue)
-        elif "better-for-human" in labels:
-            stats["ownership"]["better-for-human"] += 1
-        elif "collaborative" in labels:
-            stats["ownership"]["collaborative"] += 1
-
-        # Count by theme
-        theme_labels = [
-            "strategy",
-            "testing",
-            "risk-management",
-            "monitoring",
-            "infrastructure",
-            "analytics",
-            "code-quality",
-            "documentation",
-        ]
-        for theme in theme_labels:
-            if theme in labels:
-                stats["theme"][theme] += 1
 
     return stats, priority_open, ai_ready
 
@@ -146,8 +138,24 @@ def print_stats(stats, priority_open, ai_ready):
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Display statistics about GitHub issues"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch issues from GitHub instead of the short-lived local cache",
+    )
+    parser.add_argument(
+        "--repo",
+        default=gh_api.REPO,
+        help="GitHub repository as OWNER/NAME (default: $ALPACA_REPO or %(default)s)",
+    )
+    args = parser.parse_args()
+    gh_api.set_repo(args.repo)
+
     print("Fetching GitHub issues...")
-    issues = get_all_issues()
+    issues = get_all_issues(use_cache=not args.no_cache)
 
     stats, priority_open, ai_ready = categorize_issues(issues)
     print_stats(stats, priority_open, ai_ready)
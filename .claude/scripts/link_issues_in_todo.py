@@ -1,26 +1,15 @@
 #!/usr/bin/env python3
 """Add GitHub issue references to TODO.md."""
 
-import re
-import subprocess
-import json
+import argparse
 
+import gh_api
+import todo_walker
 
-def get_all_issues():
+
+def get_all_issues(use_cache=True):
     """Get all open issues."""
-    cmd = [
-        "gh",
-        "issue",
-        "list",
-        "--json",
-        "number,title",
-        "--limit",
-        "1000",
-        "--state",
-        "open",
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+    return gh_api.get_all_issues(state="open", use_cache=use_cache)
 
 
 def create_title_to_issue_map(issues):
@@ -35,51 +24,57 @@ def create_title_to_issue_map(issues):
 
 def add_issue_links_to_todo(todo_path, title_map):
     """Add GitHub issue references to TODO.md."""
-    with open(todo_path, "r") as f:
-        lines = f.readlines()
-
-    updated_lines = []
     changes_made = 0
 
-    for line in lines:
-        # Match task items with emoji and title
-        task_match = re.match(r"^(- \[ \] [👤🤖🤝] \*\*)(.+?)(\*\*.*)$", line)
-        if task_match:
-            prefix = task_match.group(1)
-            title = task_match.group(2)
-            suffix = task_match.group(3)
+    def linked_lines():
+        nonlocal changes_made
+        for line, task in todo_walker.walk(todo_path):
+            new_line = line
+
+            # Unchecked tasks without an issue reference yet
+            if task and not task["checked"] and task["issue_ref"] is None:
+                title = task["title"]
 
-            # Check if issue reference already exists
-            if not re.search(r"#\d+", line):
                 # Try to find matching issue
                 title_lower = title.lower().strip()
                 if title_lower in title_map:
                     issue_num = title_map[title_lower]
-                    # Add issue reference after the title
-                    new_line = f"{prefix}{title}{suffix} [#{issue_num}]\n"
-                    updated_lines.append(new_line)
+                    # Add issue reference at the end of the task line
+                    new_line = line.rstrip("\n") + f" [#{issue_num}]\n"
                     changes_made += 1
                     print(f"✓ Linked: {title} → #{issue_num}")
                 else:
-                    updated_lines.append(line)
                     print(f"○ No match: {title}")
-            else:
-                updated_lines.append(line)
-        else:
-            updated_lines.append(line)
 
-    # Write back to file
-    with open(todo_path, "w") as f:
-        f.writelines(updated_lines)
+            yield line, new_line
+
+    # TODO.md is only rewritten if a reference was actually added
+    todo_walker.rewrite_if_changed(todo_path, linked_lines())
 
     return changes_made
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Add GitHub issue references to TODO.md"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch issues from GitHub instead of the short-lived local cache",
+    )
+    parser.add_argument(
+        "--repo",
+        default=gh_api.REPO,
+        help="GitHub repository as OWNER/NAME (default: $ALPACA_REPO or %(default)s)",
+    )
+    args = parser.parse_args()
+    gh_api.set_repo(args.repo)
+
     todo_file = "/Users/antonio/Documents/finmath/32500-comp-fin-py/group-assignments/Finm32500_AlpacaTradingProject/TODO.md"
 
     print("Fetching all GitHub issues...")
-    issues = get_all_issues()
+    issues = get_all_issues(use_cache=not args.no_cache)
     print(f"Found {len(issues)} issues\n")
 
     print("Creating title mapping...")
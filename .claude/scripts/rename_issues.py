@@ -1,22 +1,28 @@
 #!/usr/bin/env python3
 """Remove [P*] prefix from GitHub issue titles."""
 
+import argparse
 import re
-import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
 
-def get_all_issues():
+import gh_api
+
+
+def get_all_issues(use_cache=True):
     """Get all open issues."""
-    cmd = ["gh", "issue", "list", "--json", "number,title", "--limit", "1000"]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+    return gh_api.get_all_issues(state="open", use_cache=use_cache)
+
+
+MAX_WORKERS = 10
+PRIORITY_RE = re.compile(r"^\[P\d\]\s+(.+)$")
 
 
 def remove_priority_prefix(title):
     """Remove [P*] prefix from title."""
     # Match [P0], [P1], [P2], [P3], [P4] at the start
-    match = re.match(r"^\[P\d\]\s+(.+)$", title)
+    match = PRIORITY_RE.match(title)
     if match:
         return match.group(1)
     return title
@@ -24,36 +30,58 @@ def remove_priority_prefix(title):
 
 def update_issue_title(issue_number, new_title):
     """Update GitHub issue title."""
-    cmd = ["gh", "issue", "edit", str(issue_number), "--title", new_title]
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        gh_api.update_issue_title(issue_number, new_title)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error updating issue #{issue_number}: {e.stderr}")
+    except requests.HTTPError as e:
+        print(f"Error updating issue #{issue_number}: {e.response.text}")
         return False
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Remove [P*] prefix from GitHub issue titles"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch issues from GitHub instead of the short-lived local cache",
+    )
+    parser.add_argument(
+        "--repo",
+        default=gh_api.REPO,
+        help="GitHub repository as OWNER/NAME (default: $ALPACA_REPO or %(default)s)",
+    )
+    args = parser.parse_args()
+    gh_api.set_repo(args.repo)
+
     print("Fetching all issues...")
-    issues = get_all_issues()
+    issues = get_all_issues(use_cache=not args.no_cache)
     print(f"Found {len(issues)} issues\n")
 
     print("Removing [P*] prefixes from issue titles...")
     success_count = 0
 
-    for issue in issues:
-        number = issue["number"]
-        old_title = issue["title"]
-        new_title = remove_priority_prefix(old_title)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for issue in issues:
+            number = issue["number"]
+            old_title = issue["title"]
+            new_title = remove_priority_prefix(old_title)
+
+            if new_title != old_title:
+                future = executor.submit(update_issue_title, number, new_title)
+                futures[future] = (number, old_title, new_title)
+            else:
+                print(f"○ #{number}: No prefix to remove")
 
-        if new_title != old_title:
-            if update_issue_title(number, new_title):
+        for future in as_completed(futures):
+            number, old_title, new_title = futures[future]
+            if future.result():
                 print(f"✓ #{number}: {old_title} → {new_title}")
                 success_count += 1
             else:
                 print(f"✗ #{number}: Failed to update")
-        else:
-            print(f"○ #{number}: No prefix to remove")
 
     print(f"\n✓ Updated {success_count}/{len(issues)} issues")
 
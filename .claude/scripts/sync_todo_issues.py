@@ -1,88 +1,101 @@
 #!/usr/bin/env python3
 """Sync TODO.md checkbox status with GitHub issue status."""
 
+import argparse
 import re
-import subprocess
-import json
 
+import gh_api
+import todo_walker
 
-def get_issue_status(issue_number):
-    """Get the status of a GitHub issue (open/closed)."""
-    cmd = ["gh", "issue", "view", str(issue_number), "--json", "state"]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)
-        return data["state"].upper()  # OPEN or CLOSED
-    except subprocess.CalledProcessError:
-        return None
+SYNC_RE = re.compile(r"^- \[([ x])\] (.+?) \[#(\d+)\]")
 
 
-def sync_todo_with_github(todo_path):
+def get_status_map(use_cache=True):
+    """Map every issue number to its status (OPEN/CLOSED) in one fetch."""
+    return {
+        issue["number"]: issue["state"].upper()
+        for issue in gh_api.get_all_issues(state="all", use_cache=use_cache)
+    }
+
+
+def sync_todo_with_github(todo_path, use_cache=True):
     """Sync TODO.md checkboxes with GitHub issue status."""
-    with open(todo_path, "r") as f:
-        lines = f.readlines()
+    status_map = get_status_map(use_cache=use_cache)
 
-    updated_lines = []
     changes_made = 0
     stats = {"checked": 0, "unchecked": 0, "closed": 0, "open": 0, "not_found": 0}
 
-    for line in lines:
-        # Match tasks with issue references
-        task_match = re.match(r"^- \[([ x])\] (.+?) \[#(\d+)\]", line)
-        if task_match:
-            current_check = task_match.group(1)
-            task_content = task_match.group(2)
-            issue_num = int(task_match.group(3))
-
-            # Get GitHub issue status
-            gh_status = get_issue_status(issue_num)
-
-            if gh_status is None:
-                print(f"⚠ #{issue_num}: Issue not found")
-                updated_lines.append(line)
-                stats["not_found"] += 1
-            elif gh_status == "CLOSED":
-                stats["closed"] += 1
-                if current_check != "x":
-                    # Update to checked
-                    new_line = line.replace(
-                        f"- [ ] {task_content}", f"- [x] {task_content}"
-                    )
-                    updated_lines.append(new_line)
-                    changes_made += 1
-                    print(f"✓ #{issue_num}: Marked as complete (closed on GitHub)")
-                else:
-                    updated_lines.append(line)
-                    stats["checked"] += 1
-            else:  # OPEN
-                stats["open"] += 1
-                if current_check == "x":
-                    # Update to unchecked
-                    new_line = line.replace(
-                        f"- [x] {task_content}", f"- [ ] {task_content}"
-                    )
-                    updated_lines.append(new_line)
-                    changes_made += 1
-                    print(f"○ #{issue_num}: Marked as incomplete (reopened on GitHub)")
-                else:
-                    updated_lines.append(line)
-                    stats["unchecked"] += 1
-        else:
-            updated_lines.append(line)
-
-    # Write back to file
-    if changes_made > 0:
-        with open(todo_path, "w") as f:
-            f.writelines(updated_lines)
+    def synced_lines():
+        nonlocal changes_made
+        with open(todo_path, "r") as f:
+            for line in f:
+                new_line = line
+
+                # Match tasks with issue references
+                task_match = SYNC_RE.match(line)
+                if task_match:
+                    current_check = task_match.group(1)
+                    check_start, check_end = task_match.span(1)
+                    issue_num = int(task_match.group(3))
+
+                    # Get GitHub issue status
+                    gh_status = status_map.get(issue_num)
+
+                    if gh_status is None:
+                        print(f"⚠ #{issue_num}: Issue not found")
+                        stats["not_found"] += 1
+                    elif gh_status == "CLOSED":
+                        stats["closed"] += 1
+                        if current_check != "x":
+                            # Update to checked
+                            new_line = line[:check_start] + "x" + line[check_end:]
+                            changes_made += 1
+                            print(
+                                f"✓ #{issue_num}: Marked as complete (closed on GitHub)"
+                            )
+                        else:
+                            stats["checked"] += 1
+                    else:  # OPEN
+                        stats["open"] += 1
+                        if current_check == "x":
+                            # Update to unchecked
+                            new_line = line[:check_start] + " " + line[check_end:]
+                            changes_made += 1
+                            print(
+                                f"○ #{issue_num}: Marked as incomplete (reopened on GitHub)"
+                            )
+                        else:
+                            stats["unchecked"] += 1
+
+                yield line, new_line
+
+    # TODO.md is only rewritten if a checkbox actually changed
+    todo_walker.rewrite_if_changed(todo_path, synced_lines())
 
     return changes_made, stats
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Sync TODO.md checkboxes with GitHub issue status"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch issues from GitHub instead of the short-lived local cache",
+    )
+    parser.add_argument(
+        "--repo",
+        default=gh_api.REPO,
+        help="GitHub repository as OWNER/NAME (default: $ALPACA_REPO or %(default)s)",
+    )
+    args = parser.parse_args()
+    gh_api.set_repo(args.repo)
+
     todo_file = "TODO.md"
 
     print("Syncing TODO.md with GitHub issue status...")
-    changes, stats = sync_todo_with_github(todo_file)
+    changes, stats = sync_todo_with_github(todo_file, use_cache=not args.no_cache)
 
     print(f"\n{'=' * 50}")
     print("Sync Summary:")
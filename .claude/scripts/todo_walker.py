@@ -0,0 +1,72 @@
+"""Single-pass TODO.md task parsing shared by the issue-management scripts."""
+
+import itertools
+import os
+import re
+import shutil
+import tempfile
+
+# Checkbox, ownership emoji and bold title
+TASK_RE = re.compile(r"^- \[([ x])\] ([👤🤖🤝]) \*\*(.+?)\*\*")
+
+# Any #123 on a task line counts as its issue reference, linked or not
+ISSUE_REF_RE = re.compile(r"#(\d+)")
+
+
+def parse_task(line):
+    """Parse a TODO.md task line, returning None for any other line."""
+    task_match = TASK_RE.match(line)
+    if not task_match:
+        return None
+    checkbox, emoji, title = task_match.groups()
+    issue_match = ISSUE_REF_RE.search(line)
+    return {
+        "checked": checkbox == "x",
+        "emoji": emoji,
+        "title": title,
+        "issue_ref": int(issue_match.group(1)) if issue_match else None,
+    }
+
+
+def walk(filepath):
+    """Yield (line, task) for every line of TODO.md.
+
+    `task` is the parse_task() dict for task lines and None otherwise, so
+    callers that rewrite the file can pass other lines through unchanged.
+    """
+    with open(filepath, "r") as f:
+        for line in f:
+            yield line, parse_task(line)
+
+
+def rewrite_if_changed(filepath, line_pairs):
+    """Rewrite a file from (old_line, new_line) pairs, only if a line changed.
+
+    Nothing is buffered or written while lines are unchanged. At the first
+    change, the preceding lines are copied from the original file into a temp
+    file next to it, the rest of the new lines are streamed after them, and
+    the temp file replaces the original. Returns True if the file was written.
+    """
+    pairs = enumerate(line_pairs)
+    for n, (old_line, new_line) in pairs:
+        if new_line != old_line:
+            break
+    else:
+        return False
+
+    file_dir = os.path.dirname(os.path.abspath(filepath))
+    with tempfile.NamedTemporaryFile("w", dir=file_dir, delete=False) as dst:
+        try:
+            with open(filepath, "r") as src:
+                dst.writelines(itertools.islice(src, n))
+            dst.write(new_line)
+            dst.writelines(line for _, (_, line) in pairs)
+            dst.close()
+            shutil.copymode(filepath, dst.name)
+            os.replace(dst.name, filepath)
+        except BaseException:
+            # Never leave a half-written temp file next to the original
+            dst.close()
+            os.remove(dst.name)
+            raise
+    return True
@@ -3,8 +3,16 @@ Strategy Configuration Templates
 
 Defines different strategy configurations for backtesting and live trading.
 Each config specifies strategy parameters, risk settings, and symbols to trade.
+Strategies and risk configs are stored as factories and only built by
+get_config(), so importing this module doesn't construct every strategy.
+The config tables are read-only mappings; get_config() returns a fresh dict.
 """
 
+import io
+import sys
+from functools import cache, partial
+from types import MappingProxyType
+
 from AlpacaTrading.strategies.momentum import MomentumStrategy
 from AlpacaTrading.strategies.mean_reversion import MovingAverageCrossoverStrategy
 from AlpacaTrading.strategies.rsi_strategy import RSIStrategy
@@ -14,6 +22,24 @@ from AlpacaTrading.strategies.vwap_strategy import VWAPStrategy
 from AlpacaTrading.trading.order_manager import RiskConfig
 
 
+def _freeze(configs: dict) -> MappingProxyType:
+    """Read-only view of a config table and of each entry in it."""
+    return MappingProxyType(
+        {name: MappingProxyType(config) for name, config in configs.items()}
+    )
+
+
+def _factory_repr(factory: partial) -> str:
+    """Constructor call a config's factory stands for, without calling it."""
+    args = ", ".join(f"{key}={value!r}" for key, value in factory.keywords.items())
+    return f"{factory.func.__name__}({args})"
+
+
+def _symbols(*symbols: str) -> tuple[str, ...]:
+    """Immutable symbol list whose tickers are interned, so configs share them."""
+    return tuple(sys.intern(symbol) for symbol in symbols)
+
+
 # ============================================================================
 # STRATEGY CONFIGURATIONS
 # ============================================================================
@@ -21,13 +47,15 @@ from AlpacaTrading.trading.order_manager import RiskConfig
 STRATEGY_CONFIGS = {
     # Aggressive momentum for trending markets
     "momentum_aggressive": {
-        "strategy": MomentumStrategy(
+        "strategy": partial(
+            MomentumStrategy,
             lookback_period=10,
             momentum_threshold=0.015,  # 1.5% momentum required
             position_size=15000,
             max_position=150,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=150,
             max_position_value=150_000,
             max_total_exposure=300_000,
@@ -35,18 +63,20 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=10,
             min_cash_buffer=10000,
         ),
-        "symbols": ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"],
+        "symbols": _symbols("AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"),
         "description": "Aggressive momentum trader for strong trends",
     },
     # Conservative momentum for stable markets
     "momentum_conservative": {
-        "strategy": MomentumStrategy(
+        "strategy": partial(
+            MomentumStrategy,
             lookback_period=20,
             momentum_threshold=0.01,  # 1% momentum
             position_size=8000,
             max_position=80,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=80,
             max_position_value=80_000,
             max_total_exposure=150_000,
@@ -54,12 +84,13 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=5,
             min_cash_buffer=20000,
         ),
-        "symbols": ["SPY", "QQQ", "DIA", "IWM"],
+        "symbols": _symbols("SPY", "QQQ", "DIA", "IWM"),
         "description": "Conservative momentum with tight risk controls",
     },
     # RSI mean reversion with profit targets
     "rsi_scalper": {
-        "strategy": RSIStrategy(
+        "strategy": partial(
+            RSIStrategy,
             rsi_period=14,
             oversold_threshold=25,  # Very oversold
             overbought_threshold=75,  # Very overbought
@@ -68,7 +99,8 @@ STRATEGY_CONFIGS = {
             profit_target=2.0,  # 2% profit target
             stop_loss=1.0,  # 1% stop loss
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=100,
             max_position_value=100_000,
             max_total_exposure=200_000,
@@ -76,12 +108,13 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=8,
             min_cash_buffer=15000,
         ),
-        "symbols": ["AAPL", "MSFT", "AMZN", "META", "NFLX"],
+        "symbols": _symbols("AAPL", "MSFT", "AMZN", "META", "NFLX"),
         "description": "RSI scalper with tight profit/loss targets",
     },
     # RSI swing trader
     "rsi_swing": {
-        "strategy": RSIStrategy(
+        "strategy": partial(
+            RSIStrategy,
             rsi_period=14,
             oversold_threshold=30,
             overbought_threshold=70,
@@ -90,7 +123,8 @@ STRATEGY_CONFIGS = {
             profit_target=5.0,  # 5% profit target
             stop_loss=2.5,  # 2.5% stop loss
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=120,
             max_position_value=120_000,
             max_total_exposure=250_000,
@@ -98,12 +132,13 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=6,
             min_cash_buffer=10000,
         ),
-        "symbols": ["AAPL", "TSLA", "AMD", "COIN", "SQ"],
+        "symbols": _symbols("AAPL", "TSLA", "AMD", "COIN", "SQ"),
         "description": "RSI swing trader for multi-day holds",
     },
     # Bollinger Bands breakout
     "bb_breakout": {
-        "strategy": BollingerBandsStrategy(
+        "strategy": partial(
+            BollingerBandsStrategy,
             period=20,
             num_std_dev=2.0,
             mode="breakout",
@@ -111,7 +146,8 @@ STRATEGY_CONFIGS = {
             max_position=120,
             band_threshold=0.002,  # 0.2% beyond band
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=120,
             max_position_value=120_000,
             max_total_exposure=240_000,
@@ -119,12 +155,13 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=8,
             min_cash_buffer=12000,
         ),
-        "symbols": ["NVDA", "TSLA", "AMD", "SMCI", "MSTR"],
+        "symbols": _symbols("NVDA", "TSLA", "AMD", "SMCI", "MSTR"),
         "description": "Bollinger Bands breakout for volatile stocks",
     },
     # Bollinger Bands mean reversion
     "bb_reversion": {
-        "strategy": BollingerBandsStrategy(
+        "strategy": partial(
+            BollingerBandsStrategy,
             period=20,
             num_std_dev=2.5,  # Wider bands
             mode="reversion",
@@ -132,7 +169,8 @@ STRATEGY_CONFIGS = {
             max_position=100,
             band_threshold=0.001,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=100,
             max_position_value=100_000,
             max_total_exposure=200_000,
@@ -140,12 +178,13 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=7,
             min_cash_buffer=15000,
         ),
-        "symbols": ["SPY", "QQQ", "AAPL", "MSFT", "GOOGL"],
+        "symbols": _symbols("SPY", "QQQ", "AAPL", "MSFT", "GOOGL"),
         "description": "Bollinger mean reversion for range-bound markets",
     },
     # Volume breakout trader
     "volume_breakout": {
-        "strategy": VolumeBreakoutStrategy(
+        "strategy": partial(
+            VolumeBreakoutStrategy,
             volume_period=20,
             volume_multiplier=2.5,  # 2.5x normal volume
             price_momentum_period=5,
@@ -154,7 +193,8 @@ STRATEGY_CONFIGS = {
             max_position=150,
             hold_periods=30,  # Hold for max 30 ticks
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=150,
             max_position_value=150_000,
             max_total_exposure=300_000,
@@ -162,19 +202,21 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=10,
             min_cash_buffer=10000,
         ),
-        "symbols": ["TSLA", "NVDA", "AMD", "COIN", "MSTR", "SMCI"],
+        "symbols": _symbols("TSLA", "NVDA", "AMD", "COIN", "MSTR", "SMCI"),
         "description": "Volume breakout for news-driven moves",
     },
     # VWAP mean reversion
     "vwap_intraday": {
-        "strategy": VWAPStrategy(
+        "strategy": partial(
+            VWAPStrategy,
             deviation_threshold=0.008,  # 0.8% from VWAP
             position_size=10000,
             max_position=100,
             reset_period=390,  # Reset daily (390 minutes in trading day)
             min_samples=20,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=100,
             max_position_value=100_000,
             max_total_exposure=200_000,
@@ -182,15 +224,20 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=8,
             min_cash_buffer=15000,
         ),
-        "symbols": ["SPY", "QQQ", "AAPL", "MSFT", "GOOGL"],
+        "symbols": _symbols("SPY", "QQQ", "AAPL", "MSFT", "GOOGL"),
         "description": "VWAP mean reversion for liquid stocks",
     },
     # MA Crossover trend follower
     "ma_crossover": {
-        "strategy": MovingAverageCrossoverStrategy(
-            short_window=10, long_window=30, position_size=12000, max_position=120
+        "strategy": partial(
+            MovingAverageCrossoverStrategy,
+            short_window=10,
+            long_window=30,
+            position_size=12000,
+            max_position=120,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=120,
             max_position_value=120_000,
             max_total_exposure=250_000,
@@ -198,20 +245,22 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=6,
             min_cash_buffer=15000,
         ),
-        "symbols": ["SPY", "QQQ", "AAPL", "MSFT", "AMZN"],
+        "symbols": _symbols("SPY", "QQQ", "AAPL", "MSFT", "AMZN"),
         "description": "Classic MA crossover trend follower",
     },
     # Multi-strategy portfolio (for comparison)
     "balanced_portfolio": {
         # This would use a portfolio of strategies (future enhancement)
-        "strategy": RSIStrategy(
+        "strategy": partial(
+            RSIStrategy,
             rsi_period=14,
             oversold_threshold=30,
             overbought_threshold=70,
             position_size=10000,
             max_position=100,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=100,
             max_position_value=100_000,
             max_total_exposure=200_000,
@@ -219,7 +268,7 @@ STRATEGY_CONFIGS = {
             max_orders_per_symbol_per_minute=8,
             min_cash_buffer=15000,
         ),
-        "symbols": ["SPY", "QQQ", "AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"],
+        "symbols": _symbols("SPY", "QQQ", "AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"),
         "description": "Balanced multi-asset portfolio",
     },
 }
@@ -231,13 +280,15 @@ STRATEGY_CONFIGS = {
 
 CRYPTO_CONFIGS = {
     "btc_momentum": {
-        "strategy": MomentumStrategy(
+        "strategy": partial(
+            MomentumStrategy,
             lookback_period=15,
             momentum_threshold=0.02,  # 2% for crypto volatility
             position_size=5000,
             max_position=0.5,  # BTC fractions
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=1.0,
             max_position_value=50_000,
             max_total_exposure=100_000,
@@ -245,11 +296,12 @@ CRYPTO_CONFIGS = {
             max_orders_per_symbol_per_minute=5,
             min_cash_buffer=5000,
         ),
-        "symbols": ["BTC/USD", "ETH/USD"],
+        "symbols": _symbols("BTC/USD", "ETH/USD"),
         "description": "Bitcoin momentum trader",
     },
     "crypto_rsi": {
-        "strategy": RSIStrategy(
+        "strategy": partial(
+            RSIStrategy,
             rsi_period=14,
             oversold_threshold=20,  # More extreme for crypto
             overbought_threshold=80,
@@ -258,7 +310,8 @@ CRYPTO_CONFIGS = {
             profit_target=3.0,
             stop_loss=2.0,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=1.0,
             max_position_value=40_000,
             max_total_exposure=80_000,
@@ -266,18 +319,20 @@ CRYPTO_CONFIGS = {
             max_orders_per_symbol_per_minute=8,
             min_cash_buffer=10000,
         ),
-        "symbols": ["BTC/USD", "ETH/USD", "SOL/USD"],
+        "symbols": _symbols("BTC/USD", "ETH/USD", "SOL/USD"),
         "description": "Crypto RSI with wide thresholds for volatility",
     },
     "crypto_vwap": {
-        "strategy": VWAPStrategy(
+        "strategy": partial(
+            VWAPStrategy,
             deviation_threshold=0.015,  # 1.5% for crypto
             position_size=4000,
             max_position=0.4,
             reset_period=0,  # Never reset (24/7 trading)
             min_samples=30,
         ),
-        "risk_config": RiskConfig(
+        "risk_config": partial(
+            RiskConfig,
             max_position_size=1.0,
             max_position_value=45_000,
             max_total_exposure=90_000,
@@ -285,11 +340,15 @@ CRYPTO_CONFIGS = {
             max_orders_per_symbol_per_minute=7,
             min_cash_buffer=8000,
         ),
-        "symbols": ["BTC/USD", "ETH/USD"],
+        "symbols": _symbols("BTC/USD", "ETH/USD"),
         "description": "VWAP mean reversion for crypto 24/7",
     },
 }
 
+# Read-only from here on; get_config() hands out mutable copies
+STRATEGY_CONFIGS = _freeze(STRATEGY_CONFIGS)
+CRYPTO_CONFIGS = _freeze(CRYPTO_CONFIGS)
+
 
 # ============================================================================
 # DATA FILE PATHS (customize for your setup)
@@ -309,6 +368,19 @@ DATA_FILES = {
 # ============================================================================
 
 
+@cache
+def _resolve_config(config_name: str, asset_class: str):
+    """Look up a config entry once and build its (immutable) RiskConfig."""
+    configs = CRYPTO_CONFIGS if asset_class == "crypto" else STRATEGY_CONFIGS
+
+    if config_name not in configs:
+        available = ", ".join(configs.keys())
+        raise ValueError(f"Unknown config '{config_name}'. Available: {available}")
+
+    config = configs[config_name]
+    return config, config["risk_config"]()
+
+
 def get_config(config_name: str, asset_class: str = "equities"):
     """
     Get a strategy configuration by name.
@@ -318,20 +390,20 @@ def get_config(config_name: str, asset_class: str = "equities"):
         asset_class: 'equities' or 'crypto'
 
     Returns:
-        Configuration dictionary
+        Configuration dictionary with a freshly built 'strategy' and a
+        cached 'risk_config' (RiskConfig is frozen, so it is safe to share)
 
     Example:
         config = get_config('momentum_aggressive')
         strategy = config['strategy']
         risk_config = config['risk_config']
     """
-    configs = CRYPTO_CONFIGS if asset_class == "crypto" else STRATEGY_CONFIGS
-
-    if config_name not in configs:
-        available = ", ".join(configs.keys())
-        raise ValueError(f"Unknown config '{config_name}'. Available: {available}")
-
-    return configs[config_name]
+    config, risk_config = _resolve_config(config_name, asset_class)
+    return {
+        **config,
+        "strategy": config["strategy"](),
+        "risk_config": risk_config,
+    }
 
 
 def list_configs(asset_class: str = "equities"):
@@ -343,13 +415,17 @@ def list_configs(asset_class: str = "equities"):
     """
     configs = CRYPTO_CONFIGS if asset_class == "crypto" else STRATEGY_CONFIGS
 
-    print(f"\nAvailable {asset_class.upper()} Configurations:")
-    print("=" * 80)
+    # Build the listing in memory and write it to stdout in one go
+    out = io.StringIO()
+    print(f"\nAvailable {asset_class.upper()} Configurations:", file=out)
+    print("=" * 80, file=out)
 
     for name, config in configs.items():
-        print(f"\n{name}:")
-        print(f"  Strategy: {config['strategy']}")
-        print(f"  Symbols: {', '.join(config['symbols'])}")
-        print(f"  Description: {config['description']}")
+        print(f"\n{name}:", file=out)
+        print(f"  Strategy: {_factory_repr(config['strategy'])}", file=out)
+        print(f"  Symbols: {', '.join(config['symbols'])}", file=out)
+        print(f"  Description: {config['description']}", file=out)
+
+    print("\n" + "=" * 80, file=out)
 
-    print("\n" + "=" * 80)
+    sys.stdout.write(out.getvalue())
@@ -1,5 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from AlpacaTrading.indicators import moving_averages, simple_returns
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional; the stdlib parser accepts the same bytes
+    from json import loads as json_loads
+
+KLINES_URL = "https://data-api.binance.vision/api/v3/klines"
+
+# Field order of each kline returned by the Binance klines endpoint
+KLINE_COLUMNS = (
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_volume",
+    "trades",
+    "taker_buy_base",
+    "taker_buy_quote",
+    "ignore",
+)
+NUM_COLUMNS = KLINE_COLUMNS[1:6]  # Prices and volume, sent as strings
+
+# Shared keep-alive connections, so repeated fetches skip the TLS handshake
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    ),
+)
 
 
 def get_crypto_data(symbol: str, interval="1d", limit=200):
@@ -8,8 +50,6 @@ def get_crypto_data(symbol: str, interval="1d", limit=200):
     """
     print(f"Fetching {symbol}  data...")
 
-    url = "https://data-api.binance.vision/api/v3/klines"
-
     params = {
         "symbol": symbol,  # Ethereum/USDT
         "interval": interval,  # 1d = daily, 1h = hourly, etc.
@@ -17,56 +57,61 @@ def get_crypto_data(symbol: str, interval="1d", limit=200):
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = session.get(KLINES_URL, params=params, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
-
-        # Create DataFrame
+        data = json_loads(response.content)
+
+        # Slice typed columns out of one array instead of letting pandas infer
+        # dtypes from the list of lists. Only the open time and OHLCV fields are
+        # used, so the other six never make it into the array.
+        klines = np.array([kline[:6] for kline in data], dtype=object).reshape(-1, 6)
+        ohlcv = klines[:, 1:6].astype(np.float64)
+        closes = ohlcv[:, 3].copy()
+
+        ma_7, ma_10 = moving_averages(closes, (7, 10))
+        columns = {
+            **dict(zip(NUM_COLUMNS, ohlcv.T)),
+            "returns": simple_returns(closes),
+            "MA_7": ma_7,
+            "MA_10": ma_10,
+        }
+
+        # Drop the NaN warm-up rows on the arrays, then build the output frame
+        # in one go: no intermediate frame to re-index, project or dropna
+        keep = ~np.logical_or.reduce([np.isnan(col) for col in columns.values()])
+        timestamps = pd.to_datetime(
+            klines[keep, 0].astype(np.int64), unit="ms", cache=True
+        )
         df = pd.DataFrame(
-            data,
-            columns=[
-                "timestamp",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "close_time",
-                "quote_volume",
-                "trades",
-                "taker_buy_base",
-                "taker_buy_quote",
-                "ignore",
-            ],
+            {name: col[keep] for name, col in columns.items()},
+            index=pd.DatetimeIndex(timestamps, name="timestamp"),
         )
 
-        # Process data
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-        df.set_index("timestamp", inplace=True)
-
-        df["open"] = df["open"].astype(float)
-        df["high"] = df["high"].astype(float)
-        df["low"] = df["low"].astype(float)
-        df["close"] = df["close"].astype(float)
-        df["returns"] = df["close"].pct_change()
-        df["volume"] = df["volume"].astype(float)
-        df["MA_7"] = df["close"].rolling(window=7).mean()
-        df["MA_10"] = df["close"].rolling(window=10).mean()
-
-        # Keep only relevant columns
-        df = df[["open", "high", "low", "close", "volume", "returns", "MA_7", "MA_10"]]
-
-        df.dropna(inplace=True)
-
         file_name = f"{symbol}.csv"
 
         df.to_csv("./crypto_data/" + file_name)
 
+        return df
+
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data: {e}")
         return None
 
 
+def get_crypto_data_many(symbols, interval="1d", limit=200, max_workers=8):
+    """
+    Fetch several symbols concurrently over the shared connection pool.
+
+    Returns a dict of symbol -> DataFrame (None where the fetch failed).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = executor.map(
+            lambda symbol: get_crypto_data(symbol, interval=interval, limit=limit),
+            symbols,
+        )
+        return dict(zip(symbols, frames))
+
+
 if __name__ == "__main__":
     df = get_crypto_data(symbol="ETHUSDT", interval="1d")
@@ -1,13 +1,27 @@
+import numpy as np
 import yfinance as yf
 import pandas as pd
 from pathlib import Path
 from typing import Union
 
+from AlpacaTrading.indicators import moving_averages, simple_returns
+
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"  # Multithreaded CSV parser
+    RAW_FORMAT = "parquet"  # Binary columns: no float formatting or parsing
+except ImportError:
+    CSV_ENGINE = "c"
+    RAW_FORMAT = "csv"
+
 
 def load_equities(
     ticker: str, period: str = "7d", interval: str = "1m"
 ) -> tuple[str, Path]:
-    """Download equity data and write a CSV into the repository's raw_data folder.
+    """Download equity data and write it into the repository's raw_data folder.
+
+    The raw file is Parquet when pyarrow is installed and CSV otherwise.
 
     Returns (ticker, output_path).
     """
@@ -15,7 +29,7 @@ def load_equities(
     data = yf.download(tickers=ticker, period=period, interval=interval)
     data = data.stack(level=1).reset_index()
 
-    data_name = "tickers_raw.csv"
+    data_name = f"tickers_raw.{RAW_FORMAT}"
 
     # Build a path relative to this script (equities_data/)
     base_dir = Path(__file__).resolve().parent
@@ -25,27 +39,42 @@ def load_equities(
     output_path = raw_dir / data_name
 
     # pandas accepts path-like objects
-    data.to_csv(output_path)
+    if RAW_FORMAT == "parquet":
+        data.to_parquet(output_path)
+    else:
+        data.to_csv(output_path)
 
     return ticker, output_path
 
 
 def clean_equities(ticker: str, raw_data_file_path: Union[str, Path]):
     raw_path = Path(raw_data_file_path)
-    equities_df = pd.read_csv(raw_path, index_col=0)
-
-    equities_df.ffill(inplace=True)
-
-    equities_df["Return"] = equities_df["Close"].astype("float").pct_change()
-
-    equities_df["Weekly Moving Average"] = equities_df["Close"].rolling(window=7).mean()
-
-    equities_df.rename(columns={"Ticker": "symbol"}, inplace=True)
+    if raw_path.suffix == ".parquet":
+        equities_df = pd.read_parquet(raw_path)
+    else:
+        equities_df = pd.read_csv(raw_path, index_col=0, engine=CSV_ENGINE)
+
+    # Raw rows interleave the tickers by timestamp, so forward-fill and derive
+    # columns within each symbol instead of across neighbouring rows
+    equities_df = equities_df.rename(columns={"Ticker": "symbol"})
+    equities_df = equities_df.fillna(equities_df.groupby("symbol", sort=False).ffill())
+    # One pass over the symbols fills both derived columns
+    closes = equities_df["Close"].to_numpy(dtype=np.float64)
+    returns = np.empty_like(closes)
+    weekly_ma = np.empty_like(closes)
+    for rows in equities_df.groupby("symbol", sort=False).indices.values():
+        symbol_closes = closes[rows]
+        returns[rows] = simple_returns(symbol_closes)
+        weekly_ma[rows] = moving_averages(symbol_closes, (7,))[0]
+    equities_df = equities_df.assign(
+        **{"Return": returns, "Weekly Moving Average": weekly_ma}
+    )
 
     data_name = "tickers_cleaned.csv"
 
-    # Clean out starting rows that are NaN from rolling average and return calculations
-    equities_df.dropna(inplace=True)
+    # Single terminal dropna: clears the starting rows that are NaN from the
+    # rolling average and return calculations
+    equities_df = equities_df.dropna()
 
     base_dir = Path(__file__).resolve().parent
     cleaned_dir = base_dir / "cleaned_data"
@@ -9,25 +9,110 @@ This example shows how to:
 5. Monitor positions and P&L
 
 IMPORTANT: This uses PAPER TRADING by default. Ensure your .env is configured correctly.
+
+Usage:
+    python examples/live_trading_example.py                # interactive menu
+    python examples/live_trading_example.py --example 2    # dry run, no prompts
+    python examples/live_trading_example.py --example 3 --yes --symbols AAPL
+
+Environment (Linux only):
+    ALPACA_CPU=2         pin the engine to CPU 2 (ideally the core handling NIC IRQs)
+    ALPACA_SCHED_FIFO=1  with ALPACA_CPU, also request real-time scheduling
 """
 
+import argparse
+import asyncio
+import cmd
+import importlib
 import logging
+import os
+import selectors
 import sys
-from pathlib import Path
-
-# Add src to path
-BASE_DIR = Path(__file__).parent.parent
-sys.path.insert(0, str(BASE_DIR))
+import threading
+import traceback
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING
 
 from AlpacaTrading import setup_logging
-from AlpacaTrading.live import (
-    AlpacaConfig,
-    AlpacaTrader,
-    LiveTradingEngine,
-    LiveEngineConfig,
+
+try:
+    import readline
+except ImportError:  # Not available on Windows
+    readline = None
+
+# The trading stack (pandas, alpaca-py) takes about a second to import, so the
+# examples import it lazily and _warm_up() loads it while the menu is shown
+if TYPE_CHECKING:
+    from AlpacaTrading.live import AlpacaConfig
+
+
+# Menu input history, shared by the example scripts
+HISTORY_FILE = os.path.expanduser("~/.alpaca_examples_history")
+
+# Fields shown per row in the account listings, fetched in one C-level call
+_position_fields = itemgetter(
+    "symbol",
+    "quantity",
+    "avg_entry_price",
+    "current_price",
+    "unrealized_pl",
+    "unrealized_plpc",
 )
-from AlpacaTrading.strategies.momentum import MomentumStrategy
-from AlpacaTrading.trading import RiskConfig, StopLossConfig
+_order_fields = itemgetter("side", "qty", "symbol", "order_type")
+
+
+@lru_cache(maxsize=1)
+def load_alpaca_config() -> "AlpacaConfig":
+    """Load Alpaca credentials from .env once and share them across examples."""
+    from AlpacaTrading.live import AlpacaConfig
+
+    return AlpacaConfig.from_env()
+
+
+def _input_timeout(prompt: str, timeout: float = 5.0) -> str:
+    """Prompt for a line, returning "" if nothing is entered within timeout."""
+    if os.name == "nt":  # select() only works on sockets on Windows
+        return input(prompt)
+    with selectors.DefaultSelector() as sel:
+        sel.register(sys.stdin, selectors.EVENT_READ)
+        print(prompt, end="", flush=True)
+        if not sel.select(timeout):
+            print()
+            return ""
+    return sys.stdin.readline().strip()
+
+
+def _pin_to_cpu() -> None:
+    """Pin the process to the CPU named by ALPACA_CPU, if set (Linux only)."""
+    cpu = os.environ.get("ALPACA_CPU")
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (ValueError, OSError) as e:
+        print(f"⚠️  Cannot pin to CPU {cpu!r}: {e}")
+        return
+    print(f"Pinned to CPU {cpu}")
+
+    if os.environ.get("ALPACA_SCHED_FIFO") == "1":
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except PermissionError:
+            print("⚠️  SCHED_FIFO needs CAP_SYS_NICE, keeping the default scheduler")
+
+
+async def fetch_account_snapshot(trader) -> tuple[dict, list[dict], list[dict]]:
+    """Fetch account info, positions and open orders concurrently.
+
+    The three REST round-trips are independent, so they overlap in worker
+    threads and the wait is the slowest request rather than their sum.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(trader.get_account),
+        asyncio.to_thread(trader.get_positions),
+        asyncio.to_thread(trader.get_open_orders),
+    )
 
 
 def example_alpaca_connection():
@@ -36,44 +121,46 @@ def example_alpaca_connection():
     print("EXAMPLE 1: Alpaca Connection Test")
     print("=" * 60)
 
+    from AlpacaTrading.live import AlpacaTrader
+
     try:
         # Load credentials from .env
-        config = AlpacaConfig.from_env()
+        config = load_alpaca_config()
         trader = AlpacaTrader(config)
 
+        account, positions, orders = asyncio.run(fetch_account_snapshot(trader))
+
         # Get account info
         print("\n📊 Account Information:")
-        account = trader.get_account()
         print(f"  Cash: ${account['cash']:,.2f}")
         print(f"  Portfolio Value: ${account['portfolio_value']:,.2f}")
         print(f"  Buying Power: ${account['buying_power']:,.2f}")
         print(f"  Equity: ${account['equity']:,.2f}")
         print(f"  Pattern Day Trader: {account['pattern_day_trader']}")
 
-        # Get positions (if any)
-        positions = trader.get_positions()
+        # Show positions (if any)
         if positions:
             print(f"\n📦 Current Positions ({len(positions)}):")
-            for pos in positions:
-                pnl = pos["unrealized_pl"]
-                pnl_pct = pos["unrealized_plpc"] * 100
-                print(
-                    f"  {pos['symbol']}: {pos['quantity']} @ ${pos['avg_entry_price']:.2f}"
-                )
-                print(
-                    f"    Current: ${pos['current_price']:.2f} | P&L: ${pnl:+,.2f} ({pnl_pct:+.2f}%)"
+            # Format every row first and write them out in one call
+            rows = [
+                f"  {symbol}: {qty} @ ${avg_price:.2f}\n"
+                f"    Current: ${price:.2f} | P&L: ${pnl:+,.2f} ({pnl_pct * 100:+.2f}%)\n"
+                for symbol, qty, avg_price, price, pnl, pnl_pct in map(
+                    _position_fields, positions
                 )
+            ]
+            sys.stdout.write("".join(rows))
         else:
             print("\n📦 No open positions")
 
-        # Get open orders (if any)
-        orders = trader.get_open_orders()
+        # Show open orders (if any)
         if orders:
             print(f"\n📋 Open Orders ({len(orders)}):")
-            for order in orders:
-                print(
-                    f"  {order['side']} {order['qty']} {order['symbol']} @ {order['order_type']}"
-                )
+            rows = [
+                f"  {side} {qty} {symbol} @ {order_type}\n"
+                for side, qty, symbol, order_type in map(_order_fields, orders)
+            ]
+            sys.stdout.write("".join(rows))
         else:
             print("\n📋 No open orders")
 
@@ -87,7 +174,9 @@ def example_alpaca_connection():
         print("  3. You're using paper trading credentials")
 
 
-def example_live_trading_dry_run():
+def example_live_trading_dry_run(
+    symbols: list[str] | None = None, assume_yes: bool = False
+):
     """Example 2: Run live trading in DRY RUN mode (no actual orders)."""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 2: Live Trading Dry Run")
@@ -96,11 +185,19 @@ def example_live_trading_dry_run():
     print("but will NOT submit actual orders (enable_trading=False).")
     print("\nPress Ctrl+C to stop.\n")
 
-    input("Press Enter to continue or Ctrl+C to skip...")
+    if not assume_yes and sys.stdin.isatty():
+        _input_timeout(
+            "Press Enter to continue or Ctrl+C to skip (continuing in 10s)...",
+            timeout=10.0,
+        )
+
+    from AlpacaTrading.live import LiveEngineConfig, LiveTradingEngine
+    from AlpacaTrading.strategies.momentum import MomentumStrategy
+    from AlpacaTrading.trading import RiskConfig, StopLossConfig
 
     try:
         # Configure Alpaca
-        alpaca_config = AlpacaConfig.from_env()
+        alpaca_config = load_alpaca_config()
 
         # Configure risk management
         risk_config = RiskConfig(
@@ -131,6 +228,8 @@ def example_live_trading_dry_run():
             enable_stop_loss=True,
             log_orders=True,
             order_log_path="dry_run_orders.csv",
+            log_backend="background",
+            use_uvloop=True,
         )
 
         # Create strategy
@@ -143,9 +242,11 @@ def example_live_trading_dry_run():
         # Create engine
         engine = LiveTradingEngine(engine_config, strategy)
 
+        _pin_to_cpu()
+
         # Run (blocking call - press Ctrl+C to stop)
         engine.run(
-            symbols=["BTC/USD"],
+            symbols=symbols or ["BTC/USD"],
             data_type="trades",  # Use real-time trades
         )
 
@@ -153,12 +254,12 @@ def example_live_trading_dry_run():
         print("\n\nDry run stopped by user")
     except Exception as e:
         print(f"\n\n❌ Error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        traceback.print_exception(e, limit=5, chain=False)
 
 
-def example_live_trading_paper():
+def example_live_trading_paper(
+    symbols: list[str] | None = None, assume_yes: bool = False
+):
     """Example 3: Run REAL live trading in PAPER mode."""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 3: Live Paper Trading")
@@ -167,14 +268,21 @@ def example_live_trading_paper():
     print("Make sure you understand the risks and have tested in dry run mode first.")
     print("\nPress Ctrl+C to stop.\n")
 
-    response = input("Type 'YES' to continue with paper trading: ")
-    if response != "YES":
+    confirmed = assume_yes or (
+        sys.stdin.isatty()
+        and input("Type 'YES' to continue with paper trading: ") == "YES"
+    )
+    if not confirmed:
         print("Cancelled.")
         return
 
+    from AlpacaTrading.live import LiveEngineConfig, LiveTradingEngine
+    from AlpacaTrading.strategies.momentum import MomentumStrategy
+    from AlpacaTrading.trading import RiskConfig, StopLossConfig
+
     try:
         # Configure Alpaca
-        alpaca_config = AlpacaConfig.from_env()
+        alpaca_config = load_alpaca_config()
 
         # Verify we're in paper mode
         if not alpaca_config.paper:
@@ -211,6 +319,8 @@ def example_live_trading_paper():
             enable_stop_loss=True,
             log_orders=True,
             order_log_path="paper_trading_orders.csv",
+            log_backend="background",
+            use_uvloop=True,
         )
 
         # Create strategy (conservative settings)
@@ -223,9 +333,11 @@ def example_live_trading_paper():
         # Create engine
         engine = LiveTradingEngine(engine_config, strategy)
 
+        _pin_to_cpu()
+
         # Run (blocking call - press Ctrl+C to stop)
         engine.run(
-            symbols=["AAPL", "MSFT"],  # Start with just 2 liquid stocks
+            symbols=symbols or ["AAPL", "MSFT"],  # Start with 2 liquid stocks
             data_type="trades",
         )
 
@@ -233,14 +345,44 @@ def example_live_trading_paper():
         print("\n\nPaper trading stopped by user")
     except Exception as e:
         print(f"\n\n❌ Error: {e}")
-        import traceback
+        traceback.print_exception(e, limit=5, chain=False)
+
 
-        traceback.print_exc()
+def _warm_up():
+    """Import the trading stack in the background."""
+    for module in ("AlpacaTrading.live", "AlpacaTrading.strategies.momentum"):
+        importlib.import_module(module)
 
 
-def main():
-    """Run all examples (interactive)."""
-    print("""
+def run_example(
+    choice: str, symbols: list[str] | None = None, assume_yes: bool = False
+):
+    """Run one example by menu number ("4" runs all of them)."""
+    if choice == "4":
+        # The read-only connection test runs alongside the dry run. The dry
+        # run stays on the main thread because the engine installs signal
+        # handlers; paper trading follows, as it needs its own confirmation.
+        connection = threading.Thread(
+            target=example_alpaca_connection, name="connection-test"
+        )
+        connection.start()
+        example_live_trading_dry_run(symbols, assume_yes)
+        connection.join()
+        example_live_trading_paper(symbols, assume_yes)
+        return
+
+    if choice == "1":
+        example_alpaca_connection()
+    elif choice == "2":
+        example_live_trading_dry_run(symbols, assume_yes)
+    elif choice == "3":
+        example_live_trading_paper(symbols, assume_yes)
+
+
+class ExampleMenu(cmd.Cmd):
+    """Interactive example menu, with input history kept across sessions."""
+
+    intro = """
 ╔══════════════════════════════════════════════════════════╗
 ║         LIVE TRADING WITH ALPACA - EXAMPLES              ║
 ╚══════════════════════════════════════════════════════════╝
@@ -250,36 +392,89 @@ Choose an example to run:
 1. Test Alpaca Connection (safe - read-only)
 2. Live Trading Dry Run (safe - no orders submitted)
 3. Paper Trading (⚠️  submits real paper orders)
-4. Run all examples in sequence
+4. Run all examples (connection test alongside the dry run)
 
 0. Exit
-    """)
-
-    while True:
-        choice = input("\nEnter your choice (0-4): ").strip()
-
-        if choice == "0":
-            print("\nGoodbye!")
-            break
-        elif choice == "1":
-            example_alpaca_connection()
-        elif choice == "2":
-            example_live_trading_dry_run()
-        elif choice == "3":
-            example_live_trading_paper()
-        elif choice == "4":
-            example_alpaca_connection()
-            example_live_trading_dry_run()
-            example_live_trading_paper()
-        else:
-            print("Invalid choice. Please enter 0-4.")
+"""
+    prompt = "\nEnter your choice (0-4): "
+
+    def __init__(self, symbols: list[str] | None, assume_yes: bool):
+        super().__init__()
+        self.symbols = symbols
+        self.assume_yes = assume_yes
+
+    def preloop(self):
+        if readline is not None:
+            try:
+                readline.read_history_file(HISTORY_FILE)
+            except OSError:
+                pass  # No history yet
+
+    def postloop(self):
+        if readline is not None:
+            readline.write_history_file(HISTORY_FILE)
+
+    def do_1(self, arg):
+        """Test Alpaca connection (read-only)."""
+        run_example("1", self.symbols, self.assume_yes)
+
+    def do_2(self, arg):
+        """Live trading dry run (no orders submitted)."""
+        run_example("2", self.symbols, self.assume_yes)
+
+    def do_3(self, arg):
+        """Paper trading (submits paper orders)."""
+        run_example("3", self.symbols, self.assume_yes)
+
+    def do_4(self, arg):
+        """Run all examples."""
+        run_example("4", self.symbols, self.assume_yes)
+
+    def do_0(self, arg):
+        """Exit."""
+        print("\nGoodbye!")
+        return True
+
+    do_EOF = do_0
+
+    def emptyline(self):
+        """Ignore empty input rather than repeating the last example."""
+
+    def default(self, line):
+        print("Invalid choice. Please enter 0-4.")
+
+
+def main(argv: list[str] | None = None):
+    """Run an example from the command line, or pick one interactively."""
+    parser = argparse.ArgumentParser(description="Live trading with Alpaca examples")
+    parser.add_argument(
+        "--example",
+        choices=["1", "2", "3", "4"],
+        help="Example to run (4 = all of them); omit for the interactive menu",
+    )
+    parser.add_argument(
+        "--symbols", nargs="+", help="Symbols to trade (default: per example)"
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompts, including the paper trading 'YES' gate",
+    )
+    args = parser.parse_args(argv)
+
+    if args.example is not None:
+        run_example(args.example, args.symbols, args.yes)
+        return
+    if not sys.stdin.isatty():
+        parser.error("--example is required when stdin is not a terminal")
 
+    threading.Thread(target=_warm_up, daemon=True).start()
+    ExampleMenu(args.symbols, args.yes).cmdloop()
 
-if __name__ == "__main__":
-    # Check if .env exists
-    import os
 
-    if not os.path.exists(".env"):
+if __name__ == "__main__":
+    # Check if .env exists (a single access() call, no stat result to build)
+    if not os.access(".env", os.F_OK):
         print("❌ ERROR: .env file not found!")
         print("\nPlease create a .env file with your Alpaca credentials:")
         print("  cp .env.example .env")
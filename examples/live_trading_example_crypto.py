@@ -9,12 +9,101 @@ This example shows how to:
 5. Monitor positions and P&L
 
 IMPORTANT: This uses PAPER TRADING by default. Ensure your .env is configured correctly.
+
+Usage:
+    python examples/live_trading_example_crypto.py               # interactive menu
+    python examples/live_trading_example_crypto.py --example 2   # dry run, no prompts
+    python examples/live_trading_example_crypto.py --example 3 --yes
+
+Environment (Linux only):
+    ALPACA_CPU=2         pin the engine to CPU 2 (ideally the core handling NIC IRQs)
+    ALPACA_SCHED_FIFO=1  with ALPACA_CPU, also request real-time scheduling
 """
 
-from AlpacaTrading.live.live_engine_crypto import LiveTradingEngine, LiveEngineConfig
-from AlpacaTrading.live.alpaca_trader_crypto import AlpacaTrader, AlpacaConfig
-from AlpacaTrading.strategies import MomentumStrategy
-from AlpacaTrading.trading import RiskConfig, StopLossConfig
+import argparse
+import asyncio
+import cmd
+import importlib
+import os
+import selectors
+import sys
+import threading
+import traceback
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+try:
+    import readline
+except ImportError:  # Not available on Windows
+    readline = None
+
+# The trading stack (pandas, alpaca-py) takes about a second to import, so the
+# examples import it lazily and _warm_up() loads it while the menu is shown
+if TYPE_CHECKING:
+    from AlpacaTrading.live.alpaca_trader_crypto import AlpacaConfig
+
+
+# Menu input history, shared by the example scripts
+HISTORY_FILE = os.path.expanduser("~/.alpaca_examples_history")
+
+# Fields shown per row in the account listings, fetched in one C-level call
+_position_fields = itemgetter(
+    "symbol",
+    "quantity",
+    "avg_entry_price",
+    "current_price",
+    "unrealized_pl",
+    "unrealized_plpc",
+)
+
+
+@lru_cache(maxsize=1)
+def load_alpaca_config() -> "AlpacaConfig":
+    """Load Alpaca credentials from .env once, with crypto mode enabled."""
+    from AlpacaTrading.live.alpaca_trader_crypto import AlpacaConfig
+
+    return AlpacaConfig.from_env(crypto=True)
+
+
+def _input_timeout(prompt: str, timeout: float = 5.0) -> str:
+    """Prompt for a line, returning "" if nothing is entered within timeout."""
+    if os.name == "nt":  # select() only works on sockets on Windows
+        return input(prompt)
+    with selectors.DefaultSelector() as sel:
+        sel.register(sys.stdin, selectors.EVENT_READ)
+        print(prompt, end="", flush=True)
+        if not sel.select(timeout):
+            print()
+            return ""
+    return sys.stdin.readline().strip()
+
+
+def _pin_to_cpu() -> None:
+    """Pin the process to the CPU named by ALPACA_CPU, if set (Linux only)."""
+    cpu = os.environ.get("ALPACA_CPU")
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (ValueError, OSError) as e:
+        print(f"⚠️  Cannot pin to CPU {cpu!r}: {e}")
+        return
+    print(f"Pinned to CPU {cpu}")
+
+    if os.environ.get("ALPACA_SCHED_FIFO") == "1":
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except PermissionError:
+            print("⚠️  SCHED_FIFO needs CAP_SYS_NICE, keeping the default scheduler")
+
+
+async def fetch_account_snapshot(trader) -> tuple[dict, list[dict]]:
+    """Fetch account info and positions concurrently (two REST round-trips)."""
+    return await asyncio.gather(
+        asyncio.to_thread(trader.get_account),
+        asyncio.to_thread(trader.get_positions),
+    )
 
 
 def example_alpaca_connection():
@@ -23,34 +112,36 @@ def example_alpaca_connection():
     print("EXAMPLE 1: Alpaca Connection Test")
     print("=" * 60)
 
+    from AlpacaTrading.live.alpaca_trader_crypto import AlpacaTrader
+
     try:
         # Load credentials from .env
-        config = AlpacaConfig.from_env()
-        config.crypto = True  # IMPORTANT: Enable crypto mode
+        config = load_alpaca_config()
 
         trader = AlpacaTrader(config)
 
+        # Account and positions are independent requests: overlap them
+        account, positions = asyncio.run(fetch_account_snapshot(trader))
+
         # Get account info
         print("\n📊 Account Information:")
-        account = trader.get_account()
         print(f"  Cash: ${account['cash']:,.2f}")
         print(f"  Portfolio Value: ${account['portfolio_value']:,.2f}")
         print(f"  Buying Power: ${account['buying_power']:,.2f}")
         print(f"  Equity: ${account['equity']:,.2f}")
 
-        # Get positions (if any)
-        positions = trader.get_positions()
+        # Show positions (if any)
         if positions:
             print(f"\n📦 Current Positions ({len(positions)}):")
-            for pos in positions:
-                pnl = pos["unrealized_pl"]
-                pnl_pct = pos["unrealized_plpc"] * 100
-                print(
-                    f"  {pos['symbol']}: {pos['quantity']} @ ${pos['avg_entry_price']:.2f}"
-                )
-                print(
-                    f"    Current: ${pos['current_price']:.2f} | P&L: ${pnl:+,.2f} ({pnl_pct:+.2f}%)"
+            # Format every row first and write them out in one call
+            rows = [
+                f"  {symbol}: {qty} @ ${avg_price:.2f}\n"
+                f"    Current: ${price:.2f} | P&L: ${pnl:+,.2f} ({pnl_pct * 100:+.2f}%)\n"
+                for symbol, qty, avg_price, price, pnl, pnl_pct in map(
+                    _position_fields, positions
                 )
+            ]
+            sys.stdout.write("".join(rows))
         else:
             print("\n📦 No open positions")
 
@@ -63,7 +154,9 @@ def example_alpaca_connection():
         print("  2. Your API keys are valid")
 
 
-def example_live_trading_dry_run():
+def example_live_trading_dry_run(
+    symbols: list[str] | None = None, assume_yes: bool = False
+):
     """Example 2: Run live trading in DRY RUN mode (no actual orders)."""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 2: Live Crypto Trading Dry Run")
@@ -72,12 +165,22 @@ def example_live_trading_dry_run():
     print("but will NOT submit actual orders (enable_trading=False).")
     print("\nPress Ctrl+C to stop.\n")
 
-    input("Press Enter to continue or Ctrl+C to skip...")
+    if not assume_yes and sys.stdin.isatty():
+        _input_timeout(
+            "Press Enter to continue or Ctrl+C to skip (continuing in 10s)...",
+            timeout=10.0,
+        )
+
+    from AlpacaTrading.live.live_engine_crypto import (
+        LiveEngineConfig,
+        LiveTradingEngine,
+    )
+    from AlpacaTrading.strategies import MomentumStrategy
+    from AlpacaTrading.trading import RiskConfig, StopLossConfig
 
     try:
         # Configure Alpaca
-        alpaca_config = AlpacaConfig.from_env()
-        alpaca_config.crypto = True  # Enable crypto streaming
+        alpaca_config = load_alpaca_config()
 
         # Configure risk management (adjusted for Crypto)
         risk_config = RiskConfig(
@@ -108,6 +211,8 @@ def example_live_trading_dry_run():
             enable_stop_loss=True,
             log_orders=True,
             order_log_path="dry_run_crypto_orders.csv",
+            log_backend="background",
+            use_uvloop=True,
         )
 
         # Create strategy
@@ -121,22 +226,26 @@ def example_live_trading_dry_run():
         # Create engine
         engine = LiveTradingEngine(engine_config, strategy)
 
+        _pin_to_cpu()
+
         # Run (blocking call - press Ctrl+C to stop)
         engine.run(
-            symbols=["BTC/USD"],
+            symbols=symbols or ["BTC/USD"],
             data_type="trades",  # Use real-time trades
+            batch_size=64,  # Trades arrive in bursts: handle them together
+            batch_timeout_ms=2,
         )
 
     except KeyboardInterrupt:
         print("\n\nDry run stopped by user")
     except Exception as e:
         print(f"\n\n❌ Error: {e}")
-        import traceback
+        traceback.print_exception(e, limit=5, chain=False)
 
-        traceback.print_exc()
 
-
-def example_live_trading_paper():
+def example_live_trading_paper(
+    symbols: list[str] | None = None, assume_yes: bool = False
+):
     """Example 3: Run REAL live trading in PAPER mode."""
     print("\n\n" + "=" * 60)
     print("EXAMPLE 3: Live Paper Trading (Crypto)")
@@ -145,15 +254,24 @@ def example_live_trading_paper():
     print("Make sure you understand the risks and have tested in dry run mode first.")
     print("\nPress Ctrl+C to stop.\n")
 
-    response = input("Type 'YES' to continue with paper trading: ")
-    if response != "YES":
+    confirmed = assume_yes or (
+        sys.stdin.isatty()
+        and input("Type 'YES' to continue with paper trading: ") == "YES"
+    )
+    if not confirmed:
         print("Cancelled.")
         return
 
+    from AlpacaTrading.live.live_engine_crypto import (
+        LiveEngineConfig,
+        LiveTradingEngine,
+    )
+    from AlpacaTrading.strategies import MomentumStrategy
+    from AlpacaTrading.trading import RiskConfig, StopLossConfig
+
     try:
         # Configure Alpaca
-        alpaca_config = AlpacaConfig.from_env()
-        alpaca_config.crypto = True  # Enable crypto streaming
+        alpaca_config = load_alpaca_config()
 
         # Verify we're in paper mode
         if not alpaca_config.paper:
@@ -190,6 +308,8 @@ def example_live_trading_paper():
             enable_stop_loss=True,
             log_orders=True,
             order_log_path="paper_crypto_orders.csv",
+            log_backend="background",
+            use_uvloop=True,
         )
 
         # Create strategy
@@ -203,22 +323,44 @@ def example_live_trading_paper():
         # Create engine
         engine = LiveTradingEngine(engine_config, strategy)
 
+        _pin_to_cpu()
+
         # Run (blocking call - press Ctrl+C to stop)
-        print("Starting engine for BTC/USD...")
-        engine.run(symbols=["BTC/USD"], data_type="trades")
+        symbols = symbols or ["BTC/USD"]
+        print(f"Starting engine for {', '.join(symbols)}...")
+        engine.run(
+            symbols=symbols, data_type="trades", batch_size=64, batch_timeout_ms=2
+        )
 
     except KeyboardInterrupt:
         print("\n\nPaper trading stopped by user")
     except Exception as e:
         print(f"\n\n❌ Error: {e}")
-        import traceback
+        traceback.print_exception(e, limit=5, chain=False)
+
+
+def _warm_up():
+    """Import the trading stack in the background."""
+    for module in ("AlpacaTrading.live.live_engine_crypto", "AlpacaTrading.strategies"):
+        importlib.import_module(module)
 
-        traceback.print_exc()
 
+def run_example(
+    choice: str, symbols: list[str] | None = None, assume_yes: bool = False
+):
+    """Run one example by menu number."""
+    if choice == "1":
+        example_alpaca_connection()
+    elif choice == "2":
+        example_live_trading_dry_run(symbols, assume_yes)
+    elif choice == "3":
+        example_live_trading_paper(symbols, assume_yes)
 
-def main():
-    """Run all examples (interactive)."""
-    print("""
+
+class ExampleMenu(cmd.Cmd):
+    """Interactive example menu, with input history kept across sessions."""
+
+    intro = """
 ╔══════════════════════════════════════════════════════════╗
 ║      LIVE CRYPTO TRADING WITH ALPACA - EXAMPLES          ║
 ╚══════════════════════════════════════════════════════════╝
@@ -230,29 +372,84 @@ Choose an example to run:
 3. Paper Trading (⚠️  submits real paper orders)
 
 0. Exit
-    """)
-
-    while True:
-        choice = input("\nEnter your choice (0-3): ").strip()
-
-        if choice == "0":
-            print("\nGoodbye!")
-            break
-        elif choice == "1":
-            example_alpaca_connection()
-        elif choice == "2":
-            example_live_trading_dry_run()
-        elif choice == "3":
-            example_live_trading_paper()
-        else:
-            print("Invalid choice. Please enter 0-3.")
+"""
+    prompt = "\nEnter your choice (0-3): "
+
+    def __init__(self, symbols: list[str] | None, assume_yes: bool):
+        super().__init__()
+        self.symbols = symbols
+        self.assume_yes = assume_yes
+
+    def preloop(self):
+        if readline is not None:
+            try:
+                readline.read_history_file(HISTORY_FILE)
+            except OSError:
+                pass  # No history yet
+
+    def postloop(self):
+        if readline is not None:
+            readline.write_history_file(HISTORY_FILE)
+
+    def do_1(self, arg):
+        """Test Alpaca connection (read-only)."""
+        run_example("1", self.symbols, self.assume_yes)
+
+    def do_2(self, arg):
+        """Live trading dry run (no orders submitted)."""
+        run_example("2", self.symbols, self.assume_yes)
+
+    def do_3(self, arg):
+        """Paper trading (submits paper orders)."""
+        run_example("3", self.symbols, self.assume_yes)
+
+    def do_0(self, arg):
+        """Exit."""
+        print("\nGoodbye!")
+        return True
+
+    do_EOF = do_0
+
+    def emptyline(self):
+        """Ignore empty input rather than repeating the last example."""
+
+    def default(self, line):
+        print("Invalid choice. Please enter 0-3.")
+
+
+def main(argv: list[str] | None = None):
+    """Run an example from the command line, or pick one interactively."""
+    parser = argparse.ArgumentParser(
+        description="Live crypto trading with Alpaca examples"
+    )
+    parser.add_argument(
+        "--example",
+        choices=["1", "2", "3"],
+        help="Example to run; omit for the interactive menu",
+    )
+    parser.add_argument(
+        "--symbols", nargs="+", help="Symbols to trade (default: BTC/USD)"
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompts, including the paper trading 'YES' gate",
+    )
+    args = parser.parse_args(argv)
+
+    if args.example is not None:
+        run_example(args.example, args.symbols, args.yes)
+        return
+    if not sys.stdin.isatty():
+        parser.error("--example is required when stdin is not a terminal")
 
+    threading.Thread(target=_warm_up, daemon=True).start()
+    ExampleMenu(args.symbols, args.yes).cmdloop()
 
-if __name__ == "__main__":
-    # Check if .env exists
-    import os
 
-    if not os.path.exists(".env"):
+if __name__ == "__main__":
+    # Check if .env exists (a single access() call, no stat result to build)
+    if not os.access(".env", os.F_OK):
         print("❌ ERROR: .env file not found!")
         print("\nPlease create a .env file with your Alpaca credentials:")
         print("  APCA_API_KEY_ID=...")
@@ -17,15 +17,30 @@ Usage:
 
     # Live trading (CAREFUL!)
     python examples/live_trading_with_safety.py --symbols AAPL MSFT --live
+
+    # Continue from the portfolio state saved by the previous run
+    python examples/live_trading_with_safety.py --symbols AAPL MSFT --resume
+
+Portfolio state (cash, positions, high water mark) is saved to
+.alpaca_cache/portfolio_state.json in the project root. It is only restored
+with --resume, and only if it was saved with the same --cash.
 """
 
 import argparse
 import logging
+import math
+import os
 import signal
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path
 BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
@@ -35,6 +50,7 @@ from AlpacaTrading.live import (
     AlpacaConfig,
     AlpacaTrader,
 )
+from AlpacaTrading.models import MarketDataPoint, OrderSide
 from AlpacaTrading.strategies.adaptive_portfolio import AdaptivePortfolioStrategy
 from AlpacaTrading.strategies.momentum import MomentumStrategy
 from AlpacaTrading.strategies.rsi_strategy import RSIStrategy
@@ -48,6 +64,71 @@ from AlpacaTrading.trading import (
 
 logger = logging.getLogger(__name__)
 
+QUOTE_TTL_SECONDS = 1.0
+ACCOUNT_TTL_SECONDS = 30.0
+
+# Saved on every metrics log and at shutdown, restored with --resume
+PORTFOLIO_STATE_FILE = BASE_DIR / ".alpaca_cache" / "portfolio_state.json"
+
+# Orders from one tick are submitted concurrently, up to this many at once
+ORDER_SUBMIT_WORKERS = 8
+
+# Sub-strategies of the adaptive portfolio, bound to their hyperparameters once.
+# Strategies keep per-symbol state, so each trader still builds fresh instances.
+STRATEGY_FACTORIES = {
+    "Momentum": partial(MomentumStrategy, lookback_period=20, momentum_threshold=0.02),
+    "RSI": partial(
+        RSIStrategy, rsi_period=14, oversold_threshold=30, overbought_threshold=70
+    ),
+    "BollingerBreakout": partial(
+        BollingerBandsStrategy, period=20, num_std_dev=2.0, mode="breakout"
+    ),
+}
+
+# Order validation limits (RiskConfig is frozen, so one instance is shared)
+ORDER_RISK_CONFIG = RiskConfig(
+    max_position_size=100,
+    max_position_value=10_000,
+    max_total_exposure=50_000,
+    max_orders_per_minute=20,
+    min_cash_buffer=1_000,
+)
+
+
+class TTLCache:
+    """Tiny key -> value cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self):
+        self._entries: dict = {}
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired."""
+        value, expires = self._entries.get(key, (None, 0.0))
+        return value if time.monotonic() < expires else None
+
+    def set(self, key, value, ttl: float):
+        self._entries[key] = (value, time.monotonic() + ttl)
+
+
+class TokenBucket:
+    """Rate limiter: refills at `rate` tokens/second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def consume(self, n: float = 1) -> bool:
+        """Take n tokens if available; return False (taking none) otherwise."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= n:
+            self.tokens -= n
+            return True
+        return False
+
 
 class SafeLiveTrader:
     """
@@ -66,6 +147,7 @@ class SafeLiveTrader:
         initial_cash: float = 100_000,
         dry_run: bool = True,
         paper: bool = True,
+        resume: bool = False,
     ):
         """
         Initialize safe live trader.
@@ -75,6 +157,7 @@ class SafeLiveTrader:
             initial_cash: Starting capital
             dry_run: If True, don't submit orders (just log)
             paper: Use paper trading (only if dry_run=False)
+            resume: Restore portfolio state saved by a previous run
         """
         self.symbols = symbols
         self.initial_cash = initial_cash
@@ -89,6 +172,25 @@ class SafeLiveTrader:
         self.alpaca_config = AlpacaConfig.from_env()
         self.trader = AlpacaTrader(self.alpaca_config)
         self.portfolio = TradingPortfolio(initial_cash=initial_cash)
+        restored = resume and self.portfolio.load_state(PORTFOLIO_STATE_FILE)
+        if restored:
+            logger.info(f"Restored portfolio state from {PORTFOLIO_STATE_FILE}")
+
+        # Integer ID per symbol; prices are kept in an array indexed by it
+        self._sym_id = {symbol: i for i, symbol in enumerate(dict.fromkeys(symbols))}
+        self._id_sym = list(self._sym_id)
+
+        # Latest ask per symbol ID (NaN until quoted), written by the stream thread
+        self.current_prices = np.full(len(self._id_sym), np.nan)
+        self._stream_thread: threading.Thread | None = None
+
+        # REST fallbacks (quotes not yet streamed, account info) are TTL-cached
+        self._rest_cache = TTLCache()
+
+        # Worker threads that submit a tick's orders in parallel
+        self._order_pool = ThreadPoolExecutor(
+            max_workers=ORDER_SUBMIT_WORKERS, thread_name_prefix="order-submit"
+        )
 
         # Create strategy
         self.strategy = self._create_strategy()
@@ -103,23 +205,25 @@ class SafeLiveTrader:
             enable_circuit_breaker=True,  # Enable kill switch
         )
         self.risk_manager = RiskManager(self.risk_config, initial_cash)
+        if restored:
+            # Drawdown is measured from the restored peak, daily loss from now
+            self.risk_manager.high_water_mark = self.portfolio.high_water_mark
+            self.risk_manager.reset_daily_tracking(self.portfolio.get_total_value())
 
         # Order validation
-        self.order_risk_config = RiskConfig(
-            max_position_size=100,
-            max_position_value=10_000,
-            max_total_exposure=50_000,
-            max_orders_per_minute=20,
-            min_cash_buffer=1_000,
+        self.order_risk_config = ORDER_RISK_CONFIG
+        orders_per_minute = self.order_risk_config.max_orders_per_minute
+        self._order_bucket = TokenBucket(
+            rate=orders_per_minute / 60.0, capacity=orders_per_minute
         )
 
         # Track metrics logging
-        self.last_metrics_log = datetime.now()
+        self.last_metrics_log = time.monotonic()
         self.metrics_log_interval_seconds = 300  # Log every 5 minutes
 
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Shutdown flag, set from the signal thread or stop()
+        self._shutdown = threading.Event()
+        self._start_signal_thread()
 
         logger.info("=" * 80)
         logger.info("SAFE LIVE TRADER INITIALIZED")
@@ -132,15 +236,7 @@ class SafeLiveTrader:
 
     def _create_strategy(self) -> AdaptivePortfolioStrategy:
         """Create adaptive portfolio with multiple strategies."""
-        strategies = {
-            "Momentum": MomentumStrategy(lookback_period=20, momentum_threshold=0.02),
-            "RSI": RSIStrategy(
-                rsi_period=14, oversold_threshold=30, overbought_threshold=70
-            ),
-            "BollingerBreakout": BollingerBandsStrategy(
-                period=20, num_std_dev=2.0, mode="breakout"
-            ),
-        }
+        strategies = {name: build() for name, build in STRATEGY_FACTORIES.items()}
 
         return AdaptivePortfolioStrategy(
             strategies=strategies,
@@ -148,48 +244,114 @@ class SafeLiveTrader:
             allocation_method="sharpe",  # Sharpe-based allocation
         )
 
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully."""
+    async def _on_quote(self, quote: dict):
+        """Record the latest ask from a raw streamed quote."""
+        ask = quote["ap"]
+        if ask > 0:
+            self.current_prices[self._sym_id[quote["S"]]] = ask
+
+    def _latest_ask(self, symbol: str) -> float:
+        """Latest ask over REST, for symbols the stream has not quoted yet."""
+        ask = self._rest_cache.get(("quote", symbol))
+        if ask is None:
+            ask = self.trader.get_latest_quote(symbol)["ask_price"]
+            self._rest_cache.set(("quote", symbol), ask, QUOTE_TTL_SECONDS)
+        return ask
+
+    def _get_account(self) -> dict:
+        """Account info, cached for ACCOUNT_TTL_SECONDS."""
+        account = self._rest_cache.get(("account",))
+        if account is None:
+            account = self.trader.get_account()
+            self._rest_cache.set(("account",), account, ACCOUNT_TTL_SECONDS)
+        return account
+
+    def _start_quote_stream(self):
+        """Stream quotes for all symbols over one websocket, in a background thread."""
+        self.trader.data_stream.subscribe_quotes(self._on_quote, *self.symbols)
+        self._stream_thread = threading.Thread(
+            target=self.trader.data_stream.run, name="quote-stream", daemon=True
+        )
+        self._stream_thread.start()
+
+    def _start_signal_thread(self):
+        """
+        Handle SIGINT/SIGTERM on a dedicated thread via sigwait.
+
+        The signals are blocked here, before any other thread is started, so
+        every thread inherits the mask and only the sigwait thread receives
+        them. Shutdown code then runs as ordinary thread code rather than
+        inside an asynchronous handler that could interrupt the main thread
+        while it holds the logging or HTTP client locks.
+
+        A second signal once shutdown has begun exits the process at once,
+        so a hung shutdown can still be interrupted with Ctrl+C.
+        """
+        signals = {signal.SIGINT, signal.SIGTERM}
+        if not hasattr(signal, "pthread_sigmask"):  # Windows
+            for sig in signals:
+                signal.signal(sig, lambda signum, frame: self._on_signal(signum))
+            return
+
+        signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+        threading.Thread(
+            target=self._sigwait_loop, args=(signals,), name="signals", daemon=True
+        ).start()
+
+    def _sigwait_loop(self, signals: set[signal.Signals]):
+        """Wait for shutdown signals for the life of the process."""
+        while True:
+            self._on_signal(signal.sigwait(signals))
+
+    def _on_signal(self, signum: int):
+        """Start a graceful shutdown, or exit now if one is already underway."""
+        if self._shutdown.is_set():
+            logger.critical(f"Received signal {signum} again - exiting immediately")
+            os._exit(128 + signum)
+
         logger.warning(
             f"\n⚠️ Received signal {signum} - initiating graceful shutdown..."
         )
-        self.stop()
+        self._shutdown.set()
 
-    def _log_metrics_if_needed(self):
+    def _log_metrics_if_needed(self, portfolio_value: float):
         """Log portfolio metrics periodically."""
-        now = datetime.now()
-        elapsed = (now - self.last_metrics_log).total_seconds()
+        now = time.monotonic()
 
-        if elapsed >= self.metrics_log_interval_seconds:
+        if now - self.last_metrics_log >= self.metrics_log_interval_seconds:
             self.portfolio.log_metrics()
+            self.portfolio.save_state(PORTFOLIO_STATE_FILE)
             self.last_metrics_log = now
 
-            # Log summary
+            if not logger.isEnabledFor(logging.INFO):
+                return
+
+            # Log summary as one record
             metrics = self.portfolio.get_performance_metrics()
-            logger.info("📊 PORTFOLIO METRICS:")
             logger.info(
-                f"  Value: ${self.portfolio.get_total_value():,.2f} "
-                f"({metrics['total_return']:+.2f}%)"
-            )
-            logger.info(
-                f"  P&L: ${metrics['total_pnl']:,.2f} "
-                f"(Realized: ${metrics['realized_pnl']:,.2f})"
-            )
-            logger.info(
-                f"  Drawdown: {metrics['current_drawdown']:.2f}% "
-                f"(Max: {metrics['max_drawdown']:.2f}%)"
-            )
-            logger.info(
-                f"  Trades: {metrics['num_trades']} "
-                f"(Win Rate: {metrics['win_rate']:.1f}%)"
+                "📊 PORTFOLIO METRICS:\n"
+                "  Value: $%s (%+.2f%%)\n"
+                "  P&L: $%s (Realized: $%s)\n"
+                "  Drawdown: %.2f%% (Max: %.2f%%)\n"
+                "  Trades: %d (Win Rate: %.1f%%)",
+                format(portfolio_value, ",.2f"),
+                metrics["total_return"],
+                format(metrics["total_pnl"], ",.2f"),
+                format(metrics["realized_pnl"], ",.2f"),
+                metrics["current_drawdown"],
+                metrics["max_drawdown"],
+                metrics["num_trades"],
+                metrics["win_rate"],
             )
 
-    def _check_safety(self, current_prices: dict[str, float]) -> bool:
+    def _check_safety(self, portfolio_value: float) -> bool:
         """
-        Check all safety conditions before trading.
+        Check portfolio-level safety conditions before trading.
+
+        Position stops are checked per symbol in the trading loop.
 
         Args:
-            current_prices: Current market prices
+            portfolio_value: Total portfolio value for this tick
 
         Returns:
             True if safe to trade, False if should halt
@@ -200,30 +362,26 @@ class SafeLiveTrader:
             logger.critical(f"Reason: {self.risk_manager.get_status()}")
             return False
 
-        # Check portfolio stops
-        portfolio_value = self.portfolio.get_total_value()
-        stop_orders = self.risk_manager.check_stops(
-            current_prices=current_prices,
-            portfolio_value=portfolio_value,
-            positions=self.portfolio.positions,
+        # Exit everything if the breaker trips now
+        exit_orders = self.risk_manager.check_circuit_breaker(
+            portfolio_value, self.portfolio.positions
         )
-
-        # Execute stop orders if any
-        if stop_orders:
-            logger.warning(f"⚠️ {len(stop_orders)} STOP-LOSS ORDERS TRIGGERED")
-            for order in stop_orders:
-                self._execute_order(order, is_stop_loss=True)
-                self.risk_manager.remove_position_stop(order.symbol)
+        if exit_orders:
+            logger.warning(f"⚠️ {len(exit_orders)} STOP-LOSS ORDERS TRIGGERED")
+            self._execute_orders(exit_orders, is_stop_loss=True)
 
         return True
 
-    def _execute_order(self, order, is_stop_loss: bool = False):
+    def _execute_order(self, order, is_stop_loss: bool = False) -> bool:
         """
         Execute an order with safety checks.
 
         Args:
             order: Order to execute
             is_stop_loss: True if this is a stop-loss exit order
+
+        Returns:
+            True if the order was submitted (or logged, in dry run mode)
         """
         label = "STOP-LOSS" if is_stop_loss else "STRATEGY"
 
@@ -232,7 +390,7 @@ class SafeLiveTrader:
                 f"[DRY RUN] {label} ORDER: {order.side.value} "
                 f"{order.quantity} {order.symbol}"
             )
-            return
+            return True
 
         try:
             # Submit to Alpaca
@@ -241,26 +399,57 @@ class SafeLiveTrader:
                 f"{order.quantity} {order.symbol}"
             )
 
-            # Convert to Alpaca order
-            alpaca_side = (
-                AlpacaOrderSide.BUY
-                if order.side == OrderSide.BUY
-                else AlpacaOrderSide.SELL
-            )
+            submitted = self.trader.submit_order(order)
+            logger.info(f"✓ Order submitted: {submitted['id']}")
+            return True
 
-            market_order = MarketOrderRequest(
-                symbol=order.symbol,
-                qty=order.quantity,
-                side=alpaca_side,
-                time_in_force=TimeInForce.DAY,
-            )
+        except Exception as e:
+            # One line per failure; a rejected order is not a crash
+            logger.error("❌ %s order for %s failed: %s", label, order.symbol, e)
+            return False
 
-            # Submit order
-            submitted = self.trader.trading_client.submit_order(market_order)
-            logger.info(f"✓ Order submitted: {submitted.id}")
+    def _execute_orders(self, orders, is_stop_loss: bool = False) -> list:
+        """
+        Execute a batch of orders, submitting them concurrently.
 
-        except Exception as e:
-            logger.error(f"❌ Order failed: {e}", exc_info=True)
+        Each order is a separate HTTPS round trip to Alpaca, so submitting
+        them one after another would delay the last order by the sum of all
+        the round trips. Returns once every order has been handled.
+
+        Strategy orders beyond max_orders_per_minute are dropped here rather
+        than sent to be rejected. Stop-loss exits are never rate limited.
+
+        Args:
+            orders: Orders to execute
+            is_stop_loss: True if these are stop-loss exit orders
+
+        Returns:
+            The orders that were submitted, without dropped or failed ones
+        """
+        if not is_stop_loss:
+            allowed = []
+            for order in orders:
+                if self._order_bucket.consume():
+                    allowed.append(order)
+                else:
+                    logger.warning(
+                        "⚠️ Order rate limit reached; dropping %s %s %s",
+                        order.side.value,
+                        order.quantity,
+                        order.symbol,
+                    )
+            orders = allowed
+
+        if len(orders) <= 1 or self.dry_run:
+            sent = [self._execute_order(order, is_stop_loss) for order in orders]
+        else:
+            # _execute_order logs its own failures and reports them as False
+            sent = list(
+                self._order_pool.map(
+                    partial(self._execute_order, is_stop_loss=is_stop_loss), orders
+                )
+            )
+        return [order for order, ok in zip(orders, sent) if ok]
 
     def run(self):
         """Run the trading loop."""
@@ -272,80 +461,102 @@ class SafeLiveTrader:
 
         try:
             # Get initial account value
-            account = self.trader.get_account()
+            account = self._get_account()
             logger.info(f"Account Value: ${float(account['portfolio_value']):,.2f}")
             logger.info(f"Buying Power: ${float(account['buying_power']):,.2f}\n")
 
+            # Quotes for every symbol arrive concurrently over one websocket
+            self._start_quote_stream()
+
             tick_count = 0
 
-            while self.running:
-                # Get current prices
-                current_prices = {}
-                for symbol in self.symbols:
+            # Bind the per-symbol calls once rather than per symbol per tick
+            id_sym = self._id_sym
+            latest_ask = self._latest_ask
+            update_price = self.portfolio.update_price
+            check_symbol_stop = self.risk_manager.check_symbol_stop
+            process_market_data = self.strategy.process_market_data
+            positions = self.portfolio.positions
+            warn = logger.warning
+
+            while not self._shutdown.is_set():
+                # Snapshot the latest streamed prices, by symbol ID
+                prices = self.current_prices.tolist()
+                for sym_id, price in enumerate(prices):
+                    if not math.isnan(price):
+                        continue
+                    symbol = id_sym[sym_id]
                     try:
-                        # Get latest quote
-                        quote = self.trader.get_latest_quote(symbol)
-                        current_prices[symbol] = quote["ask_price"]
+                        prices[sym_id] = latest_ask(symbol)
                     except Exception as e:
-                        logger.warning(f"Failed to get price for {symbol}: {e}")
-                        continue
+                        warn("Failed to get price for %s: %s", symbol, e)
 
-                if not current_prices:
+                if all(math.isnan(price) for price in prices):
                     logger.warning("No price data available, sleeping...")
-                    import time
-
-                    time.sleep(10)
+                    self._shutdown.wait(10)
                     continue
 
+                # Value the portfolio once per tick and share it below
+                tick_count += 1
+                portfolio_value = self.portfolio.get_total_value_cached(tick_count)
+
                 # Safety check BEFORE generating signals
-                if not self._check_safety(current_prices):
+                if not self._check_safety(portfolio_value):
                     logger.critical("Safety check failed - stopping trading")
                     break
 
-                # Generate strategy signals (simplified for example)
-                # In real implementation, you'd stream actual tick data
-                for symbol, price in current_prices.items():
-                    from AlpacaTrading.models import MarketDataPoint
+                # One pass per symbol: mark, check its stop, then run the
+                # strategy (simplified for example; in a real implementation
+                # you'd stream actual tick data)
+                stop_orders = []
+                tick_orders = []
+                tick_time = datetime.now()  # One timestamp for the whole tick
+                for symbol, price in zip(id_sym, prices):
+                    if math.isnan(price):
+                        continue
+
+                    update_price(symbol, price)
+
+                    stop_order = check_symbol_stop(symbol, price, positions.get(symbol))
+                    if stop_order is not None:
+                        stop_orders.append(stop_order)
+                        continue  # Exiting; no new signals for this symbol
 
                     tick = MarketDataPoint(
-                        timestamp=datetime.now(),
+                        timestamp=tick_time,
                         symbol=symbol,
                         price=price,
                         volume=0,
                     )
 
                     # Generate orders from strategy
-                    orders = self.strategy.process_market_data(tick, self.portfolio)
-
-                    # Execute orders
-                    for order in orders:
-                        self._execute_order(order)
-
-                        # Add stop for new positions
-                        if order.side == OrderSide.BUY:
-                            self.risk_manager.add_position_stop(
-                                symbol=order.symbol,
-                                entry_price=price,
-                                quantity=order.quantity,
-                            )
-
-                # Update portfolio prices
-                self.portfolio.update_prices(current_prices)
+                    tick_orders.extend(process_market_data(tick, self.portfolio))
+
+                # Execute this tick's orders together, exits first
+                if stop_orders:
+                    logger.warning(f"⚠️ {len(stop_orders)} STOP-LOSS ORDERS TRIGGERED")
+                    self._execute_orders(stop_orders, is_stop_loss=True)
+                submitted = self._execute_orders(tick_orders)
+
+                # Add stops for new positions (never for dropped or failed orders)
+                for order in submitted:
+                    if order.side == OrderSide.BUY:
+                        self.risk_manager.add_position_stop(
+                            symbol=order.symbol,
+                            entry_price=prices[self._sym_id[order.symbol]],
+                            quantity=order.quantity,
+                        )
 
                 # Log metrics periodically
-                self._log_metrics_if_needed()
-
-                tick_count += 1
+                self._log_metrics_if_needed(
+                    self.portfolio.get_total_value_cached(tick_count)
+                )
 
-                # Sleep between iterations
-                import time
+                # Sleep between iterations, waking early on shutdown
+                self._shutdown.wait(60)  # Check every minute
 
-                time.sleep(60)  # Check every minute
-
-        except KeyboardInterrupt:
-            logger.warning("\n⚠️ Interrupted by user")
-        except Exception as e:
-            logger.error(f"❌ Fatal error: {e}", exc_info=True)
+        except Exception:
+            logger.exception("❌ Fatal error")
         finally:
             self.stop()
 
@@ -359,9 +570,16 @@ class SafeLiveTrader:
         logger.info("=" * 80)
 
         self.running = False
+        self._shutdown.set()
+        self._order_pool.shutdown(wait=True)
 
-        # Final metrics log
+        # Stop the quote stream
+        if self._stream_thread is not None:
+            self.trader.data_stream.stop()
+
+        # Final metrics log and state snapshot
         self.portfolio.log_metrics()
+        self.portfolio.save_state(PORTFOLIO_STATE_FILE)
 
         # Strategy cleanup
         self.strategy.on_end(self.portfolio)
@@ -410,6 +628,11 @@ def main():
         action="store_true",
         help="Use LIVE trading (default: paper trading)",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Restore portfolio state saved in {PORTFOLIO_STATE_FILE}",
+    )
 
     args = parser.parse_args()
 
@@ -433,6 +656,7 @@ def main():
         initial_cash=args.cash,
         dry_run=args.dry_run,
         paper=not args.live,
+        resume=args.resume,
     )
 
     return trader.run()
@@ -15,6 +15,8 @@ import logging
 from pathlib import Path
 import sys
 
+import numpy as np
+
 # Add src to path
 BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
@@ -168,7 +170,6 @@ def example_circuit_breaker():
 
     initial_value = 100_000
     risk_mgr = RiskManager(config, initial_portfolio_value=initial_value)
-    portfolio = TradingPortfolio(initial_cash=initial_value)
 
     print(f"\n✓ Portfolio initialized: ${initial_value:,.2f}")
     print(f"  Circuit breaker will trigger at: ${initial_value * 0.95:,.2f} (5% loss)")
@@ -176,26 +177,20 @@ def example_circuit_breaker():
     # Simulate portfolio losing value
     print("\n📉 Portfolio declining:")
 
-    portfolio_values = [98_000, 96_000, 94_000]  # -2%, -4%, -6%
-    for value in portfolio_values:
-        loss_pct = (initial_value - value) / initial_value * 100
+    portfolio_values = np.array([98_000, 96_000, 94_000])  # -2%, -4%, -6%
 
-        # Check circuit breaker
-        exit_orders = risk_mgr.check_stops(
-            current_prices={},
-            portfolio_value=value,
-            positions=portfolio.positions,
-        )
+    # Check the whole series at once; same result as checking value by value
+    breach = risk_mgr.check_circuit_breaker_batch(portfolio_values)
+    checked = portfolio_values if breach is None else portfolio_values[: breach + 1]
 
-        status = "🚨 CIRCUIT BREAKER TRIGGERED" if exit_orders else "✓ OK"
+    for i, value in enumerate(checked):
+        loss_pct = (initial_value - value) / initial_value * 100
+        status = "🚨 CIRCUIT BREAKER TRIGGERED" if i == breach else "✓ OK"
         print(f"  ${value:,} (-{loss_pct:.1f}%) → {status}")
 
-        if exit_orders:
-            print("\n⚠️ ALL TRADING HALTED")
-            print(
-                f"  Reason: Portfolio loss exceeded {config.portfolio_stop_pct}% limit"
-            )
-            break
+    if breach is not None:
+        print("\n⚠️ ALL TRADING HALTED")
+        print(f"  Reason: Portfolio loss exceeded {config.portfolio_stop_pct}% limit")
 
 
 def example_integration_with_strategy():
@@ -308,7 +308,7 @@ Examples:
     print(f"  Max drawdown:      {result.performance_metrics['max_drawdown']:.2f}%")
     print(f"  Sharpe ratio:      {result.performance_metrics['sharpe_ratio']:.2f}")
     print(f"  Win rate:          {result.performance_metrics['win_rate']:.2f}%")
-    print(f"  Total trades:      {result.performance_metrics['total_trades']}")
+    print(f"  Total trades:      {result.performance_metrics['num_trades']}")
     print("\nOUTPUT FILES:")
     print(f"  Orders:            {args.output_dir}/orders.csv")
     print(f"  Equity curve:      {args.output_dir}/equity_curve.csv")
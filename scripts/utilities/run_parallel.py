@@ -5,44 +5,188 @@ Parallel Strategy Runner - Execute multiple strategies concurrently.
 Runs multiple strategy configurations in parallel using multiprocessing.
 Useful for parameter optimization and strategy comparison.
 
+The data file is parsed once in the parent process. Worker processes read
+it from shared memory without a copy; worker threads (--executor thread)
+share the parsed arrays directly.
+
 Usage:
     python scripts/run_parallel.py --data data/equities/5min_bars.csv --configs momentum_aggressive rsi_scalper bb_breakout
     python scripts/run_parallel.py --data data/equities/5min_bars.csv --all-equities
 """
 
 import argparse
+import logging
 import sys
+import time
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from datetime import datetime
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from run_strategy import run_backtest
 from configs.strategy_configs import STRATEGY_CONFIGS, CRYPTO_CONFIGS
+from AlpacaTrading.gateway.data_gateway import DataGateway
+from AlpacaTrading.models import MarketData
+
+logger = logging.getLogger(__name__)
+
+# One record per tick; symbols are codes into MarketData.symbol_names
+SHARED_DTYPE = np.dtype(
+    [
+        ("timestamp", "datetime64[ns]"),
+        ("symbol", "int32"),
+        ("price", "float64"),
+        ("volume", "float64"),
+        ("utc_offset", "int32"),
+    ]
+)
 
 
-def run_single_backtest(args_tuple):
+def _load_shared(data_file: str, max_rows: int | None = None):
     """
-    Wrapper for running a single backtest (for multiprocessing).
+    Parse the data file once into a record array in shared memory.
 
     Args:
-        args_tuple: Tuple of (config_name, data_file, initial_cash, max_ticks, output_dir, asset_class)
+        data_file: Path to market data CSV
+        max_rows: Only load the first max_rows rows (default: all)
 
     Returns:
-        Tuple of (config_name, result_summary)
+        Tuple of (shm, spec). The caller owns shm and must close() and
+        unlink() it; spec is the picklable (name, shape, dtype, symbol_names,
+        tz_aware) that workers pass to _attach_shared().
+    """
+    market_data = DataGateway(data_file).load_market_data(max_rows)
+
+    shm = SharedMemory(
+        create=True, size=max(len(market_data), 1) * SHARED_DTYPE.itemsize
+    )
+    records = np.ndarray((len(market_data),), dtype=SHARED_DTYPE, buffer=shm.buf)
+    records["timestamp"] = market_data.timestamps
+    records["symbol"] = market_data.symbol_codes
+    records["price"] = market_data.prices
+    records["volume"] = market_data.volumes
+    tz_aware = market_data.utc_offsets is not None
+    if tz_aware:
+        records["utc_offset"] = market_data.utc_offsets
+
+    return shm, (
+        shm.name,
+        records.shape,
+        records.dtype,
+        market_data.symbol_names,
+        tz_aware,
+    )
+
+
+def _attach_shared(spec) -> tuple[SharedMemory, MarketData]:
+    """
+    Attach to the shared record array created by _load_shared().
+
+    The returned MarketData views the shared buffer, so it must be released
+    before shm.close() is called.
+    """
+    name, shape, dtype, symbol_names, tz_aware = spec
+    # The parent owns the block; don't let this process' tracker unlink it
+    shm = SharedMemory(name=name, track=False)
+    records = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    market_data = MarketData(
+        timestamps=records["timestamp"],
+        symbol_codes=records["symbol"],
+        prices=records["price"],
+        volumes=records["volume"],
+        symbol_names=symbol_names,
+        utc_offsets=records["utc_offset"] if tz_aware else None,
+    )
+    return shm, market_data
+
+
+def _configure_logging():
+    """
+    Show this script's progress lines, leaving the engines' INFO logs quiet.
+
+    Also run as the initializer of each worker process: under the spawn and
+    forkserver start methods workers don't inherit the parent's handlers.
     """
-    config_name, data_file, initial_cash, max_ticks, output_dir, asset_class = (
-        args_tuple
+    logging.basicConfig(
+        level=logging.WARNING, format="[%(asctime)s] %(message)s", datefmt="%H:%M:%S"
     )
+    logger.setLevel(logging.INFO)
+
+
+def _configure_logging():
+    """
+    Show this script's progress lines, leaving the engines' INFO logs quiet.
+
+    Also run as the initializer of each worker process: under the spawn and
+    forkserver start methods workers don't inherit the parent's handlers.
+    """
+    logging.basicConfig(
+        level=logging.WARNING, format="[%(asctime)s] %(message)s", datefmt="%H:%M:%S"
+    )
+    logger.setLevel(logging.INFO)
+
+
+def _get_executor(kind: str, max_workers: int | None) -> Executor:
+    """
+    Create the pool that runs the backtests.
+
+    The backtest loop is pure Python, so threads only run in parallel on a
+    free-threaded interpreter; "auto" picks threads there and processes
+    everywhere else.
 
+    Args:
+        kind: 'auto', 'process' or 'thread'
+        max_workers: Maximum parallel workers (default: CPU count)
+    """
+    if kind == "auto":
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        kind = "process" if gil_enabled else "thread"
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_configure_logging)
+
+
+def run_single_backtest(args_tuple):
+    """
+    Wrapper for running a single backtest (in a worker process or thread).
+
+    Args:
+        args_tuple: Tuple of (config_name, data_file, shared_data, initial_cash,
+            max_ticks, output_dir, asset_class), where shared_data is either
+            the MarketData itself (threads) or the spec from
+            _load_shared(data_file) (processes)
+
+    Returns:
+        Tuple of (config_name, result_summary)
+    """
+    (
+        config_name,
+        data_file,
+        shared_data,
+        initial_cash,
+        max_ticks,
+        output_dir,
+        asset_class,
+    ) = args_tuple
+
+    if isinstance(shared_data, MarketData):
+        shm, market_data = None, shared_data
+    else:
+        shm, market_data = _attach_shared(shared_data)
     try:
-        print(
-            f"\n[{datetime.now().strftime('%H:%M:%S')}] Starting backtest: {config_name}"
-        )
+        logger.info("Starting backtest: %s", config_name)
 
         # Run backtest
+        t0 = time.monotonic()
         result = run_backtest(
             config_name=config_name,
             data_file=data_file,
@@ -50,6 +194,7 @@ def run_single_backtest(args_tuple):
             max_ticks=max_ticks,
             output_dir=f"{output_dir}/{config_name}",
             asset_class=asset_class,
+            preloaded_data=market_data,
         )
 
         # Extract summary
@@ -60,20 +205,28 @@ def run_single_backtest(args_tuple):
             "sharpe_ratio": result.performance_metrics["sharpe_ratio"],
             "max_drawdown": result.performance_metrics["max_drawdown"],
             "win_rate": result.performance_metrics["win_rate"],
-            "total_trades": result.performance_metrics["total_trades"],
+            "total_trades": result.performance_metrics["num_trades"],
             "final_equity": result.portfolio.get_total_value(),
         }
 
-        print(
-            f"[{datetime.now().strftime('%H:%M:%S')}] Completed: {config_name} - Return: {summary['total_return']:.2f}%"
+        logger.info(
+            "Completed: %s in %.2fs - Return: %.2f%%",
+            config_name,
+            time.monotonic() - t0,
+            summary["total_return"],
         )
 
         return config_name, summary, None
 
     except Exception as e:
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR in {config_name}: {e}")
+        logger.error("ERROR in %s: %s", config_name, e)
         return config_name, None, str(e)
 
+    finally:
+        if shm is not None:
+            del market_data  # Release the views into shm before closing it
+            shm.close()
+
 
 def run_parallel_backtests(
     config_names: list[str],
@@ -83,6 +236,7 @@ def run_parallel_backtests(
     output_dir: str = "logs/parallel",
     asset_class: str = "equities",
     max_workers: int | None = None,
+    executor_kind: str = "auto",
 ):
     """
     Run multiple backtests in parallel.
@@ -95,10 +249,13 @@ def run_parallel_backtests(
         output_dir: Output directory
         asset_class: 'equities' or 'crypto'
         max_workers: Maximum parallel workers (default: CPU count)
+        executor_kind: 'process', 'thread', or 'auto' (see _get_executor)
 
     Returns:
         Dictionary of {config_name: summary_dict}
     """
+    executor = _get_executor(executor_kind, max_workers)
+
     print(f"\n{'=' * 80}")
     print("PARALLEL BACKTEST EXECUTION")
     print(f"{'=' * 80}")
@@ -107,12 +264,29 @@ def run_parallel_backtests(
     print(f"Initial cash: ${initial_cash:,.2f}")
     print(f"Max ticks: {max_ticks if max_ticks else 'All'}")
     print(f"Max workers: {max_workers if max_workers else 'Auto (CPU count)'}")
+    print(f"Executor: {type(executor).__name__}")
     print(f"Output dir: {output_dir}")
     print(f"{'=' * 80}\n")
 
+    # Parse the data once; workers attach to it instead of re-reading the file.
+    # Each row is one tick, so rows past max_ticks would never be replayed.
+    if isinstance(executor, ThreadPoolExecutor):
+        shm = None
+        shared_data = DataGateway(data_file).load_market_data(max_ticks)
+    else:
+        shm, shared_data = _load_shared(data_file, max_ticks)
+
     # Prepare arguments for each backtest
     backtest_args = [
-        (config_name, data_file, initial_cash, max_ticks, output_dir, asset_class)
+        (
+            config_name,
+            data_file,
+            shared_data,
+            initial_cash,
+            max_ticks,
+            output_dir,
+            asset_class,
+        )
         for config_name in config_names
     ]
 
@@ -120,31 +294,36 @@ def run_parallel_backtests(
     results = {}
     errors = {}
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        futures = {
-            executor.submit(run_single_backtest, args): args[0]
-            for args in backtest_args
-        }
+    try:
+        with executor:
+            # Submit all tasks
+            futures = {
+                executor.submit(run_single_backtest, args): args[0]
+                for args in backtest_args
+            }
 
-        # Collect results as they complete
-        for future in as_completed(futures):
-            config_name = futures[future]
-            try:
-                name, summary, error = future.result()
-                if error:
-                    errors[name] = error
-                else:
-                    results[name] = summary
-            except Exception as e:
-                print(f"ERROR in future for {config_name}: {e}")
-                errors[config_name] = str(e)
+            # Collect results as they complete
+            for future in as_completed(futures):
+                config_name = futures[future]
+                try:
+                    name, summary, error = future.result()
+                    if error:
+                        errors[name] = error
+                    else:
+                        results[name] = summary
+                except Exception as e:
+                    print(f"ERROR in future for {config_name}: {e}")
+                    errors[config_name] = str(e)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
 
     return results, errors
 
 
-def print_comparison(results: dict):
-    """Print comparison table of results."""
+def print_comparison(results: dict, output_dir: str = "logs/parallel"):
+    """Print comparison table of results and save it under output_dir."""
     print(f"\n{'=' * 80}")
     print("STRATEGY COMPARISON")
     print(f"{'=' * 80}\n")
@@ -193,7 +372,8 @@ def print_comparison(results: dict):
         ]
     )
 
-    csv_path = "logs/parallel/strategy_comparison.csv"
+    csv_path = Path(output_dir) / "strategy_comparison.csv"
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(csv_path, index=False)
     print(f"Comparison saved to: {csv_path}\n")
 
@@ -215,6 +395,9 @@ Examples:
 
   # Limit parallel workers
   python scripts/run_parallel.py --data data/equities/5min_bars.csv --all-equities --max-workers 4
+
+  # Run in threads instead of processes (pays off on free-threaded Python)
+  python scripts/run_parallel.py --data data/equities/5min_bars.csv --all-equities --executor thread
         """,
     )
 
@@ -245,9 +428,18 @@ Examples:
     parser.add_argument(
         "--max-workers", type=int, help="Maximum parallel workers (default: CPU count)"
     )
+    parser.add_argument(
+        "--executor",
+        choices=["auto", "process", "thread"],
+        default="auto",
+        help="Run backtests in processes or threads (default: auto, threads "
+        "only on a free-threaded Python build)",
+    )
 
     args = parser.parse_args()
 
+    _configure_logging()
+
     # Determine which configs to run
     if args.all_equities:
         config_names = list(STRATEGY_CONFIGS.keys())
@@ -276,11 +468,12 @@ Examples:
             output_dir=args.output_dir,
             asset_class=asset_class,
             max_workers=args.max_workers,
+            executor_kind=args.executor,
         )
 
         # Print comparison
         if results:
-            print_comparison(results)
+            print_comparison(results, args.output_dir)
 
         # Print errors
         if errors:
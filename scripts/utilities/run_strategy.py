@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from AlpacaTrading.backtesting.engine import BacktestEngine
 from AlpacaTrading.gateway.data_gateway import DataGateway
+from AlpacaTrading.models import MarketData
 from configs.strategy_configs import get_config, list_configs
 
 
@@ -43,6 +44,7 @@ def run_backtest(
     max_ticks: int | None = None,
     output_dir: str = "logs",
     asset_class: str = "equities",
+    preloaded_data: MarketData | None = None,
 ):
     """
     Run backtest with specified configuration.
@@ -54,6 +56,8 @@ def run_backtest(
         max_ticks: Maximum ticks to process (None = all)
         output_dir: Directory for logs and results
         asset_class: 'equities' or 'crypto'
+        preloaded_data: Already parsed contents of data_file (optional),
+            used instead of re-reading the file
 
     Returns:
         BacktestResult object
@@ -74,7 +78,7 @@ def run_backtest(
     print(f"{'=' * 80}\n")
 
     # Setup data gateway
-    data_gateway = DataGateway(data_file)
+    data_gateway = DataGateway(data_file, preloaded_data=preloaded_data)
 
     # Create output directory
     Path(output_dir).mkdir(parents=True, exist_ok=True)
@@ -108,7 +112,7 @@ def run_backtest(
     print(f"  Max drawdown:        {result.performance_metrics['max_drawdown']:.2f}%")
     print(f"  Sharpe ratio:        {result.performance_metrics['sharpe_ratio']:.2f}")
     print("\nTRADING METRICS:")
-    print(f"  Total trades:        {result.performance_metrics['total_trades']}")
+    print(f"  Total trades:        {result.performance_metrics['num_trades']}")
     print(f"  Win rate:            {result.performance_metrics['win_rate']:.2f}%")
     print(
         f"  Avg trade P&L:       ${result.performance_metrics.get('avg_trade_pnl', 0):,.2f}"
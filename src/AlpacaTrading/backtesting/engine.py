@@ -152,7 +152,9 @@ class BacktestEngine:
             # Update current market state
             self.current_tick = tick
             self.current_prices[tick.symbol] = tick.price
-            self.portfolio.update_prices(self.current_prices)
+            # Only this symbol's price moved; traded symbols are re-marked
+            # in _process_order, so the other positions are already current
+            self.portfolio.update_price(tick.symbol, tick.price)
             self.tick_count += 1
 
             # Strategy generates orders (with error handling wrapper)
@@ -238,6 +240,8 @@ class BacktestEngine:
         for trade in trades:
             self.portfolio.process_trade(trade)
             self.order_gateway.log_trade(trade, order)
+        if trades and order.symbol in self.current_prices:
+            self.portfolio.update_price(order.symbol, self.current_prices[order.symbol])
 
         # Log final order status
         if order.status.value == "FILLED":
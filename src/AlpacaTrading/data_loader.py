@@ -1,33 +1,39 @@
-import csv
-from datetime import datetime
+import dataclasses
 from pathlib import Path
 
+import numpy as np
+
+from .gateway.data_gateway import DataGateway
 from .models import MarketDataPoint
 
 
-def market_data_loader(data_file: str) -> list[MarketDataPoint]:
+def market_data_loader(
+    data_file: str, max_rows: int | None = None
+) -> list[MarketDataPoint]:
     """
     Parses market_data.csv into a list of MarketDataPoints
-    """
-    res = []
 
+    max_rows limits parsing to the first max_rows rows of the file (before
+    sorting), so a subsample never reads the rest of a large file.
+    """
     data_filepath = Path(data_file)
 
-    if data_filepath.exists():
-        with data_filepath.open(mode="r", newline="") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                timestamp = row["timestamp"]
-                symbol = row["symbol"]
-                price = float(row["price"])
-                data_point = MarketDataPoint(
-                    timestamp=datetime.fromisoformat(timestamp),
-                    symbol=symbol,
-                    price=price,
-                )
-                res.append(data_point)
-
-        res.sort(key=lambda x: x.timestamp)
-
-    return res
+    if not data_filepath.exists():
+        return []
+
+    # Parse column-wise (keeping each row's UTC offset), then build the points
+    # in one pass. Volume is not loaded, as with the row-by-row parser.
+    market_data = DataGateway(str(data_filepath)).load_market_data(max_rows)
+    # Tz-aware timestamps are stored as UTC, so this orders by instant
+    order = np.argsort(market_data.timestamps, kind="stable")
+    offsets = market_data.utc_offsets
+    market_data = dataclasses.replace(
+        market_data,
+        timestamps=market_data.timestamps[order],
+        symbol_codes=market_data.symbol_codes[order],
+        prices=market_data.prices[order],
+        volumes=np.zeros(len(order)),
+        utc_offsets=offsets[order] if offsets is not None else None,
+    )
+
+    return list(market_data)
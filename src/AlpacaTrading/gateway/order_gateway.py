@@ -8,6 +8,8 @@ import csv
 from datetime import datetime
 import logging
 from pathlib import Path
+import queue
+import threading
 
 from AlpacaTrading.models import Order, Trade
 
@@ -29,15 +31,20 @@ class OrderGateway:
     CSV Format:
     timestamp, event_type, order_id, symbol, side, order_type, quantity,
     price, status, filled_quantity, average_fill_price, message
+
+    With background=True, events are queued and written by a writer thread
+    that batches whatever has accumulated into a single write, keeping file
+    I/O off the trading path. Call close() when done to flush and stop it.
     """
 
-    def __init__(self, log_file: str, append: bool = False):
+    def __init__(self, log_file: str, append: bool = False, background: bool = False):
         """
         Initialize order gateway with log file.
 
         Args:
             log_file: Path to CSV log file
             append: If True, append to existing file. If False, create new file.
+            background: If True, write events from a background thread.
         """
         self.log_file = Path(log_file)
         self.append = append
@@ -49,6 +56,15 @@ class OrderGateway:
         if not append or not self.log_file.exists():
             self._write_header()
 
+        self._queue: queue.Queue | None = None
+        self._writer: threading.Thread | None = None
+        if background:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._drain_queue, name="order-log-writer", daemon=True
+            )
+            self._writer.start()
+
     def _write_header(self) -> None:
         """Write CSV header to log file."""
         with self.log_file.open("w", newline="") as f:
@@ -111,24 +127,63 @@ class OrderGateway:
             order: Order object
             message: Additional message or context
         """
+        row = [
+            datetime.now().isoformat(),
+            event_type,
+            order.order_id,
+            order.symbol,
+            order.side.value,
+            order.order_type.value,
+            order.quantity,
+            order.price if order.price is not None else "",
+            order.status.value,
+            order.filled_quantity,
+            order.average_fill_price,
+            message,
+        ]
+
+        if self._queue is not None:
+            self._queue.put(row)
+            return
+
         with self.log_file.open("a", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow(
-                [
-                    datetime.now().isoformat(),
-                    event_type,
-                    order.order_id,
-                    order.symbol,
-                    order.side.value,
-                    order.order_type.value,
-                    order.quantity,
-                    order.price if order.price is not None else "",
-                    order.status.value,
-                    order.filled_quantity,
-                    order.average_fill_price,
-                    message,
-                ]
-            )
+            writer.writerow(row)
+
+    def _drain_queue(self) -> None:
+        """Writer thread: append queued rows in batches until close()."""
+        with self.log_file.open("a", newline="") as f:
+            writer = csv.writer(f)
+            while True:
+                rows = [self._queue.get()]
+                # Batch up everything else already queued into one write
+                while True:
+                    try:
+                        rows.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                writer.writerows(row for row in rows if row is not None)
+                f.flush()
+                for _ in rows:
+                    self._queue.task_done()
+
+                if None in rows:  # Sentinel from close()
+                    return
+
+    def flush(self) -> None:
+        """Block until every queued event has been written to the log file."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending events and stop the background writer, if any."""
+        if self._queue is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._queue = None
+        self._writer = None
 
     def get_order_history(self, order_id: str | None = None) -> list[dict]:
         """
@@ -140,6 +195,7 @@ class OrderGateway:
         Returns:
             List of order event dictionaries
         """
+        self.flush()
         if not self.log_file.exists():
             return []
 
@@ -165,6 +221,7 @@ class OrderGateway:
             - rejected_orders: Orders rejected
             - fill_rate: Percentage of orders filled
         """
+        self.flush()
         if not self.log_file.exists():
             return {
                 "total_orders": 0,
@@ -212,6 +269,7 @@ class OrderGateway:
 
     def clear_log(self) -> None:
         """Clear the log file and write new header."""
+        self.flush()
         self._write_header()
 
     def __repr__(self) -> str:
@@ -0,0 +1,65 @@
+"""
+Vectorized price-series helpers shared by the data ingestion scripts.
+
+Both work on whole NumPy arrays at once; strategies that see one tick at a
+time keep their own incremental state instead.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+except ImportError:  # Optional; falls back to a numpy running sum
+    bn = None
+
+
+def moving_averages(values: np.ndarray, windows) -> list[np.ndarray]:
+    """
+    Simple moving averages for several windows, NaN until each is full.
+
+    Uses bottleneck's move_mean when it is installed. Otherwise each window
+    sum is the previous one plus the value entering the window minus the
+    one leaving it, read off a single cumulative sum shared by all windows,
+    so the cost is O(n) per window whatever its length. A NaN would poison
+    every later running sum, so NaN input goes through pandas' rolling mean.
+
+    Args:
+        values: Prices in time order
+        windows: Window lengths
+
+    Returns:
+        One array of averages per window, aligned with values
+    """
+    if bn is not None:
+        # bottleneck rejects windows longer than the series; those are all NaN
+        return [
+            bn.move_mean(values, window=w, min_count=w)
+            if w <= len(values)
+            else np.full(len(values), np.nan)
+            for w in windows
+        ]
+    if np.isnan(values).any():
+        series = pd.Series(values)
+        return [series.rolling(window=w).mean().to_numpy() for w in windows]
+
+    sums = np.cumsum(values, dtype=np.float64)
+    averages = []
+    for window in windows:
+        means = np.full(len(values), np.nan)
+        if len(values) >= window:
+            means[window - 1] = sums[window - 1]
+            means[window:] = sums[window:] - sums[:-window]
+            means[window - 1 :] /= window
+        averages.append(means)
+    return averages
+
+
+def simple_returns(values: np.ndarray) -> np.ndarray:
+    """One-period simple returns, NaN for the first value."""
+    returns = np.empty_like(values)
+    returns[:1] = np.nan
+    # Difference into the output buffer, then divide in place
+    np.subtract(values[1:], values[:-1], out=returns[1:])
+    np.divide(returns[1:], values[:-1], out=returns[1:])
+    return returns
@@ -4,14 +4,16 @@ Alpaca Live Trading Integration.
 Provides real-time market data streaming and order execution via Alpaca API.
 """
 
+import asyncio
 import logging
 import os
 from dataclasses import dataclass
 from typing import Any, Callable
 
 from alpaca.data.enums import DataFeed  # Import DataFeed enum
+from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.live import StockDataStream
-from alpaca.data.models import Bar, Quote, Trade
+from alpaca.data.requests import StockLatestQuoteRequest
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import (
     OrderSide as AlpacaOrderSide,
@@ -36,8 +38,17 @@ from AlpacaTrading.models import (
 
 logger = logging.getLogger(__name__)
 
+# alpaca-py's websocket defaults, plus compression off: market data messages
+# are small msgpack frames, so permessage-deflate only adds an inflate per frame
+STREAM_WEBSOCKET_PARAMS = {
+    "ping_interval": 10,
+    "ping_timeout": 180,
+    "max_queue": 1024,
+    "compression": None,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AlpacaConfig:
     """
     Configuration for Alpaca API connection.
@@ -55,7 +66,7 @@ class AlpacaConfig:
     feed: DataFeed = DataFeed.IEX
 
     @classmethod
-    def from_env(cls) -> "AlpacaConfig":
+    def from_env(cls, **overrides) -> "AlpacaConfig":
         """
         Load configuration from environment variables.
 
@@ -64,6 +75,9 @@ class AlpacaConfig:
         - APCA_API_SECRET_KEY
         - ALPACA_PAPER (optional, default: true)
 
+        Args:
+            **overrides: Field values that take precedence over the environment
+
         Returns:
             AlpacaConfig instance
         """
@@ -79,7 +93,14 @@ class AlpacaConfig:
                 "Set APCA_API_KEY_ID and APCA_API_SECRET_KEY in .env file"
             )
 
-        return cls(api_key=api_key, secret_key=secret_key, paper=paper)
+        return cls(
+            **{
+                "api_key": api_key,
+                "secret_key": secret_key,
+                "paper": paper,
+                **overrides,
+            }
+        )
 
 
 class AlpacaTrader:
@@ -122,9 +143,19 @@ class AlpacaTrader:
             api_key=config.api_key, secret_key=config.secret_key, paper=config.paper
         )
 
+        self.data_client = StockHistoricalDataClient(
+            api_key=config.api_key, secret_key=config.secret_key
+        )
+
         logger.debug("Initialize data stream")
+        # raw_data: handlers get the decoded msgpack dicts, skipping the
+        # per-message pydantic models we would only convert again
         self.data_stream = StockDataStream(
-            api_key=config.api_key, secret_key=config.secret_key, feed=config.feed
+            api_key=config.api_key,
+            secret_key=config.secret_key,
+            feed=config.feed,
+            raw_data=True,
+            websocket_params=STREAM_WEBSOCKET_PARAMS,
         )
 
         # Track streaming state
@@ -174,6 +205,29 @@ class AlpacaTrader:
             for pos in positions
         ]
 
+    def get_latest_quote(self, symbol: str) -> dict:
+        """
+        Get the latest quote for a symbol over REST.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Dictionary with bid/ask prices and sizes and the quote timestamp
+        """
+        request = StockLatestQuoteRequest(
+            symbol_or_symbols=symbol, feed=self.config.feed
+        )
+        quote = self.data_client.get_stock_latest_quote(request)[symbol]
+        return {
+            "symbol": symbol,
+            "bid_price": float(quote.bid_price),
+            "ask_price": float(quote.ask_price),
+            "bid_size": float(quote.bid_size),
+            "ask_size": float(quote.ask_size),
+            "timestamp": quote.timestamp,
+        }
+
     def submit_order(self, order: Order) -> dict:
         """
         Submit order to Alpaca.
@@ -312,65 +366,65 @@ class AlpacaTrader:
             for order in orders
         ]
 
-    async def _handle_trade(self, trade: Trade):
+    async def _handle_trade(self, trade: dict):
         """
         Handle incoming trade data.
 
         Args:
-            trade: Trade data from Alpaca
+            trade: Raw trade message from Alpaca ("S" symbol, "p" price, "s" size)
         """
         if self.data_callback is None:
             return
 
         # Convert to MarketDataPoint
         tick = MarketDataPoint(
-            timestamp=trade.timestamp,
-            symbol=trade.symbol,
-            price=float(trade.price),
-            volume=float(trade.size),
+            timestamp=trade["t"].to_datetime(),
+            symbol=trade["S"],
+            price=float(trade["p"]),
+            volume=float(trade["s"]),
         )
 
         # Call user callback
         self.data_callback(tick)
 
-    async def _handle_quote(self, quote: Quote):
+    async def _handle_quote(self, quote: dict):
         """
         Handle incoming quote data.
 
         Args:
-            quote: Quote data from Alpaca
+            quote: Raw quote message from Alpaca ("bp" bid, "ap" ask price)
         """
         if self.data_callback is None:
             return
 
         # Use mid-price for quotes
-        mid_price = (float(quote.bid_price) + float(quote.ask_price)) / 2
+        mid_price = (float(quote["bp"]) + float(quote["ap"])) / 2
 
         tick = MarketDataPoint(
-            timestamp=quote.timestamp,
-            symbol=quote.symbol,
+            timestamp=quote["t"].to_datetime(),
+            symbol=quote["S"],
             price=mid_price,
             volume=0,  # Quotes don't have volume
         )
 
         self.data_callback(tick)
 
-    async def _handle_bar(self, bar: Bar):
+    async def _handle_bar(self, bar: dict):
         """
         Handle incoming bar data.
 
         Args:
-            bar: Bar data from Alpaca
+            bar: Raw bar message from Alpaca ("c" close, "v" volume)
         """
         if self.data_callback is None:
             return
 
         # Use close price for bars
         tick = MarketDataPoint(
-            timestamp=bar.timestamp,
-            symbol=bar.symbol,
-            price=float(bar.close),
-            volume=float(bar.volume),
+            timestamp=bar["t"].to_datetime(),
+            symbol=bar["S"],
+            price=float(bar["c"]),
+            volume=float(bar["v"]),
         )
 
         self.data_callback(tick)
@@ -380,6 +434,7 @@ class AlpacaTrader:
         symbols: list[str],
         callback: Callable[[MarketDataPoint], None],
         data_type: str = "trades",
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
     ) -> None:
         """
         Start streaming market data for symbols.
@@ -388,10 +443,17 @@ class AlpacaTrader:
             symbols: List of symbols to stream
             callback: Function to call with each data point
             data_type: Type of data ("trades", "quotes", or "bars")
+            loop_factory: Creates the stream's event loop, e.g.
+                uvloop.new_event_loop (default: asyncio's loop)
 
         Note: This is a blocking call. Run in separate thread for async usage.
+
+        All symbols are registered before the stream connects, so they are
+        sent in a single subscribe message rather than one per symbol.
         """
         self.data_callback = callback
+        # Drop duplicates (keeping order) so each symbol is subscribed once
+        symbols = list(dict.fromkeys(symbols))
         self.subscribed_symbols = set(symbols)
 
         # Subscribe to appropriate data type
@@ -406,7 +468,28 @@ class AlpacaTrader:
 
         # Start streaming
         self.is_streaming = True
-        self.data_stream.run()
+        # DataStream.run() always uses asyncio.run(); run the same coroutine
+        # on a loop from loop_factory, without touching the global policy.
+        # _run_forever() is private to alpaca-py, so fall back to run() if an
+        # alpaca-py release no longer has it.
+        run_forever = getattr(self.data_stream, "_run_forever", None)
+        if loop_factory is not None and run_forever is None:
+            logger.warning(
+                "This alpaca-py has no DataStream._run_forever(); "
+                "streaming on asyncio's default loop"
+            )
+        if loop_factory is None or run_forever is None:
+            self.data_stream.run()
+            return
+
+        try:
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(run_forever())
+        except KeyboardInterrupt:
+            # Same as DataStream.run(): Ctrl+C ends the stream, not the caller
+            logger.info("Keyboard interrupt, stopping stream")
+        finally:
+            self.data_stream.stop()
 
     def stop_streaming(self) -> None:
         """Stop streaming market data."""
@@ -13,6 +13,7 @@ BASE_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
 
+import asyncio
 import os
 from dataclasses import dataclass
 import logging
@@ -31,7 +32,6 @@ from alpaca.trading.enums import (
     QueryOrderStatus,
 )
 from alpaca.data.live import CryptoDataStream  # Added CryptoDataStream
-from alpaca.data.models import Trade, Quote, Bar
 from alpaca.data.enums import CryptoFeed
 
 from AlpacaTrading.models import (
@@ -43,8 +43,17 @@ from AlpacaTrading.models import (
 
 logger = logging.getLogger(__name__)
 
+# alpaca-py's websocket defaults, plus compression off: market data messages
+# are small msgpack frames, so permessage-deflate only adds an inflate per frame
+STREAM_WEBSOCKET_PARAMS = {
+    "ping_interval": 10,
+    "ping_timeout": 180,
+    "max_queue": 1024,
+    "compression": None,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AlpacaConfig:
     """
     Configuration for Alpaca API connection.
@@ -64,7 +73,7 @@ class AlpacaConfig:
     crypto: bool = False
 
     @classmethod
-    def from_env(cls) -> "AlpacaConfig":
+    def from_env(cls, **overrides) -> "AlpacaConfig":
         """
         Load configuration from environment variables.
 
@@ -74,6 +83,10 @@ class AlpacaConfig:
         - ALPACA_PAPER (optional, default: true)
         - ALPACA_CRYPTO (optional, default: false)
 
+        Args:
+            **overrides: Field values that take precedence over the environment,
+                e.g. from_env(crypto=True)
+
         Returns:
             AlpacaConfig instance
         """
@@ -91,11 +104,14 @@ class AlpacaConfig:
             )
 
         return cls(
-            api_key=api_key,
-            secret_key=secret_key,
-            paper=paper,
-            feed=CryptoFeed.US,  # Default stock feed
-            crypto=crypto,
+            **{
+                "api_key": api_key,
+                "secret_key": secret_key,
+                "paper": paper,
+                "feed": CryptoFeed.US,  # Default stock feed
+                "crypto": crypto,
+                **overrides,
+            }
         )
 
 
@@ -126,9 +142,13 @@ class AlpacaTrader:
 
         # Initialize data stream based on asset class
         if self.config.crypto:
-            # Crypto stream
+            # Crypto stream; raw_data hands handlers the decoded msgpack dicts,
+            # skipping the per-message pydantic models we would only convert again
             self.data_stream = CryptoDataStream(
-                api_key=config.api_key, secret_key=config.secret_key
+                api_key=config.api_key,
+                secret_key=config.secret_key,
+                raw_data=True,
+                websocket_params=STREAM_WEBSOCKET_PARAMS,
             )
 
         # Track streaming state
@@ -324,49 +344,50 @@ class AlpacaTrader:
             for order in orders
         ]
 
-    async def _handle_trade(self, trade: Trade):
-        """Handle incoming trade data."""
+    async def _handle_trade(self, trade: dict):
+        """Handle incoming raw trade message ("S" symbol, "p" price, "s" size)."""
         if self.data_callback is None:
             return
 
         # Convert to MarketDataPoint
         tick = MarketDataPoint(
-            timestamp=trade.timestamp,
-            symbol=trade.symbol,
-            price=float(trade.price),
-            volume=float(
-                trade.size
-            ),  # Note: CryptoDataStream also uses 'size' for volume
+            timestamp=trade["t"].to_datetime(),
+            symbol=trade["S"],
+            price=float(trade["p"]),
+            volume=float(trade["s"]),  # Note: crypto trades also use size for volume
         )
 
         # Call user callback
         self.data_callback(tick)
 
-    async def _handle_quote(self, quote: Quote):
-        """Handle incoming quote data."""
+    async def _handle_quote(self, quote: dict):
+        """Handle incoming raw quote message ("bp" bid, "ap" ask price)."""
         if self.data_callback is None:
             return
 
         # Use mid-price for quotes
-        mid_price = (float(quote.bid_price) + float(quote.ask_price)) / 2
+        mid_price = (float(quote["bp"]) + float(quote["ap"])) / 2
 
         tick = MarketDataPoint(
-            timestamp=quote.timestamp, symbol=quote.symbol, price=mid_price, volume=0
+            timestamp=quote["t"].to_datetime(),
+            symbol=quote["S"],
+            price=mid_price,
+            volume=0,
         )
 
         self.data_callback(tick)
 
-    async def _handle_bar(self, bar: Bar):
-        """Handle incoming bar data."""
+    async def _handle_bar(self, bar: dict):
+        """Handle incoming raw bar message ("c" close, "v" volume)."""
         if self.data_callback is None:
             return
 
         # Use close price for bars
         tick = MarketDataPoint(
-            timestamp=bar.timestamp,
-            symbol=bar.symbol,
-            price=float(bar.close),
-            volume=float(bar.volume),
+            timestamp=bar["t"].to_datetime(),
+            symbol=bar["S"],
+            price=float(bar["c"]),
+            volume=float(bar["v"]),
         )
 
         self.data_callback(tick)
@@ -376,6 +397,7 @@ class AlpacaTrader:
         symbols: list[str],
         callback: Callable[[MarketDataPoint], None],
         data_type: str = "trades",
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
     ) -> None:
         """
         Start streaming market data for symbols.
@@ -384,10 +406,17 @@ class AlpacaTrader:
             symbols: List of symbols to stream
             callback: Function to call with each data point
             data_type: Type of data ("trades", "quotes", or "bars")
+            loop_factory: Creates the stream's event loop, e.g.
+                uvloop.new_event_loop (default: asyncio's loop)
 
         Note: This is a blocking call. Run in separate thread for async usage.
+
+        All symbols are registered before the stream connects, so they are
+        sent in a single subscribe message rather than one per symbol.
         """
         self.data_callback = callback
+        # Drop duplicates (keeping order) so each symbol is subscribed once
+        symbols = list(dict.fromkeys(symbols))
         self.subscribed_symbols = set(symbols)
 
         # Subscribe to appropriate data type
@@ -403,7 +432,28 @@ class AlpacaTrader:
 
         # Start streaming
         self.is_streaming = True
-        self.data_stream.run()
+        # DataStream.run() always uses asyncio.run(); run the same coroutine
+        # on a loop from loop_factory, without touching the global policy.
+        # _run_forever() is private to alpaca-py, so fall back to run() if an
+        # alpaca-py release no longer has it.
+        run_forever = getattr(self.data_stream, "_run_forever", None)
+        if loop_factory is not None and run_forever is None:
+            logger.warning(
+                "This alpaca-py has no DataStream._run_forever(); "
+                "streaming on asyncio's default loop"
+            )
+        if loop_factory is None or run_forever is None:
+            self.data_stream.run()
+            return
+
+        try:
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(run_forever())
+        except KeyboardInterrupt:
+            # Same as DataStream.run(): Ctrl+C ends the stream, not the caller
+            logger.info("Keyboard interrupt, stopping stream")
+        finally:
+            self.data_stream.stop()
 
     def stop_streaming(self) -> None:
         """Stop streaming market data."""
@@ -4,11 +4,15 @@ Live Trading Engine - Orchestrates real-time trading with Alpaca.
 Integrates strategy execution, risk management, and order execution for live trading.
 """
 
+import asyncio
 import logging
+import queue
+import threading
 import time
 import signal
 from datetime import datetime
 from dataclasses import dataclass
+from collections.abc import Callable
 
 from AlpacaTrading.models import MarketDataPoint, Order, OrderSide, Trade
 from AlpacaTrading.strategies.base import TradingStrategy
@@ -25,6 +29,16 @@ from AlpacaTrading.live.alpaca_trader import AlpacaTrader, AlpacaConfig
 logger = logging.getLogger(__name__)
 
 
+def _uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop's event loop constructor, or None if uvloop is not installed."""
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("use_uvloop is set but uvloop is not installed, using asyncio")
+        return None
+    return uvloop.new_event_loop
+
+
 @dataclass
 class LiveEngineConfig:
     """
@@ -38,6 +52,11 @@ class LiveEngineConfig:
         enable_stop_loss: Enable stop-loss management (default: True)
         log_orders: Enable order logging to CSV (default: True)
         order_log_path: Path for order log CSV (default: "live_orders.csv")
+        log_backend: "sync" writes each order event as it happens, "background"
+            hands events to a writer thread that batches them (default: "sync")
+        use_uvloop: Run the market data stream on uvloop when it is installed
+            (default: False). Both event loops already set TCP_NODELAY on
+            the websocket connection.
     """
 
     alpaca_config: AlpacaConfig
@@ -47,6 +66,14 @@ class LiveEngineConfig:
     enable_stop_loss: bool = True
     log_orders: bool = True
     order_log_path: str = "live_orders.csv"
+    log_backend: str = "sync"
+    use_uvloop: bool = False
+
+    def __post_init__(self):
+        if self.log_backend not in ("sync", "background"):
+            raise ValueError(
+                f"log_backend must be 'sync' or 'background', got {self.log_backend!r}"
+            )
 
 
 class LiveTradingEngine:
@@ -109,7 +136,9 @@ class LiveTradingEngine:
         )
 
         if config.log_orders:
-            self.order_gateway = OrderGateway(config.order_log_path)
+            self.order_gateway = OrderGateway(
+                config.order_log_path, background=config.log_backend == "background"
+            )
         else:
             self.order_gateway = None
 
@@ -118,6 +147,10 @@ class LiveTradingEngine:
         self.running: bool = False
         self.tick_count: int = 0
 
+        # Batch mode (see run): queue of pending ticks and the thread draining it
+        self._tick_queue: queue.Queue | None = None
+        self._batch_thread: threading.Thread | None = None
+
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
@@ -178,6 +211,108 @@ class LiveTradingEngine:
         except Exception as e:
             logger.exception(f"\n❌ Error processing market data: {e}")
 
+    def _on_market_data_batch(self, ticks: list[MarketDataPoint]) -> None:
+        """
+        Handle a batch of market data ticks (batch mode).
+
+        Stop-losses and the circuit breaker are still checked at every tick's
+        price, so a move through a stop that recovers within the batch
+        triggers as it would unbatched. The strategy sees every tick in
+        arrival order, after the batch's stops have run.
+
+        Args:
+            ticks: Market data points drained from the stream
+        """
+        try:
+            risk_manager = self.risk_manager
+            positions = self.portfolio.positions
+            for tick in ticks:
+                self.current_prices[tick.symbol] = tick.price
+                if (
+                    not self.config.enable_stop_loss
+                    or risk_manager.circuit_breaker_triggered
+                ):
+                    continue
+
+                # Per-tick stop checks: only this tick's symbol moved
+                self.portfolio.update_price(tick.symbol, tick.price)
+                stop_orders = risk_manager.check_circuit_breaker(
+                    self.portfolio.get_total_value(), positions
+                )
+                if not stop_orders:
+                    order = risk_manager.check_symbol_stop(
+                        tick.symbol, tick.price, positions.get(tick.symbol)
+                    )
+                    stop_orders = [order] if order is not None else []
+
+                # Execute stop-loss orders immediately
+                for order in stop_orders:
+                    logger.info(f"\n⚠️  STOP-LOSS TRIGGERED for {order.symbol}")
+                    self._execute_order(order, tick.timestamp, is_stop=True)
+
+            # Update portfolio unrealized P&L
+            self.portfolio.update_prices(self.current_prices)
+
+            # If circuit breaker triggered, don't generate new signals
+            if self.risk_manager.circuit_breaker_triggered:
+                if self.tick_count % 100 == 0:  # logger.info reminder periodically
+                    logger.info("CIRCUIT BREAKER ACTIVE - Trading halted")
+                return
+
+            traded = False
+            for tick in ticks:
+                orders = self.strategy.process_market_data(tick, self.portfolio)
+
+                if not orders:
+                    continue
+                traded = True
+
+                # Validate and fill at this tick's price, not the batch's last
+                self.current_prices[tick.symbol] = tick.price
+
+                for order in orders:
+                    self._execute_order(order, tick.timestamp, is_stop=False)
+
+                # Periodically record equity and logger.info status
+                self.tick_count += 1
+                if self.tick_count % 100 == 0:
+                    self.portfolio.record_equity(tick.timestamp, self.current_prices)
+                    self._print_status()
+
+            # Restore the latest prices and re-mark positions opened at fills
+            if traded:
+                for tick in ticks:
+                    self.current_prices[tick.symbol] = tick.price
+                self.portfolio.update_prices(self.current_prices)
+
+        except Exception as e:
+            logger.exception(f"\n❌ Error processing market data: {e}")
+
+    def _drain_ticks(self, batch_size: int, batch_timeout: float) -> None:
+        """
+        Batch thread: collect up to batch_size ticks, or whatever arrived
+        within batch_timeout seconds of the first one, and handle them together.
+        """
+        tick_queue = self._tick_queue
+        while True:
+            tick = tick_queue.get()
+            if tick is None:  # Sentinel from stop()
+                return
+
+            batch = [tick]
+            deadline = time.monotonic() + batch_timeout
+            while len(batch) < batch_size:
+                try:
+                    tick = tick_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if tick is None:
+                    self._on_market_data_batch(batch)
+                    return
+                batch.append(tick)
+
+            self._on_market_data_batch(batch)
+
     def _execute_order(
         self, order: Order, timestamp: datetime, is_stop: bool = False
     ) -> None:
@@ -344,13 +479,24 @@ class LiveTradingEngine:
         if self.risk_manager.circuit_breaker_triggered:
             logger.info("Circuit Breaker: TRIGGERED")
 
-    def run(self, symbols: list[str], data_type: str = "trades") -> None:
+    def run(
+        self,
+        symbols: list[str],
+        data_type: str = "trades",
+        batch_size: int = 1,
+        batch_timeout_ms: float = 5.0,
+    ) -> None:
         """
         Start live trading.
 
         Args:
             symbols: List of symbols to trade
             data_type: Type of market data ("trades", "quotes", or "bars")
+            batch_size: Max ticks handled together. Above 1, ticks are queued
+                and handled in batches on a separate thread (default: 1).
+                Stops and the circuit breaker are still checked per tick.
+            batch_timeout_ms: Max wait for a batch to fill after its first
+                tick arrives (default: 5.0)
 
         Note: This is a blocking call. Press Ctrl+C to stop.
         """
@@ -364,6 +510,8 @@ class LiveTradingEngine:
         logger.info(f"Strategy: {self.strategy.__class__.__name__}")
         logger.info(f"Symbols: {', '.join(symbols)}")
         logger.info(f"Data Type: {data_type}")
+        if batch_size > 1:
+            logger.info(f"Batching: {batch_size} ticks / {batch_timeout_ms}ms")
         logger.info("=" * 60)
 
         # Call strategy initialization
@@ -377,11 +525,28 @@ class LiveTradingEngine:
 
         self.running = True
 
+        loop_factory = _uvloop_factory() if self.config.use_uvloop else None
+
+        callback = self._on_market_data
+        if batch_size > 1:
+            self._tick_queue = queue.Queue()
+            self._batch_thread = threading.Thread(
+                target=self._drain_ticks,
+                args=(batch_size, batch_timeout_ms / 1000),
+                name="tick-batcher",
+                daemon=True,
+            )
+            self._batch_thread.start()
+            callback = self._tick_queue.put
+
         try:
             # Start streaming (blocking call)
             logger.debug("starting streaming")
             self.trader.start_streaming(
-                symbols=symbols, callback=self._on_market_data, data_type=data_type
+                symbols=symbols,
+                callback=callback,
+                data_type=data_type,
+                loop_factory=loop_factory,
             )
         except KeyboardInterrupt:
             logger.warning("--- Keyboard interrupt received ---")
@@ -437,6 +602,16 @@ class LiveTradingEngine:
         logger.info("Stopping market data stream...")
         self.trader.stop_streaming()
 
+        # Handle ticks still queued in batch mode, then stop the batch thread
+        if self._tick_queue is not None:
+            self._tick_queue.put(None)
+            self._batch_thread.join()
+            self._tick_queue = None
+            self._batch_thread = None
+
+        if self.order_gateway:
+            self.order_gateway.close()
+
         # Call strategy cleanup with portfolio
         self.strategy.on_end(self.portfolio)
 
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import uuid
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,9 +45,9 @@ class OrderType(Enum):
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
-    """Immutable market tick data"""
+    """Immutable market tick data (slotted: one is created per tick)"""
 
     timestamp: datetime.datetime
     symbol: str
@@ -53,12 +55,94 @@ class MarketDataPoint:
     volume: float = 0.0  # Optional volume data
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class MarketData:
+    """
+    Block of market ticks stored column-wise (struct of arrays).
+
+    One NumPy array per field instead of one MarketDataPoint per row, so a
+    whole dataset costs a few contiguous buffers and can be scanned with
+    vectorized operations. view(i) and iteration yield MarketDataPoints for
+    code that consumes ticks one at a time.
+
+    Symbols are categorical: each row stores a small integer code into
+    symbol_names, so every tick of a symbol shares one string object.
+
+    Fields:
+        timestamps: datetime64[ns] array (UTC when utc_offsets is set)
+        symbol_codes: int32 array of indices into symbol_names
+        prices: float64 array
+        volumes: float64 array
+        symbol_names: Distinct symbols, indexed by code
+        utc_offsets: int32 array of each row's UTC offset in seconds, or
+            None for naive timestamps. Rows are yielded in their own offset,
+            as datetime.fromisoformat() would parse them.
+    """
+
+    timestamps: np.ndarray
+    symbol_codes: np.ndarray
+    prices: np.ndarray
+    volumes: np.ndarray
+    symbol_names: tuple[str, ...]
+    utc_offsets: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def symbols(self) -> np.ndarray:
+        """Object array with the symbol string of every row."""
+        return np.asarray(self.symbol_names, dtype=object)[self.symbol_codes]
+
+    def view(self, i: int) -> MarketDataPoint:
+        """Return row i as a MarketDataPoint."""
+        timestamp = self.timestamps[i].astype("datetime64[us]").item()
+        if self.utc_offsets is not None:
+            offset = datetime.timedelta(seconds=int(self.utc_offsets[i]))
+            timestamp = (timestamp + offset).replace(tzinfo=datetime.timezone(offset))
+        return MarketDataPoint(
+            timestamp=timestamp,
+            symbol=self.symbol_names[self.symbol_codes[i]],
+            price=float(self.prices[i]),
+            volume=float(self.volumes[i]),
+        )
+
+    def __iter__(self):
+        """Yield every row as a MarketDataPoint, in order."""
+        names = self.symbol_names
+        if self.utc_offsets is None:
+            timestamps = self.timestamps.astype("datetime64[us]").tolist()
+        else:
+            # Shift to wall-clock time, then attach one shared tzinfo per offset
+            local = self.timestamps + self.utc_offsets.astype("timedelta64[s]")
+            offsets = self.utc_offsets.tolist()
+            zones = {
+                offset: datetime.timezone(datetime.timedelta(seconds=offset))
+                for offset in set(offsets)
+            }
+            timestamps = [
+                timestamp.replace(tzinfo=zones[offset])
+                for timestamp, offset in zip(
+                    local.astype("datetime64[us]").tolist(), offsets
+                )
+            ]
+        for timestamp, code, price, volume in zip(
+            timestamps,
+            self.symbol_codes.tolist(),
+            self.prices.tolist(),
+            self.volumes.tolist(),
+        ):
+            yield MarketDataPoint(
+                timestamp=timestamp, symbol=names[code], price=price, volume=volume
+            )
+
+
 # ============================================================================
 # ORDERS AND TRADES
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Enhanced order model supporting full trading lifecycle.
@@ -131,7 +215,7 @@ class Order:
             self.status = OrderStatus.PARTIAL
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Represents an executed trade (fill or partial fill).
@@ -177,6 +261,8 @@ class Position:
         unrealized_pnl: Open P&L based on current market price
     """
 
+    __slots__ = ("average_cost", "quantity", "realized_pnl", "symbol", "unrealized_pnl")
+
     def __init__(
         self,
         symbol: str,
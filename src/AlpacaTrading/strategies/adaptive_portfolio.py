@@ -16,6 +16,7 @@ from AlpacaTrading.models import MarketDataPoint, Order, OrderSide
 from AlpacaTrading.trading.portfolio import TradingPortfolio
 
 from .base import TradingStrategy
+from .price_window import PriceWindows
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +134,21 @@ class AdaptivePortfolioStrategy(TradingStrategy):
         # Track current prices for unrealized P&L
         self.current_prices: dict[str, float] = {}  # {symbol: latest_price}
 
+        # One set of price windows for every sub-strategy that can share it,
+        # so each price is recorded once per tick rather than once per strategy
+        self.shared_windows = PriceWindows()
+        self._num_sharing = sum(
+            strategy.share_price_windows(self.shared_windows)
+            for strategy in strategies.values()
+        )
+
+        # (name, bound process_market_data, performance) per sub-strategy,
+        # resolved once instead of on every tick
+        self._dispatch = tuple(
+            (name, strategy.process_market_data, self.performance[name])
+            for name, strategy in strategies.items()
+        )
+
     def _calculate_unrealized_pnl(
         self, current_prices: dict[str, float]
     ) -> dict[str, float]:
@@ -319,6 +335,8 @@ class AdaptivePortfolioStrategy(TradingStrategy):
 
         # Update current price for this symbol
         self.current_prices[tick.symbol] = tick.price
+        if self._num_sharing:
+            self.shared_windows.push(tick.symbol, tick.price)
 
         # Increment tick count
         self.global_tick_count += 1
@@ -331,20 +349,21 @@ class AdaptivePortfolioStrategy(TradingStrategy):
         # Run each strategy and collect orders
         all_orders = []
 
-        for strategy_name, strategy in self.strategies.items():
+        for strategy_name, process_market_data, perf in self._dispatch:
             # Run strategy
-            strategy_orders = strategy.process_market_data(tick, portfolio)
+            strategy_orders = process_market_data(tick, portfolio)
 
             if not strategy_orders:
                 continue
 
             # Debug: Log orders from each strategy
-            logger.debug(
-                f"🎯 {strategy_name} generated {len(strategy_orders)} order(s): {[f'{o.side.value} {o.quantity} {o.symbol}' for o in strategy_orders]}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"🎯 {strategy_name} generated {len(strategy_orders)} order(s): {[f'{o.side.value} {o.quantity} {o.symbol}' for o in strategy_orders]}"
+                )
 
             # Get current allocation for this strategy
-            allocation = self.performance[strategy_name].target_allocation
+            allocation = perf.target_allocation
 
             # Scale orders by allocation
             # Use actual buying power if provided, otherwise fall back to total equity
@@ -369,8 +388,14 @@ class AdaptivePortfolioStrategy(TradingStrategy):
                     # Scale down quantity
                     scaled_qty = int(max_value / order_price)
                     logger.debug(
-                        f"📉 Scaling {strategy_name} order: {order.quantity} → {scaled_qty} shares "
-                        f"(order_value=${order_value:.2f} > max=${max_value:.2f}, allocation={allocation * 100:.1f}%)"
+                        "📉 Scaling %s order: %s → %s shares "
+                        "(order_value=$%.2f > max=$%.2f, allocation=%.1f%%)",
+                        strategy_name,
+                        order.quantity,
+                        scaled_qty,
+                        order_value,
+                        max_value,
+                        allocation * 100,
                     )
                     if scaled_qty > 0:
                         # Create scaled order
@@ -402,7 +427,6 @@ class AdaptivePortfolioStrategy(TradingStrategy):
                                 )
 
                                 # Update performance
-                                perf = self.performance[strategy_name]
                                 perf.total_pnl += pnl
                                 perf.recent_pnl += pnl
                                 perf.num_trades += 1
@@ -420,8 +444,12 @@ class AdaptivePortfolioStrategy(TradingStrategy):
 
                         all_orders.append(scaled_order)
                         logger.debug(
-                            f"{strategy_name} ({allocation * 100:.1f}% allocation): "
-                            f"{scaled_order.side.value} {scaled_order.quantity} {scaled_order.symbol}"
+                            "%s (%.1f%% allocation): %s %s %s",
+                            strategy_name,
+                            allocation * 100,
+                            scaled_order.side.value,
+                            scaled_order.quantity,
+                            scaled_order.symbol,
                         )
                     else:
                         logger.warning(
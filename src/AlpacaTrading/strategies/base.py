@@ -9,6 +9,7 @@ import logging
 
 from AlpacaTrading.models import MarketDataPoint, Order
 from AlpacaTrading.trading.portfolio import TradingPortfolio
+from .price_window import PriceWindows, RollingWindow
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,10 @@ class TradingStrategy(ABC):
                 return []
     """
 
+    # Prices per symbol read back through push_price(); 0 if the strategy
+    # keeps no price window (and cannot share one)
+    price_window_length = 0
+
     def __init__(self, name: str | None = None):
         """
         Initialize strategy.
@@ -42,6 +47,8 @@ class TradingStrategy(ABC):
         self.name = name or self.__class__.__name__
         self._error_count = 0
         self._max_consecutive_errors = 10
+        self.price_windows: PriceWindows | None = None
+        self._shares_price_windows = False
 
     @abstractmethod
     def on_market_data(
@@ -123,6 +130,47 @@ class TradingStrategy(ABC):
 
             return []
 
+    def push_price(self, tick: MarketDataPoint) -> RollingWindow:
+        """
+        Record tick.price and return the price window for tick.symbol.
+
+        If the windows are shared (see share_price_windows()), the owner has
+        already pushed the price and the window is only looked up.
+
+        Args:
+            tick: Current market data point
+
+        Returns:
+            Window of the latest price_window_length (or more) prices
+        """
+        if self._shares_price_windows:
+            return self.price_windows.get(tick.symbol)
+        if self.price_windows is None:
+            self.price_windows = PriceWindows(self.price_window_length)
+        return self.price_windows.push(tick.symbol, tick.price)
+
+    def share_price_windows(self, windows: PriceWindows) -> bool:
+        """
+        Read prices from windows that the caller pushes to.
+
+        Lets a strategy running several sub-strategies record each price
+        once for all of them. The caller must push every tick with a
+        positive price to windows before passing it to this strategy.
+
+        Args:
+            windows: Windows to share, before any price has been pushed
+
+        Returns:
+            True if the strategy will use windows, False if it keeps no
+            price window
+        """
+        if not self.price_window_length:
+            return False
+        windows.reserve(self.price_window_length)
+        self.price_windows = windows
+        self._shares_price_windows = True
+        return True
+
     def on_start(self, portfolio: TradingPortfolio) -> None:
         """
         Called once at the start of backtest/live trading.
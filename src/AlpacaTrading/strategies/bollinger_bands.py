@@ -9,7 +9,6 @@ This strategy adapts to market volatility and works well in trending markets (br
 or ranging markets (mean reversion).
 """
 
-from collections import deque
 import logging
 import math
 from typing import Literal
@@ -78,8 +77,8 @@ class BollingerBandsStrategy(TradingStrategy):
         self.max_position = max_position
         self.band_threshold = band_threshold
 
-        # Track price history per symbol
-        self.price_history: dict[str, deque] = {}
+        # Track price history per symbol (see push_price())
+        self.price_window_length = period
         self.upper_band: dict[str, float] = {}
         self.middle_band: dict[str, float] = {}
         self.lower_band: dict[str, float] = {}
@@ -94,12 +93,11 @@ class BollingerBandsStrategy(TradingStrategy):
         Returns:
             Tuple of (upper_band, middle_band, lower_band) or None if not enough data
         """
-        prices = list(self.price_history[symbol])
-        if len(prices) < self.period:
+        recent_prices = self.price_windows.get(symbol).last(self.period).tolist()
+        if len(recent_prices) < self.period:
             return None
 
         # Calculate SMA (middle band)
-        recent_prices = prices[-self.period :]
         sma = sum(recent_prices) / self.period
 
         # Calculate standard deviation
@@ -128,18 +126,12 @@ class BollingerBandsStrategy(TradingStrategy):
             )
             return []
 
-        # Initialize for new symbol
-        if tick.symbol not in self.price_history:
-            self.price_history[tick.symbol] = deque(
-                maxlen=self.period + 10
-            )  # Extra buffer
-            logger.info(f"Initialized Bollinger Bands tracking for {tick.symbol}")
-
         # Track previous price for crossover detection
         prev_price = self.prev_price.get(tick.symbol, tick.price)
 
         # Update price history
-        self.price_history[tick.symbol].append(tick.price)
+        if len(self.push_price(tick)) == 1:
+            logger.info(f"Initialized Bollinger Bands tracking for {tick.symbol}")
         self.prev_price[tick.symbol] = tick.price
 
         # Calculate bands
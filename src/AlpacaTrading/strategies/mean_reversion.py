@@ -71,6 +71,10 @@ class MovingAverageCrossoverStrategy(TradingStrategy):
         self.price_history: dict[str, deque] = {}
         self.short_ma: dict[str, float] = {}
         self.long_ma: dict[str, float] = {}
+        # Running sums of the last short_window / long_window prices, so each
+        # tick updates the MAs in O(1) instead of re-summing the history
+        self._short_sum: dict[str, float] = {}
+        self._long_sum: dict[str, float] = {}
         self.prev_signal: dict[
             str, SignalType
         ] = {}  # Track previous signal to detect crossovers
@@ -94,22 +98,28 @@ class MovingAverageCrossoverStrategy(TradingStrategy):
         # Initialize for new symbol
         if tick.symbol not in self.price_history:
             self.price_history[tick.symbol] = deque(maxlen=self.long_window)
+            self._short_sum[tick.symbol] = 0.0
+            self._long_sum[tick.symbol] = 0.0
             self.prev_signal[tick.symbol] = SignalType.NEUTRAL
             logger.info(f"Initialized MA crossover tracking for {tick.symbol}")
 
-        # Update price history
-        self.price_history[tick.symbol].append(tick.price)
+        # Update price history, dropping the prices that leave each window
+        history = self.price_history[tick.symbol]
+        if len(history) >= self.short_window:
+            self._short_sum[tick.symbol] -= history[-self.short_window]
+        if len(history) == self.long_window:
+            self._long_sum[tick.symbol] -= history[0]
+        history.append(tick.price)
+        self._short_sum[tick.symbol] += tick.price
+        self._long_sum[tick.symbol] += tick.price
 
         # Need enough history for long MA
-        if len(self.price_history[tick.symbol]) < self.long_window:
+        if len(history) < self.long_window:
             return []
 
-        # Calculate moving averages (optimized: avoid numpy conversion)
-        price_list = list(self.price_history[tick.symbol])
-        self.short_ma[tick.symbol] = (
-            sum(price_list[-self.short_window :]) / self.short_window
-        )
-        self.long_ma[tick.symbol] = sum(price_list) / self.long_window
+        # Calculate moving averages from the running sums
+        self.short_ma[tick.symbol] = self._short_sum[tick.symbol] / self.short_window
+        self.long_ma[tick.symbol] = self._long_sum[tick.symbol] / self.long_window
 
         # Determine current signal
         short_ma = self.short_ma[tick.symbol]
@@ -57,7 +57,10 @@ class MomentumStrategy(TradingStrategy):
         self.position_size = position_size
         self.max_position = max_position
 
-        # Track price history per symbol
+        # Track price history per symbol. A deque(maxlen=lookback_period) is a
+        # fixed-width ring buffer already: appends never resize it, and in
+        # CPython it is several times faster per tick than writing into a
+        # preallocated numpy array, whose element access boxes every float.
         self.price_history: dict[str, deque] = {}
 
     def on_market_data(
@@ -76,23 +79,24 @@ class MomentumStrategy(TradingStrategy):
             )
             return []
 
-        # Initialize price history for new symbol
-        if tick.symbol not in self.price_history:
-            self.price_history[tick.symbol] = deque(maxlen=self.lookback_period)
+        # Initialize price history for new symbol (one dict lookup per tick)
+        price_deque = self.price_history.get(tick.symbol)
+        if price_deque is None:
+            price_deque = deque(maxlen=self.lookback_period)
+            self.price_history[tick.symbol] = price_deque
             logger.info(f"Initialized momentum tracking for {tick.symbol}")
 
         # Update price history
-        self.price_history[tick.symbol].append(tick.price)
+        price_deque.append(tick.price)
 
         # Need enough history to calculate momentum
-        if len(self.price_history[tick.symbol]) < self.lookback_period:
+        if len(price_deque) < self.lookback_period:
             return []
 
         # Calculate momentum (percentage change over lookback period)
         # Use direct deque access for performance (avoid list conversion)
-        price_deque = self.price_history[tick.symbol]
         first_price = price_deque[0]
-        last_price = price_deque[-1]
+        last_price = tick.price
 
         # Protect against division by zero
         if first_price == 0:
@@ -0,0 +1,118 @@
+"""
+Rolling price windows that strategies can share.
+
+A RollingWindow keeps the latest prices of one symbol in a NumPy ring
+buffer, and PriceWindows holds one per symbol. Strategies that read their
+history through TradingStrategy.push_price() can share one PriceWindows,
+so a meta-strategy running several of them records each price once
+instead of once per strategy.
+"""
+
+import numpy as np
+
+
+class RollingWindow:
+    """
+    Fixed-capacity ring buffer of the most recent prices.
+
+    Each price is written twice, at slot i and i + maxlen, so the latest k
+    prices are always one contiguous slice and last(k) needs no copy.
+
+    Example:
+        window = RollingWindow(3)
+        for price in [1.0, 2.0, 3.0, 4.0]:
+            window.push(price)
+        window.last(2)  # array([3., 4.])
+    """
+
+    __slots__ = ("_buffer", "_count", "_head", "maxlen")
+
+    def __init__(self, maxlen: int):
+        """
+        Initialize an empty window.
+
+        Args:
+            maxlen: Number of most recent prices to keep
+        """
+        if maxlen <= 0:
+            raise ValueError(f"maxlen must be positive, got {maxlen}")
+
+        self.maxlen = maxlen
+        self._buffer = np.zeros(2 * maxlen)
+        self._head = 0  # Slot the next price is written to
+        self._count = 0
+
+    def push(self, price: float) -> None:
+        """Append a price, dropping the oldest one once the window is full."""
+        head = self._head
+        self._buffer[head] = price
+        self._buffer[head + self.maxlen] = price
+        self._head = head + 1 if head + 1 < self.maxlen else 0
+        if self._count < self.maxlen:
+            self._count += 1
+
+    def last(self, k: int) -> np.ndarray:
+        """
+        Get the latest prices, oldest first.
+
+        Args:
+            k: Number of prices wanted
+
+        Returns:
+            View of the latest min(k, len(window)) prices (do not modify)
+        """
+        k = min(k, self._count)
+        end = self._head + self.maxlen
+        return self._buffer[end - k : end]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class PriceWindows:
+    """
+    One RollingWindow per symbol, created on the symbol's first push.
+
+    Every window has the same capacity, which reserve() can raise until
+    the first price is pushed.
+    """
+
+    def __init__(self, maxlen: int = 1):
+        """
+        Initialize with no symbols.
+
+        Args:
+            maxlen: Capacity of each symbol's window
+        """
+        self.maxlen = maxlen
+        self._windows: dict[str, RollingWindow] = {}
+
+    def reserve(self, maxlen: int) -> None:
+        """
+        Make every window hold at least maxlen prices.
+
+        Raises:
+            ValueError: If windows already exist and are too small
+        """
+        if maxlen <= self.maxlen:
+            return
+        if self._windows:
+            raise ValueError(
+                f"Cannot grow windows to {maxlen} after prices were pushed"
+            )
+        self.maxlen = maxlen
+
+    def push(self, symbol: str, price: float) -> RollingWindow:
+        """Append a price to the symbol's window and return the window."""
+        window = self._windows.get(symbol)
+        if window is None:
+            window = self._windows[symbol] = RollingWindow(self.maxlen)
+        window.push(price)
+        return window
+
+    def get(self, symbol: str) -> RollingWindow | None:
+        """Get the symbol's window, or None if no price was pushed yet."""
+        return self._windows.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._windows
@@ -8,7 +8,6 @@ This strategy works well in ranging markets and for mean reversion trades.
 Suitable for short-term trading (intraday to multi-day holds).
 """
 
-from collections import deque
 import logging
 
 from AlpacaTrading.models import MarketDataPoint, Order, OrderSide, OrderType
@@ -82,8 +81,8 @@ class RSIStrategy(TradingStrategy):
         self.profit_target = profit_target
         self.stop_loss = stop_loss
 
-        # Track price changes for RSI calculation
-        self.price_history: dict[str, deque] = {}
+        # Need rsi_period + 1 prices to calculate RSI (see push_price())
+        self.price_window_length = rsi_period + 1
         self.rsi_values: dict[str, float] = {}
         self.entry_prices: dict[str, float] = {}  # Track entry price for P&L targets
 
@@ -97,7 +96,7 @@ class RSIStrategy(TradingStrategy):
         Returns:
             RSI value (0-100) or None if not enough data
         """
-        prices = list(self.price_history[symbol])
+        prices = self.price_windows.get(symbol).last(self.rsi_period + 1).tolist()
         if len(prices) < self.rsi_period + 1:
             return None
 
@@ -138,14 +137,9 @@ class RSIStrategy(TradingStrategy):
             )
             return []
 
-        # Initialize price history for new symbol
-        if tick.symbol not in self.price_history:
-            # Need rsi_period + 1 prices to calculate first RSI
-            self.price_history[tick.symbol] = deque(maxlen=self.rsi_period + 1)
-            logger.info(f"Initialized RSI tracking for {tick.symbol}")
-
         # Update price history
-        self.price_history[tick.symbol].append(tick.price)
+        if len(self.push_price(tick)) == 1:
+            logger.info(f"Initialized RSI tracking for {tick.symbol}")
 
         # Calculate RSI
         rsi = self._calculate_rsi(tick.symbol)
@@ -17,7 +17,7 @@ from AlpacaTrading.models import Order, OrderSide, Position
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
     """
     Risk management configuration parameters.
@@ -5,7 +5,13 @@ Maintains complete state of portfolio with P&L calculation and equity curve trac
 """
 
 from datetime import datetime
+import json
 import logging
+import os
+from pathlib import Path
+import tempfile
+
+import numpy as np
 import pandas as pd
 
 from AlpacaTrading.models import Trade, Position, OrderSide
@@ -58,6 +64,9 @@ class TradingPortfolio:
         # Track high water mark for drawdown calculation
         self.high_water_mark = initial_cash
 
+        # (tick_id, total_value) memo for get_total_value_cached()
+        self._total_value_cache: tuple[int, float] | None = None
+
     def process_trade(self, trade: Trade) -> None:
         """
         Process executed trade and update portfolio state.
@@ -72,6 +81,7 @@ class TradingPortfolio:
         """
         # Add to trade history
         self.trades.append(trade)
+        self._total_value_cache = None
 
         # Update or create position
         if trade.symbol not in self.positions:
@@ -95,10 +105,24 @@ class TradingPortfolio:
         Args:
             current_prices: Dictionary of {symbol: price}
         """
+        self._total_value_cache = None
         for symbol, position in self.positions.items():
             if symbol in current_prices:
                 position.update_unrealized_pnl(current_prices[symbol])
 
+    def update_price(self, symbol: str, price: float) -> None:
+        """
+        Update unrealized P&L for one symbol (per-symbol update_prices).
+
+        Args:
+            symbol: Asset symbol
+            price: Current market price
+        """
+        position = self.positions.get(symbol)
+        if position is not None:
+            self._total_value_cache = None
+            position.update_unrealized_pnl(price)
+
     def record_equity(
         self, timestamp: datetime, current_prices: dict[str, float]
     ) -> None:
@@ -130,6 +154,26 @@ class TradingPortfolio:
         )
         return self.cash + position_value
 
+    def get_total_value_cached(self, tick_id: int) -> float:
+        """
+        Total portfolio value, computed at most once per tick.
+
+        Repeated calls with the same tick_id return the memoized value until
+        a trade or price update invalidates it.
+
+        Args:
+            tick_id: Caller's tick counter (any value that changes every tick)
+
+        Returns:
+            Total portfolio value
+        """
+        cache = self._total_value_cache
+        if cache is not None and cache[0] == tick_id:
+            return cache[1]
+        total_value = self.get_total_value()
+        self._total_value_cache = (tick_id, total_value)
+        return total_value
+
     def get_position(self, symbol: str) -> Position | None:
         """
         Get position for a symbol.
@@ -263,13 +307,6 @@ class TradingPortfolio:
         total_win = 0.0
         total_loss = 0.0
 
-        # Group trades by symbol to calculate P&L
-        symbol_trades: dict[str, list[Trade]] = {}
-        for trade in self.trades:
-            if trade.symbol not in symbol_trades:
-                symbol_trades[trade.symbol] = []
-            symbol_trades[trade.symbol].append(trade)
-
         # Simplified win/loss calculation
         for position in self.positions.values():
             if position.realized_pnl > 0:
@@ -316,18 +353,13 @@ class TradingPortfolio:
         if len(self.equity_curve) < 2:
             return 0.0
 
-        values = [val for _, val in self.equity_curve]
-        max_dd = 0.0
-        peak = values[0]
-
-        for value in values:
-            if value > peak:
-                peak = value
-            dd = (peak - value) / peak * 100
-            if dd > max_dd:
-                max_dd = dd
-
-        return max_dd
+        values = np.fromiter(
+            (val for _, val in self.equity_curve),
+            dtype=np.float64,
+            count=len(self.equity_curve),
+        )
+        peaks = np.maximum.accumulate(values)
+        return float(((peaks - values) / peaks * 100).max())
 
     def get_sharpe_ratio(self, risk_free_rate: float = 0.0) -> float:
         """
@@ -366,6 +398,76 @@ class TradingPortfolio:
         """
         return pd.DataFrame(self.equity_curve, columns=["timestamp", "value"])
 
+    def save_state(self, path: str | Path) -> None:
+        """
+        Save cash, positions and high water mark to a JSON file.
+
+        The starting cash is saved too, so load_state() can refuse a file
+        from a portfolio with a different baseline. Written to a temp file in
+        the same directory and moved into place with os.replace, so a crash
+        mid-write never leaves a partial file. Trade history and the equity
+        curve are not saved.
+
+        Args:
+            path: State file to write
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "initial_cash": self.initial_cash,
+            "cash": self.cash,
+            "high_water_mark": self.high_water_mark,
+            "positions": [
+                [pos.symbol, pos.quantity, pos.average_cost, pos.realized_pnl]
+                for pos in self.positions.values()
+            ],
+        }
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            try:
+                json.dump(state, f)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    def load_state(self, path: str | Path) -> bool:
+        """
+        Restore cash, positions and high water mark saved by save_state().
+
+        Args:
+            path: State file to read
+
+        Returns:
+            True if state was restored, False if the file does not exist
+
+        Raises:
+            ValueError: If the state was saved with a different initial_cash
+        """
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+
+        if state.get("initial_cash") != self.initial_cash:
+            raise ValueError(
+                f"{path} was saved with initial_cash={state.get('initial_cash')}, "
+                f"not {self.initial_cash}"
+            )
+
+        self.cash = state["cash"]
+        self.high_water_mark = state["high_water_mark"]
+        self.positions.clear()
+        for symbol, quantity, average_cost, realized_pnl in state["positions"]:
+            self.positions[symbol] = Position(
+                symbol, quantity, average_cost, realized_pnl
+            )
+        self._total_value_cache = None
+        return True
+
     def reset(self) -> None:
         """Reset portfolio to initial state."""
         self.cash = self.initial_cash
@@ -373,6 +475,7 @@ class TradingPortfolio:
         self.trades.clear()
         self.equity_curve.clear()
         self.high_water_mark = self.initial_cash
+        self._total_value_cache = None
 
     def __repr__(self) -> str:
         total_value = self.get_total_value()
@@ -12,6 +12,8 @@ from datetime import datetime
 from enum import Enum
 import logging
 
+import numpy as np
+
 from AlpacaTrading.models import Order, OrderSide, OrderType, Position
 
 logger = logging.getLogger(__name__)
@@ -69,6 +71,90 @@ class PositionStop:
     stop_type: StopType
 
 
+class _StopBook:
+    """
+    Position stops stored as parallel NumPy arrays (one slot per symbol).
+
+    Keeping entry/stop/high-water prices in contiguous arrays lets
+    ``RiskManager.check_stops`` update trailing stops and test every position
+    with a handful of vectorized operations instead of a Python loop.
+    Removal swaps the last slot into the freed one, so it is O(1).
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.symbols: list[str] = []
+        self.stop_types: list[StopType] = []
+        self.index: dict[str, int] = {}
+        self.entry_prices = np.empty(capacity, dtype=np.float64)
+        self.stop_prices = np.empty(capacity, dtype=np.float64)
+        self.highest_prices = np.empty(capacity, dtype=np.float64)
+        self.trailing = np.empty(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.entry_prices)
+        for name in ("entry_prices", "stop_prices", "highest_prices", "trailing"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def set(
+        self, symbol: str, entry_price: float, stop_price: float, stop_type: StopType
+    ) -> None:
+        """Add a stop, or overwrite the existing stop for ``symbol``."""
+        i = self.index.get(symbol)
+        if i is None:
+            i = len(self.symbols)
+            if i == len(self.entry_prices):
+                self._grow()
+            self.index[symbol] = i
+            self.symbols.append(symbol)
+            self.stop_types.append(stop_type)
+        else:
+            self.stop_types[i] = stop_type
+        self.entry_prices[i] = entry_price
+        self.stop_prices[i] = stop_price
+        self.highest_prices[i] = entry_price
+        self.trailing[i] = stop_type == StopType.TRAILING_PERCENT
+
+    def remove(self, symbol: str) -> None:
+        """Drop the stop for ``symbol`` by moving the last slot into its place."""
+        i = self.index.pop(symbol, None)
+        if i is None:
+            return
+        last = len(self.symbols) - 1
+        last_symbol = self.symbols.pop()
+        last_type = self.stop_types.pop()
+        if i != last:
+            self.symbols[i] = last_symbol
+            self.stop_types[i] = last_type
+            self.index[last_symbol] = i
+            for arr in (
+                self.entry_prices,
+                self.stop_prices,
+                self.highest_prices,
+                self.trailing,
+            ):
+                arr[i] = arr[last]
+
+    def get(self, symbol: str) -> PositionStop:
+        """Return a snapshot of the stop for ``symbol``."""
+        i = self.index[symbol]
+        return PositionStop(
+            symbol=symbol,
+            entry_price=float(self.entry_prices[i]),
+            stop_price=float(self.stop_prices[i]),
+            highest_price=float(self.highest_prices[i]),
+            stop_type=self.stop_types[i],
+        )
+
+
 class RiskManager:
     """
     Manages stop-loss orders and portfolio risk controls.
@@ -111,13 +197,23 @@ class RiskManager:
         self.daily_start_value = initial_portfolio_value
         self.high_water_mark = initial_portfolio_value
 
-        # Track stops for each position
-        self.position_stops: dict[str, PositionStop] = {}
+        # Track stops for each position (see position_stops for a dict view)
+        self._stops = _StopBook()
 
         # Circuit breaker state
         self.circuit_breaker_triggered = False
         self.circuit_breaker_time: datetime | None = None
 
+    @property
+    def position_stops(self) -> dict[str, PositionStop]:
+        """
+        Snapshot of the active stops, keyed by symbol.
+
+        Stops live in NumPy arrays internally, so the returned PositionStop
+        objects are copies; modifying them does not change the stops.
+        """
+        return {symbol: self._stops.get(symbol) for symbol in self._stops.symbols}
+
     def add_position_stop(
         self,
         symbol: str,
@@ -158,13 +254,7 @@ class RiskManager:
             )
             stop_price = entry_price * (1 + stop_pct / 100)
 
-        self.position_stops[symbol] = PositionStop(
-            symbol=symbol,
-            entry_price=entry_price,
-            stop_price=stop_price,
-            highest_price=entry_price,
-            stop_type=stop_type,
-        )
+        self._stops.set(symbol, entry_price, stop_price, stop_type)
 
     def remove_position_stop(self, symbol: str) -> None:
         """
@@ -173,8 +263,7 @@ class RiskManager:
         Args:
             symbol: Asset symbol
         """
-        if symbol in self.position_stops:
-            del self.position_stops[symbol]
+        self._stops.remove(symbol)
 
     def check_stops(
         self,
@@ -185,6 +274,10 @@ class RiskManager:
         """
         Check all stop-loss conditions and generate exit orders if triggered.
 
+        Trailing-stop updates and trigger tests run as vectorized NumPy
+        operations over every priced position; only triggered positions are
+        handled in Python. Flat (zero-quantity) positions are skipped.
+
         Args:
             current_prices: Current market prices by symbol
             portfolio_value: Current total portfolio value
@@ -198,45 +291,193 @@ class RiskManager:
         # Check circuit breaker first
         if self._check_circuit_breaker(portfolio_value):
             # Circuit breaker triggered - exit all positions
-            return self._generate_exit_all_orders(positions, current_prices)
+            return self._generate_exit_all_orders(positions)
 
-        # Check individual position stops
+        # Gather priced, non-flat positions; auto-add stops where missing
+        stops = self._stops
+        symbols = []
         for symbol, position in positions.items():
-            if symbol not in current_prices:
-                continue  # Skip if no current price
-
-            if symbol not in self.position_stops:
-                # Auto-add stop for positions without explicit stop
+            if symbol not in current_prices or position.quantity == 0:
+                continue
+            if symbol not in stops:
                 self.add_position_stop(
                     symbol=symbol,
                     entry_price=position.average_cost,
                     quantity=position.quantity,
                 )
+            symbols.append(symbol)
 
-            current_price = current_prices[symbol]
-            stop = self.position_stops[symbol]
+        n = len(symbols)
+        if n == 0:
+            return exit_orders
 
-            # Update trailing stop if applicable
-            if stop.stop_type == StopType.TRAILING_PERCENT:
-                self._update_trailing_stop(stop, current_price, position.quantity)
+        index = stops.index
+        idx = np.fromiter((index[s] for s in symbols), dtype=np.intp, count=n)
+        px = np.fromiter(
+            (current_prices[s] for s in symbols), dtype=np.float64, count=n
+        )
+        long = np.fromiter(
+            (positions[s].quantity > 0 for s in symbols), dtype=bool, count=n
+        )
+        stop_prices = stops.stop_prices[idx]
+
+        # Ratchet trailing stops: longs follow new highs, shorts new lows
+        trailing = stops.trailing[idx]
+        if trailing.any():
+            highest = stops.highest_prices[idx]
+            pct = self.config.trailing_stop_pct / 100
+            new_high = trailing & long & (px > highest)
+            new_low = trailing & ~long & (px < highest)
+            moved = new_high | new_low
+            highest[moved] = px[moved]
+            stop_prices[new_high] = np.maximum(
+                stop_prices[new_high], px[new_high] * (1 - pct)
+            )
+            stop_prices[new_low] = np.minimum(
+                stop_prices[new_low], px[new_low] * (1 + pct)
+            )
+            stops.highest_prices[idx] = highest
+            stops.stop_prices[idx] = stop_prices
 
-            # Check if stop triggered
-            if self._is_stop_triggered(stop, current_price, position.quantity):
-                # Generate exit order
-                exit_order = Order(
+        triggered = np.where(long, px <= stop_prices, px >= stop_prices)
+
+        for i in np.flatnonzero(triggered):
+            symbol = symbols[i]
+            position = positions[symbol]
+            exit_orders.append(
+                Order(
                     symbol=symbol,
                     side=OrderSide.SELL if position.quantity > 0 else OrderSide.BUY,
                     quantity=abs(position.quantity),
                     order_type=OrderType.MARKET,
                     price=None,  # Market order
                 )
-                exit_orders.append(exit_order)
+            )
 
-                # Remove stop (will be re-added if position re-entered)
-                self.remove_position_stop(symbol)
+            # Remove stop (will be re-added if position re-entered)
+            self.remove_position_stop(symbol)
 
         return exit_orders
 
+    def check_circuit_breaker(
+        self, portfolio_value: float, positions: dict[str, Position]
+    ) -> list[Order]:
+        """
+        Check only the portfolio-level circuit breaker.
+
+        Use with check_symbol_stop() to run position stops inside a
+        per-symbol loop; together they cover what check_stops() does.
+
+        Args:
+            portfolio_value: Current total portfolio value
+            positions: Current positions from portfolio
+
+        Returns:
+            Exit orders for all positions if the breaker is triggered, else []
+        """
+        if self._check_circuit_breaker(portfolio_value):
+            return self._generate_exit_all_orders(positions)
+        return []
+
+    def check_circuit_breaker_batch(self, portfolio_values: np.ndarray) -> int | None:
+        """
+        Run the circuit breaker over a series of portfolio values at once.
+
+        Equivalent to calling check_circuit_breaker() for each value in turn
+        and stopping at the first trigger, but computes the running high
+        water mark with np.maximum.accumulate instead of a Python loop.
+        Updates high_water_mark and the triggered state the same way.
+
+        Args:
+            portfolio_values: Portfolio values in time order
+
+        Returns:
+            Index of the first value that trips the breaker, or None
+        """
+        if not self.config.enable_circuit_breaker:
+            return None
+        if self.circuit_breaker_triggered:
+            return 0
+
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        if values.size == 0:
+            return None
+        peaks = np.maximum(np.maximum.accumulate(values), self.high_water_mark)
+
+        daily_loss_pct = (
+            (self.daily_start_value - values) / self.daily_start_value * 100
+        )
+        drawdown_pct = (peaks - values) / peaks * 100
+        breached = (daily_loss_pct >= self.config.portfolio_stop_pct) | (
+            drawdown_pct >= self.config.max_drawdown_pct
+        )
+
+        if not breached.any():
+            self.high_water_mark = float(peaks[-1])
+            return None
+
+        first = int(breached.argmax())
+        self.high_water_mark = float(peaks[first])
+        self.circuit_breaker_triggered = True
+        self.circuit_breaker_time = datetime.now()
+        return first
+
+    def check_symbol_stop(
+        self, symbol: str, price: float, position: Position | None
+    ) -> Order | None:
+        """
+        Check the stop-loss for a single position.
+
+        Per-symbol equivalent of the position checks in check_stops(), for
+        loops that already visit each symbol: auto-adds a missing stop,
+        ratchets a trailing stop, and removes the stop when it triggers.
+        Does not check the circuit breaker (see check_circuit_breaker()).
+
+        Args:
+            symbol: Asset symbol
+            price: Current market price
+            position: Current position for symbol, or None if none is held
+
+        Returns:
+            Exit order if the stop triggered, else None
+        """
+        if position is None or position.quantity == 0:
+            return None
+
+        stops = self._stops
+        if symbol not in stops:
+            self.add_position_stop(
+                symbol=symbol,
+                entry_price=position.average_cost,
+                quantity=position.quantity,
+            )
+        i = stops.index[symbol]
+        long = position.quantity > 0
+        stop_price = stops.stop_prices[i]
+
+        # Ratchet trailing stop: longs follow new highs, shorts new lows
+        if stops.trailing[i]:
+            pct = self.config.trailing_stop_pct / 100
+            if long and price > stops.highest_prices[i]:
+                stops.highest_prices[i] = price
+                stop_price = max(stop_price, price * (1 - pct))
+            elif not long and price < stops.highest_prices[i]:
+                stops.highest_prices[i] = price
+                stop_price = min(stop_price, price * (1 + pct))
+            stops.stop_prices[i] = stop_price
+
+        if (price > stop_price) if long else (price < stop_price):
+            return None
+
+        self.remove_position_stop(symbol)
+        return Order(
+            symbol=symbol,
+            side=OrderSide.SELL if long else OrderSide.BUY,
+            quantity=abs(position.quantity),
+            order_type=OrderType.MARKET,
+            price=None,  # Market order
+        )
+
     def _check_circuit_breaker(self, portfolio_value: float) -> bool:
         """
         Check if portfolio-level circuit breaker should trigger.
@@ -277,58 +518,12 @@ class RiskManager:
 
         return False
 
-    def _update_trailing_stop(
-        self, stop: PositionStop, current_price: float, quantity: float
-    ) -> None:
-        """
-        Update trailing stop price if position is profitable.
-
-        Args:
-            stop: Position stop to update
-            current_price: Current market price
-            quantity: Position size
-        """
-        if quantity > 0:  # Long position
-            if current_price > stop.highest_price:
-                stop.highest_price = current_price
-                # Move stop up
-                new_stop = current_price * (1 - self.config.trailing_stop_pct / 100)
-                stop.stop_price = max(stop.stop_price, new_stop)
-        else:  # Short position
-            if current_price < stop.highest_price:
-                stop.highest_price = current_price
-                # Move stop down
-                new_stop = current_price * (1 + self.config.trailing_stop_pct / 100)
-                stop.stop_price = min(stop.stop_price, new_stop)
-
-    def _is_stop_triggered(
-        self, stop: PositionStop, current_price: float, quantity: float
-    ) -> bool:
-        """
-        Check if stop-loss is triggered.
-
-        Args:
-            stop: Position stop configuration
-            current_price: Current market price
-            quantity: Position size
-
-        Returns:
-            True if stop triggered
-        """
-        if quantity > 0:  # Long position
-            return current_price <= stop.stop_price
-        else:  # Short position
-            return current_price >= stop.stop_price
-
-    def _generate_exit_all_orders(
-        self, positions: dict[str, Position], current_prices: dict[str, float]
-    ) -> list[Order]:
+    def _generate_exit_all_orders(self, positions: dict[str, Position]) -> list[Order]:
         """
         Generate market orders to exit all positions (circuit breaker).
 
         Args:
             positions: All current positions
-            current_prices: Current market prices
 
         Returns:
             List of exit orders
@@ -381,7 +576,7 @@ class RiskManager:
         return {
             "circuit_breaker_triggered": self.circuit_breaker_triggered,
             "circuit_breaker_time": self.circuit_breaker_time,
-            "num_active_stops": len(self.position_stops),
+            "num_active_stops": len(self._stops),
             "high_water_mark": self.high_water_mark,
             "daily_start_value": self.daily_start_value,
             "config": {
@@ -398,6 +593,6 @@ class RiskManager:
         status = "TRIGGERED" if self.circuit_breaker_triggered else "ACTIVE"
         return (
             f"RiskManager(status={status}, "
-            f"active_stops={len(self.position_stops)}, "
+            f"active_stops={len(self._stops)}, "
             f"position_stop={self.config.position_stop_pct}%)"
         )
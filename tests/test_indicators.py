@@ -0,0 +1,45 @@
+"""
+Tests for the vectorized price-series helpers.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from AlpacaTrading import indicators
+from AlpacaTrading.indicators import moving_averages, simple_returns
+
+
+@pytest.fixture(params=["bottleneck", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "bottleneck":
+        pytest.importorskip("bottleneck")
+    else:
+        monkeypatch.setattr(indicators, "bn", None)
+    return request.param
+
+
+class TestMovingAverages:
+    def test_matches_pandas_rolling_mean(self, backend):
+        values = np.array([100.0 + (i * 7) % 11 - 0.25 * i for i in range(40)])
+
+        ma_3, ma_7, ma_50 = moving_averages(values, (3, 7, 50))
+
+        series = pd.Series(values)
+        np.testing.assert_allclose(ma_3, series.rolling(3).mean())
+        np.testing.assert_allclose(ma_7, series.rolling(7).mean())
+        assert np.isnan(ma_50).all()
+
+    def test_nan_input_matches_pandas(self, backend):
+        values = np.array([1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0])
+
+        (ma_2,) = moving_averages(values, (2,))
+
+        np.testing.assert_allclose(ma_2, pd.Series(values).rolling(2).mean())
+
+
+def test_simple_returns():
+    returns = simple_returns(np.array([100.0, 110.0, 99.0]))
+
+    assert np.isnan(returns[0])
+    np.testing.assert_allclose(returns[1:], [0.1, -0.1])
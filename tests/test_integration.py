@@ -9,8 +9,17 @@ from datetime import datetime
 from pathlib import Path
 import tempfile
 
-from AlpacaTrading.models import Order, OrderSide, OrderType, MarketDataPoint, Trade
+from AlpacaTrading.models import (
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    MarketDataPoint,
+    Trade,
+)
+from AlpacaTrading.data_loader import market_data_loader
 from AlpacaTrading.gateway.data_gateway import DataGateway
+from AlpacaTrading.gateway.order_gateway import OrderGateway
 from AlpacaTrading.trading.order_manager import OrderManager, RiskConfig
 from AlpacaTrading.trading.matching_engine import MatchingEngine
 from AlpacaTrading.trading.portfolio import TradingPortfolio
@@ -183,3 +192,129 @@ class TestDataGateway:
                 break
 
         assert tick_count == 10
+
+    def test_load_market_data_matches_stream(self, tmp_path):
+        """Test column-wise loading yields the same ticks as streaming."""
+        data_file = tmp_path / "ticks.csv"
+        data_file.write_text(
+            "timestamp,symbol,price,volume\n"
+            "2024-01-02T09:30:00,AAPL,150.25,100\n"
+            "2024-01-02T09:30:01,MSFT,310.5,200\n"
+            "2024-01-02T09:30:02,AAPL,150.3,50\n"
+        )
+        gateway = DataGateway(str(data_file))
+
+        market_data = gateway.load_market_data()
+
+        assert len(market_data) == 3
+        assert market_data.symbol_names == ("AAPL", "MSFT")
+        assert market_data.symbol_codes.tolist() == [0, 1, 0]
+        assert list(market_data) == list(gateway.stream())
+        assert market_data.view(1) == MarketDataPoint(
+            timestamp=datetime(2024, 1, 2, 9, 30, 1),
+            symbol="MSFT",
+            price=310.5,
+            volume=200.0,
+        )
+        assert list(gateway.load_market_data(max_rows=2)) == list(market_data)[:2]
+
+    def test_load_market_data_keeps_utc_offsets(self, tmp_path):
+        """Test tz-aware timestamps keep each row's offset, as in stream()."""
+        data_file = tmp_path / "ticks.csv"
+        data_file.write_text(
+            "timestamp,symbol,price,volume\n"
+            "2024-01-02T10:19:00-05:00,AAPL,150.25,100\n"
+            "2024-07-02T10:19:00-04:00,MSFT,310.5,200\n"
+            "2024-07-02T14:20:00+00:00,AAPL,150.3,50\n"
+        )
+        gateway = DataGateway(str(data_file))
+
+        market_data = gateway.load_market_data()
+
+        assert market_data.utc_offsets.tolist() == [-18000, -14400, 0]
+        assert list(market_data) == list(gateway.stream())
+        assert market_data.view(0).timestamp == datetime.fromisoformat(
+            "2024-01-02T10:19:00-05:00"
+        )
+        assert str(market_data.view(1).timestamp) == "2024-07-02 10:19:00-04:00"
+
+    def test_preloaded_data_replaces_file(self, tmp_path):
+        """Test a gateway given preloaded data streams it and tracks prices."""
+        data_file = tmp_path / "ticks.csv"
+        data_file.write_text(
+            "timestamp,symbol,price,volume\n"
+            "2024-01-02T09:30:00,AAPL,150.25,100\n"
+            "2024-01-02T09:30:01,AAPL,150.5,100\n"
+        )
+        market_data = DataGateway(str(data_file)).load_market_data()
+        data_file.write_text("timestamp,symbol,price,volume\n")
+
+        gateway = DataGateway(str(data_file), preloaded_data=market_data)
+
+        assert list(gateway.stream()) == list(market_data)
+        assert gateway.get_current_price("AAPL") == 150.5
+        assert gateway.load_market_data() is market_data
+
+
+class TestMarketDataLoader:
+    """Test loading market data into a sorted list of points."""
+
+    def test_loads_sorted_points_across_dst_change(self, tmp_path):
+        """Test offsets from both sides of a DST change parse and sort."""
+        data_file = tmp_path / "ticks.csv"
+        data_file.write_text(
+            "timestamp,symbol,price\n"
+            "2024-03-11T10:00:00-04:00,AAPL,100\n"
+            "2024-03-08T10:00:00-05:00,MSFT,200.5\n"
+            "2024-03-08T10:00:00-05:00,AAPL,101\n"
+        )
+
+        points = market_data_loader(str(data_file))
+
+        assert points == [
+            MarketDataPoint(
+                timestamp=datetime.fromisoformat(timestamp), symbol=symbol, price=price
+            )
+            for timestamp, symbol, price in [
+                ("2024-03-08T10:00:00-05:00", "MSFT", 200.5),
+                ("2024-03-08T10:00:00-05:00", "AAPL", 101.0),
+                ("2024-03-11T10:00:00-04:00", "AAPL", 100.0),
+            ]
+        ]
+        assert all(type(point.price) is float for point in points)
+        assert market_data_loader(str(data_file), max_rows=1) == points[2:]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file loads as no data."""
+        assert market_data_loader(str(tmp_path / "missing.csv")) == []
+
+
+class TestOrderGateway:
+    """Test order gateway logging."""
+
+    def test_background_log_matches_sync(self):
+        """Test background writer logs the same events as synchronous writes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sync_gateway = OrderGateway(f"{tmp_dir}/sync.csv")
+            background_gateway = OrderGateway(f"{tmp_dir}/bg.csv", background=True)
+
+            for gateway in (sync_gateway, background_gateway):
+                for i in range(50):
+                    order = Order(
+                        symbol="TEST",
+                        side=OrderSide.BUY,
+                        order_type=OrderType.LIMIT,
+                        quantity=10,
+                        price=100.0 + i,
+                    )
+                    gateway.log_order_sent(order)
+                    order.status = OrderStatus.FILLED
+                    gateway.log_order_filled(order)
+
+            assert background_gateway.get_fill_summary() == (
+                sync_gateway.get_fill_summary()
+            )
+            assert len(background_gateway.get_order_history()) == 100
+
+            background_gateway.close()
+            assert len(background_gateway.get_order_history()) == 100
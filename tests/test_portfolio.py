@@ -204,6 +204,15 @@ class TestGetTotalValue:
         # Cash: 85,000, Position value: 15,000, Unrealized P&L: 1,000
         assert portfolio.get_total_value() == 101_000
 
+    def test_total_value_cached_invalidated_by_price_update(self):
+        portfolio = TradingPortfolio(100_000)
+        portfolio.process_trade(create_trade("AAPL", OrderSide.BUY, 100, 150.0))
+        assert portfolio.get_total_value_cached(1) == 100_000
+
+        portfolio.update_prices({"AAPL": 160.0})
+        assert portfolio.get_total_value_cached(1) == 101_000
+        assert portfolio.get_total_value_cached(2) == 101_000
+
 
 class TestGetPosition:
     def test_get_position_exists(self):
@@ -457,6 +466,41 @@ class TestReset:
         assert portfolio.cash == initial
 
 
+class TestSaveLoadState:
+    def test_round_trip(self, tmp_path):
+        portfolio = TradingPortfolio(100_000)
+        portfolio.process_trade(create_trade("AAPL", OrderSide.BUY, 100, 150.0))
+        portfolio.process_trade(create_trade("AAPL", OrderSide.SELL, 40, 160.0))
+        portfolio.record_equity(datetime.now(), {"AAPL": 170.0})
+        state_file = tmp_path / "state" / "portfolio.json"
+        portfolio.save_state(state_file)
+
+        restored = TradingPortfolio(100_000)
+        assert restored.load_state(state_file)
+
+        assert restored.cash == portfolio.cash
+        assert restored.high_water_mark == portfolio.high_water_mark
+        position = restored.positions["AAPL"]
+        assert position.quantity == 60
+        assert position.average_cost == 150.0
+        assert position.realized_pnl == 400.0
+        assert list(tmp_path.joinpath("state").iterdir()) == [state_file]
+
+    def test_load_refuses_other_initial_cash(self, tmp_path):
+        state_file = tmp_path / "portfolio.json"
+        TradingPortfolio(100_000).save_state(state_file)
+
+        portfolio = TradingPortfolio(50_000)
+        with pytest.raises(ValueError, match="initial_cash"):
+            portfolio.load_state(state_file)
+        assert portfolio.cash == 50_000
+
+    def test_load_missing_file(self, tmp_path):
+        portfolio = TradingPortfolio(100_000)
+        assert not portfolio.load_state(tmp_path / "missing.json")
+        assert portfolio.cash == 100_000
+
+
 class TestRepr:
     def test_repr_initial_state(self):
         portfolio = TradingPortfolio(100_000)
@@ -13,6 +13,8 @@ import tempfile
 import csv
 import uuid
 
+import numpy as np
+
 from AlpacaTrading.trading import (
     TradingPortfolio,
     RiskManager,
@@ -183,6 +185,26 @@ class TestRiskManagerStopLoss(unittest.TestCase):
         self.assertEqual(exit_orders[0].side, OrderSide.SELL)
         self.assertEqual(exit_orders[0].quantity, 100)
 
+    def test_only_triggered_positions_exit(self):
+        """Test that a triggered stop leaves the other positions' stops intact."""
+        for symbol, price in [("AAPL", 150.0), ("MSFT", 300.0), ("NVDA", 100.0)]:
+            trade = create_trade(symbol, OrderSide.BUY, 10, price)
+            self.portfolio.process_trade(trade)
+            self.risk_manager.add_position_stop(symbol, price, 10)
+
+        # Only AAPL falls through its 5% stop
+        current_prices = {"AAPL": 140.0, "MSFT": 299.0, "NVDA": 101.0}
+        exit_orders = self.risk_manager.check_stops(
+            current_prices=current_prices,
+            portfolio_value=self.portfolio.get_total_value(),
+            positions=self.portfolio.positions,
+        )
+
+        self.assertEqual([order.symbol for order in exit_orders], ["AAPL"])
+        stops = self.risk_manager.position_stops
+        self.assertEqual(set(stops), {"MSFT", "NVDA"})
+        self.assertAlmostEqual(stops["NVDA"].stop_price, 100.0 * 0.95, places=2)
+
     def test_trailing_stop_moves_up(self):
         """Test that trailing stop moves up with profitable position."""
         config = StopLossConfig(
@@ -245,6 +267,30 @@ class TestRiskManagerStopLoss(unittest.TestCase):
         # Should trigger stop
         self.assertEqual(len(exit_orders), 1)
 
+    def test_check_symbol_stop_matches_check_stops(self):
+        """Test the per-symbol stop check follows the same trailing path."""
+        config = StopLossConfig(
+            trailing_stop_pct=7.0, use_trailing_stops=True, enable_circuit_breaker=False
+        )
+        bulk = RiskManager(config, 100_000)
+        single = RiskManager(config, 100_000)
+        self.portfolio.process_trade(create_trade("TSLA", OrderSide.BUY, 50, 200.0))
+        position = self.portfolio.positions["TSLA"]
+
+        for price in [210.0, 230.0, 220.0]:
+            bulk_orders = bulk.check_stops({"TSLA": price}, 100_000, {"TSLA": position})
+            self.assertEqual(bulk_orders, [])
+            self.assertIsNone(single.check_symbol_stop("TSLA", price, position))
+            self.assertAlmostEqual(
+                single.position_stops["TSLA"].stop_price,
+                bulk.position_stops["TSLA"].stop_price,
+            )
+
+        exit_order = single.check_symbol_stop("TSLA", 213.0, position)
+        self.assertEqual(exit_order.side, OrderSide.SELL)
+        self.assertEqual(exit_order.quantity, 50)
+        self.assertNotIn("TSLA", single.position_stops)
+
 
 class TestCircuitBreaker(unittest.TestCase):
     """Test circuit breaker functionality."""
@@ -333,6 +379,31 @@ class TestCircuitBreaker(unittest.TestCase):
         self.risk_manager.reset_circuit_breaker()
         self.assertFalse(self.risk_manager.circuit_breaker_triggered)
 
+    def test_circuit_breaker_batch_matches_sequential(self):
+        """Test the batch check trips at the same sample as per-value checks."""
+        values = [100_000, 103_000, 101_000, 99_000, 96_000, 92_000, 90_000]
+        sequential = RiskManager(self.config, initial_portfolio_value=100_000)
+        for first, value in enumerate(values):
+            sequential.check_circuit_breaker(value, {})
+            if sequential.circuit_breaker_triggered:
+                break
+
+        breach = self.risk_manager.check_circuit_breaker_batch(np.array(values))
+
+        self.assertEqual(breach, first)
+        self.assertTrue(self.risk_manager.circuit_breaker_triggered)
+        self.assertEqual(self.risk_manager.high_water_mark, sequential.high_water_mark)
+
+    def test_circuit_breaker_batch_no_breach(self):
+        """Test the batch check returns None and tracks the high water mark."""
+        breach = self.risk_manager.check_circuit_breaker_batch(
+            np.array([101_000, 104_000, 99_500])
+        )
+
+        self.assertIsNone(breach)
+        self.assertFalse(self.risk_manager.circuit_breaker_triggered)
+        self.assertEqual(self.risk_manager.high_water_mark, 104_000)
+
 
 class TestRiskManagerIntegration(unittest.TestCase):
     """Integration tests for RiskManager with portfolio."""
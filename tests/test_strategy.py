@@ -0,0 +1,94 @@
+"""
+Tests for trading strategies.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from AlpacaTrading.models import MarketDataPoint
+from AlpacaTrading.strategies.adaptive_portfolio import AdaptivePortfolioStrategy
+from AlpacaTrading.strategies.bollinger_bands import BollingerBandsStrategy
+from AlpacaTrading.strategies.mean_reversion import MovingAverageCrossoverStrategy
+from AlpacaTrading.strategies.price_window import PriceWindows, RollingWindow
+from AlpacaTrading.strategies.rsi_strategy import RSIStrategy
+from AlpacaTrading.trading.portfolio import TradingPortfolio
+
+
+def make_ticks(prices, symbol="TEST"):
+    return [
+        MarketDataPoint(timestamp=datetime.now(), symbol=symbol, price=p, volume=100)
+        for p in prices
+    ]
+
+
+class TestRollingWindow:
+    """Test the shared price window."""
+
+    def test_last_returns_latest_prices_in_order(self):
+        """Test last() after the ring buffer has wrapped around."""
+        window = RollingWindow(4)
+        for price in range(1, 11):
+            window.push(float(price))
+
+        assert len(window) == 4
+        assert window.last(4).tolist() == [7.0, 8.0, 9.0, 10.0]
+        assert window.last(2).tolist() == [9.0, 10.0]
+        assert window.last(10).tolist() == [7.0, 8.0, 9.0, 10.0]
+
+    def test_reserve_after_push_fails(self):
+        """Test windows can't grow once prices were recorded."""
+        windows = PriceWindows(5)
+        windows.reserve(10)
+        windows.push("TEST", 1.0)
+
+        assert len(windows.get("TEST").last(10)) == 1
+        with pytest.raises(ValueError):
+            windows.reserve(20)
+
+    def test_shared_windows_match_own_windows(self):
+        """Test sub-strategies compute the same indicators with shared windows."""
+        prices = [100.0 + (i * 13) % 17 - 0.1 * i for i in range(200)]
+
+        def make_strategies():
+            return {
+                "rsi": RSIStrategy(rsi_period=5, oversold_threshold=40),
+                "bb": BollingerBandsStrategy(period=10, num_std_dev=1.0),
+            }
+
+        standalone = make_strategies()
+        adaptive = AdaptivePortfolioStrategy(make_strategies())
+        portfolio = TradingPortfolio(initial_cash=100_000)
+        rsi, bb = adaptive.strategies["rsi"], adaptive.strategies["bb"]
+
+        assert rsi.price_windows is adaptive.shared_windows
+        assert bb.price_windows is adaptive.shared_windows
+        for tick in make_ticks(prices):
+            adaptive.on_market_data(tick, portfolio)
+            for strategy in standalone.values():
+                strategy.on_market_data(tick, portfolio)
+
+            assert rsi.rsi_values == standalone["rsi"].rsi_values
+            assert bb.upper_band == standalone["bb"].upper_band
+            assert bb.lower_band == standalone["bb"].lower_band
+
+
+class TestMovingAverageCrossover:
+    """Test MA crossover strategy."""
+
+    def test_running_averages_match_window_means(self):
+        """Test the incrementally updated MAs equal the plain window means."""
+        strategy = MovingAverageCrossoverStrategy(short_window=3, long_window=7)
+        portfolio = TradingPortfolio(initial_cash=100_000)
+        prices = [100.0 + (i * 7) % 11 - 0.25 * i for i in range(40)]
+
+        for i, price in enumerate(prices):
+            tick = MarketDataPoint(
+                timestamp=datetime.now(), symbol="TEST", price=price, volume=100
+            )
+            strategy.on_market_data(tick, portfolio)
+
+            if i + 1 >= strategy.long_window:
+                window = prices[i + 1 - strategy.long_window : i + 1]
+                assert strategy.long_ma["TEST"] == pytest.approx(sum(window) / 7)
+                assert strategy.short_ma["TEST"] == pytest.approx(sum(window[-3:]) / 3)